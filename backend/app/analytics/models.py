@@ -0,0 +1,68 @@
+import uuid
+from decimal import Decimal
+from datetime import date, datetime, timezone
+from sqlmodel import Field, Column, SQLModel
+from sqlalchemy.dialects import postgresql as pg
+from sqlalchemy import text, Date, Numeric, UniqueConstraint
+from sqlalchemy import Enum as SAEnum
+from backend.app.transaction.enums import TransactionTypeEnum, TransactionCategoryEnum
+
+
+class AccountDailyRollup(SQLModel, table=True):
+    """
+    Completed transactions per account, day, type and direction. The category is
+    from the account's side: the sender's row of a transfer is a debit and the
+    receiver's a credit, in the receiver's currency. Rows are upserted in the
+    same commit as the transaction, so summaries never scan transaction.
+    """
+
+    __tablename__ = "account_daily_rollup"
+    __table_args__ = (
+        UniqueConstraint(
+            "account_id",
+            "rollup_date",
+            "transaction_type",
+            "transaction_category",
+            name="uq_account_daily_rollup_key",
+        ),
+    )
+
+    id: uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            primary_key=True,
+        ),
+        default_factory=uuid.uuid4
+    )
+    account_id: uuid.UUID = Field(foreign_key="bankaccount.id", ondelete="CASCADE")
+    rollup_date: date = Field(sa_column=Column(Date, nullable=False))
+    transaction_type: TransactionTypeEnum = Field(
+        sa_column=Column(
+            SAEnum(
+                TransactionTypeEnum,
+                name="transaction_type_enum",
+                create_type=False
+            ),
+            nullable=False
+        )
+    )
+    transaction_category: TransactionCategoryEnum = Field(
+        sa_column=Column(
+            SAEnum(
+                TransactionCategoryEnum,
+                name="transaction_category_enum",
+                create_type=False
+            ),
+            nullable=False
+        )
+    )
+    total_amount: Decimal = Field(sa_column=Column(Numeric(18, 2), nullable=False))
+    transaction_count: int = Field(default=0)
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        )
+    )
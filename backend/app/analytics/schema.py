@@ -0,0 +1,29 @@
+from decimal import Decimal
+from datetime import date
+from sqlmodel import SQLModel
+from backend.app.transaction.enums import TransactionTypeEnum, TransactionCategoryEnum
+
+
+class MonthlySummarySchema(SQLModel):
+    month: date
+    currency: str
+    money_in: Decimal
+    money_out: Decimal
+    net: Decimal
+    count_in: int
+    count_out: int
+
+
+class CategoryBreakdownSchema(SQLModel):
+    currency: str
+    transaction_type: TransactionTypeEnum
+    transaction_category: TransactionCategoryEnum
+    total_amount: Decimal
+    transaction_count: int
+
+
+class SpendingTrendPointSchema(SQLModel):
+    day: date
+    currency: str
+    money_in: Decimal
+    money_out: Decimal
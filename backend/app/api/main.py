@@ -1,12 +1,13 @@
 from fastapi import APIRouter
 from backend.app.api.routes import home
-from backend.app.api.routes.auth import register, activate, login, password_reset, refresh, logout
+from backend.app.api.routes.auth import register, activate, login, password_reset, refresh, logout, hash_policy
 from backend.app.api.routes.profile import create, update, upload, me, all_profiles
 from backend.app.api.routes.next_of_kin import create as create_next_of_kin, all, update as update_next_of_kin, delete
 from backend.app.api.routes.bank_account import create as create_bank_account, delete as delete_bank_account, all as all_bank_accounts, activate as activate_bank_account, deposit
 from backend.app.api.routes.bank_account import transfer, withdrawal
 from backend.app.api.routes.bank_account import transaction_history
 from backend.app.api.routes.bank_account import statement
+from backend.app.api.routes.bank_account import name_enquiry
 from backend.app.api.routes.card import (
     create as create_card,
     activate as activate_card,
@@ -14,6 +15,24 @@ from backend.app.api.routes.card import (
     topup,
     delete as delete_card,
 )
+from backend.app.api.routes.fraud_review import queue as fraud_review_queue, claim as fraud_review_claim, resolve as fraud_review_resolve
+from backend.app.api.routes.scheduled_transfer import (
+    create as create_scheduled_transfer,
+    all as all_scheduled_transfers,
+    cancel as cancel_scheduled_transfer,
+)
+from backend.app.api.routes.analytics import (
+    monthly as analytics_monthly,
+    categories as analytics_categories,
+    trend as analytics_trend,
+)
+from backend.app.api.routes.reporting import (
+    accounts as report_accounts,
+    teller_deposits as report_teller_deposits,
+    transfer_volume as report_transfer_volume,
+    card_issuance as report_card_issuance,
+)
+from backend.app.api.routes.search import customers as customer_search
 
 api_router = APIRouter()
 api_router.include_router(home.router)
@@ -23,6 +42,7 @@ api_router.include_router(login.router)
 api_router.include_router(password_reset.router)
 api_router.include_router(refresh.router)
 api_router.include_router(logout.router)
+api_router.include_router(hash_policy.router)
 api_router.include_router(create.router)
 api_router.include_router(update.router)
 api_router.include_router(upload.router)
@@ -41,8 +61,23 @@ api_router.include_router(transfer.router)
 api_router.include_router(withdrawal.router)
 api_router.include_router(transaction_history.router)
 api_router.include_router(statement.router)
+api_router.include_router(name_enquiry.router)
 api_router.include_router(create_card.router)
 api_router.include_router(activate_card.router)
 api_router.include_router(block.router)
 api_router.include_router(topup.router)
-api_router.include_router(delete_card.router)
\ No newline at end of file
+api_router.include_router(delete_card.router)
+api_router.include_router(fraud_review_queue.router)
+api_router.include_router(fraud_review_claim.router)
+api_router.include_router(fraud_review_resolve.router)
+api_router.include_router(create_scheduled_transfer.router)
+api_router.include_router(all_scheduled_transfers.router)
+api_router.include_router(cancel_scheduled_transfer.router)
+api_router.include_router(analytics_monthly.router)
+api_router.include_router(analytics_categories.router)
+api_router.include_router(analytics_trend.router)
+api_router.include_router(report_accounts.router)
+api_router.include_router(report_teller_deposits.router)
+api_router.include_router(report_transfer_volume.router)
+api_router.include_router(report_card_issuance.router)
+api_router.include_router(customer_search.router)
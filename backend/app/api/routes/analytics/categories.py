@@ -0,0 +1,57 @@
+from datetime import date, datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.analytics.schema import CategoryBreakdownSchema
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.analytics import get_category_breakdown
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+@router.get(
+    "/categories",
+    response_model=list[CategoryBreakdownSchema],
+    status_code=status.HTTP_200_OK,
+    description="Totals per transaction type and direction for the current user's accounts, last 30 days by default.",
+)
+async def category_breakdown(
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+    start_date: date | None = Query(default=None, description="First day, inclusive"),
+    end_date: date | None = Query(default=None, description="Last day, inclusive"),
+    account_number: str | None = Query(default=None, description="Limit the breakdown to one of your accounts"),
+) -> list[CategoryBreakdownSchema]:
+    try:
+        end_date = end_date or datetime.now(timezone.utc).date()
+        start_date = start_date or end_date - timedelta(days=29)
+        if start_date > end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "status": "error",
+                    "message": "Invalid date range: start_date must be before end_date"
+                }
+            )
+
+        return await get_category_breakdown(
+            user_id=current_user.id,
+            session=session,
+            start_date=start_date,
+            end_date=end_date,
+            account_number=account_number,
+        )
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to build category breakdown for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to retrieve category breakdown",
+                "action": "Please try again later"
+            }
+        )
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.analytics.schema import MonthlySummarySchema
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.analytics import get_monthly_summary
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+@router.get(
+    "/monthly",
+    response_model=list[MonthlySummarySchema],
+    status_code=status.HTTP_200_OK,
+    description="Money in and out per month and currency for the current user's accounts.",
+)
+async def monthly_summary(
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+    months: int = Query(default=12, ge=1, le=60, description="Number of calendar months, including the current one"),
+    account_number: str | None = Query(default=None, description="Limit the summary to one of your accounts"),
+) -> list[MonthlySummarySchema]:
+    try:
+        return await get_monthly_summary(
+            user_id=current_user.id,
+            session=session,
+            months=months,
+            account_number=account_number,
+        )
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to build monthly summary for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to retrieve monthly summary",
+                "action": "Please try again later"
+            }
+        )
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.analytics.schema import SpendingTrendPointSchema
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.analytics import get_spending_trend
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+@router.get(
+    "/trend",
+    response_model=list[SpendingTrendPointSchema],
+    status_code=status.HTTP_200_OK,
+    description="Daily money in and out per currency for the current user's accounts.",
+)
+async def spending_trend(
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+    days: int = Query(default=30, ge=1, le=366, description="Number of days, including today"),
+    account_number: str | None = Query(default=None, description="Limit the trend to one of your accounts"),
+) -> list[SpendingTrendPointSchema]:
+    try:
+        return await get_spending_trend(
+            user_id=current_user.id,
+            session=session,
+            days=days,
+            account_number=account_number,
+        )
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to build spending trend for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to retrieve spending trend",
+                "action": "Please try again later"
+            }
+        )
@@ -41,6 +41,21 @@ async def get_current_user(
                 },
             )
         
+        session_id = payload.get("sid")
+        if session_id:
+            from backend.app.api.services.token_session import token_session_store
+
+            if await token_session_store.is_session_revoked(session_id):
+                logger.warning("Access token belongs to a revoked session.")
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail={
+                        "status": "error",
+                        "message": "Session has been revoked.",
+                        "action": "Please login again.",
+                    },
+                )
+
         from backend.app.api.services.user_auth import user_auth_service
 
         user = await user_auth_service.get_user_by_id(payload.get("id"), session)
@@ -59,6 +74,8 @@ async def get_current_user(
 
         return user
     
+    except HTTPException as http_ex:
+        raise http_ex
     except jwt.PyJWTError as e:
         logger.error(f"Error decoding JWT token: {e}")
         raise HTTPException(
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.auth.schema import RoleChoicesSchema
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.user_auth import user_auth_service
+
+logger = get_logger()
+
+router = APIRouter(prefix="/auth", tags=["auth"])
+
+@router.get(
+    "/hash-policy/status",
+    status_code=status.HTTP_200_OK,
+    description="Report how many password hashes are still on older Argon2 parameters. Only admins can perform this action.",
+)
+async def get_hash_policy_status(
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+) -> dict:
+    try:
+        if current_user.role not in (RoleChoicesSchema.ADMIN, RoleChoicesSchema.SUPER_ADMIN):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail={
+                    "status": "error",
+                    "message": "You are not authorized to view the hash policy status.",
+                },
+            )
+        population = await user_auth_service.get_password_hash_population(session)
+        logger.info(
+            f"Password hash population: {population['outdated_users']}/{population['total_users']} "
+            f"on outdated parameters"
+        )
+        return {
+            "status": "success",
+            "data": population,
+        }
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to compute hash policy status: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to compute hash policy status.",
+                "action": "Please try again later."
+            }
+        )
@@ -6,6 +6,7 @@ from backend.app.core.logging import get_logger
 from backend.app.core.config import settings
 from backend.app.auth.schema import LoginRequestSchema, OTPVerifyRequestSchema
 from backend.app.api.services.user_auth import user_auth_service
+from backend.app.api.services.token_session import token_session_store
 
 logger = get_logger()
 
@@ -21,8 +22,8 @@ async def request_login_otp(
         if user:
             await user_auth_service.check_user_lockout(user, session)
             if not await user_auth_service.verify_user_password(login_data.password, user.hashed_password):
-                await user_auth_service.increment_failed_login_attempts(user, session)
-                remaining_attempts = settings.LOGIN_ATTEMPTS - user.failed_login_attempts
+                failed_attempts = await user_auth_service.increment_failed_login_attempts(user, session)
+                remaining_attempts = settings.LOGIN_ATTEMPTS - failed_attempts
 
                 if remaining_attempts > 0:
                     error_message = (
@@ -53,6 +54,9 @@ async def request_login_otp(
                         "action": "Please activate your account.",
                     }
                 )
+            await user_auth_service.upgrade_password_hash_if_needed(
+                user, login_data.password, session
+            )
             await user_auth_service.reset_user_state(
                 user, session, clear_otp=True, log_action=True
             )
@@ -85,8 +89,11 @@ async def verify_login_otp(
 
         await user_auth_service.reset_user_state(user, session, clear_otp=True, log_action=True)
 
-        access_token = create_jwt_token(user.id, settings.COOKIE_ACCESS_NAME)
-        refresh_token = create_jwt_token(user.id, settings.COOKIE_REFRESH_NAME)
+        session_id, refresh_jti = await token_session_store.start_session(user.id)
+        access_token = create_jwt_token(user.id, settings.COOKIE_ACCESS_NAME, session_id=session_id)
+        refresh_token = create_jwt_token(
+            user.id, settings.COOKIE_REFRESH_NAME, session_id=session_id, jti=refresh_jti
+        )
 
         set_auth_cookies(response, access_token, refresh_token)
 
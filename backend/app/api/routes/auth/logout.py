@@ -1,14 +1,41 @@
-from fastapi import APIRouter, Response, status, HTTPException
+import jwt
+from fastapi import APIRouter, Response, status, HTTPException, Cookie
 from backend.app.auth.utils import delete_auth_cookies
+from backend.app.api.services.token_session import token_session_store
+from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
 
 logger = get_logger()
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+
+def _get_session_id(token: str | None) -> str | None:
+    if not token:
+        return None
+    try:
+        payload = jwt.decode(
+            token,
+            settings.SIGNING_KEY,
+            algorithms=[settings.JWT_ALGORITHM],
+            options={"verify_exp": False},
+        )
+        return payload.get("sid")
+    except jwt.InvalidTokenError:
+        return None
+
+
 @router.post("/logout", status_code=status.HTTP_200_OK)
-async def logout(response: Response) -> dict:
+async def logout(
+    response: Response,
+    access_token: str | None = Cookie(None, alias=settings.COOKIE_ACCESS_NAME),
+    refresh_token: str | None = Cookie(None, alias=settings.COOKIE_REFRESH_NAME),
+) -> dict:
     try:
+        session_id = _get_session_id(refresh_token) or _get_session_id(access_token)
+        if session_id:
+            await token_session_store.revoke_session(session_id)
+
         delete_auth_cookies(response)
         logger.info("User logged out successfully.")
         return {"message": "Successfully logged out."}
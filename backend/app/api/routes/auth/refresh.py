@@ -5,6 +5,7 @@ from backend.app.core.db import get_session
 from backend.app.core.logging import get_logger
 from backend.app.auth.utils import create_jwt_token, set_auth_cookies
 from backend.app.api.services.user_auth import user_auth_service
+from backend.app.api.services.token_session import token_session_store, RotationResultEnum
 from backend.app.core.config import settings
 
 
@@ -56,10 +57,31 @@ async def refresh_access_token(
         
         await user_auth_service.validate_user_status(user)
 
-        # Create a new access token
-        new_access_token = create_jwt_token(user.id)
+        session_id = payload.get("sid")
+        if session_id:
+            rotation, new_refresh_jti = await token_session_store.rotate_refresh(
+                session_id, payload.get("jti", "")
+            )
+            if rotation != RotationResultEnum.ROTATED:
+                logger.warning(f"Refresh rejected for user {user.email}: session {rotation.value}")
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED, detail={
+                        "status": "error",
+                        "message": "Session is no longer valid",
+                        "action": "Please log in again."
+                    }
+                )
+        else:
+            # Tokens issued before server-side sessions existed are moved onto one here
+            session_id, new_refresh_jti = await token_session_store.start_session(user.id)
+
+        # Rotate both tokens so every refresh token is single use
+        new_access_token = create_jwt_token(user.id, session_id=session_id)
+        new_refresh_token = create_jwt_token(
+            user.id, settings.COOKIE_REFRESH_NAME, session_id=session_id, jti=new_refresh_jti
+        )
 
-        set_auth_cookies(response, new_access_token)
+        set_auth_cookies(response, new_access_token, new_refresh_token)
 
         logger.info(f"Successfully refreshed access token for user: {user.email}")
 
@@ -80,6 +102,8 @@ async def refresh_access_token(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    except HTTPException as http_ex:
+        raise http_ex
     except Exception as e:
         logger.error(f"Failed to refresh access token: {e}")
         raise HTTPException(
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.core.logging import get_logger
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.core.db import get_session
+from backend.app.bank_account.schema import NameEnquiryResponseSchema
+from backend.app.api.services.recipient import name_enquiry
+
+logger = get_logger()
+
+router = APIRouter(prefix="/bank-account", tags=["Bank Account"])
+@router.get(
+    "/name-enquiry/{account_number}",
+    response_model=NameEnquiryResponseSchema,
+    status_code=status.HTTP_200_OK,
+    description="Look up the account name and currency of a transfer recipient before sending money.",
+)
+async def name_enquiry_route(
+    account_number: str,
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+) -> NameEnquiryResponseSchema:
+    try:
+        recipient = await name_enquiry(account_number=account_number, session=session)
+        return NameEnquiryResponseSchema(
+            account_number=recipient.account_number,
+            account_name=recipient.account_name,
+            account_currency=recipient.account_currency,
+        )
+
+    except HTTPException as http_ex:
+        raise http_ex
+
+    except Exception as e:
+        logger.error(f"Name enquiry failed for user {current_user.email}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to look up the account.",
+                "action": "Please try again later.",
+            },
+        )
@@ -8,7 +8,7 @@ from backend.app.transaction.schema import (
 from backend.app.api.routes.auth.dependency import CurrentUser
 from backend.app.core.logging import get_logger
 from backend.app.core.db import get_session
-from backend.app.api.services.transaction import get_user_transactions
+from backend.app.api.services.transaction import get_user_transactions, find_transaction_by_reference
 
 logger = get_logger()
 
@@ -95,4 +95,59 @@ async def get_transaction_history(
                 "message": "Failed to retrieve transaction history",
                 "action": "Please try again later"
             }
+        )
+
+
+@router.get(
+    "/{reference}",
+    response_model=TransactionHistoryResponseSchema,
+    status_code=status.HTTP_200_OK,
+    description="Get a single transaction of the authenticated user by reference, including archived ones"
+)
+async def get_transaction_by_reference(
+    reference: str,
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+) -> TransactionHistoryResponseSchema:
+    try:
+        txn = await find_transaction_by_reference(reference=reference, session=session)
+        if not txn or current_user.id not in (txn.sender_id, txn.receiver_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "status": "error",
+                    "message": "Transaction not found"
+                }
+            )
+
+        metadata = txn.transaction_metadata or {}
+        return TransactionHistoryResponseSchema(
+            id=txn.id,
+            reference=txn.reference,
+            amount=txn.amount,
+            description=txn.description,
+            transaction_type=txn.transaction_type,
+            transaction_category=txn.transaction_category,
+            transaction_status=txn.status,
+            created_at=txn.created_at,
+            completed_at=txn.completed_at,
+            balance_after=txn.balance_after,
+            account_currency=metadata.get("account_currency"),
+            converted_amount=metadata.get("converted_amount"),
+            from_currency=metadata.get("from_currency"),
+            to_currency=metadata.get("to_currency"),
+            counterparty_name=metadata.get("counterparty_name"),
+            counterparty_account=metadata.get("counterparty_account")
+        )
+    except HTTPException as httpex:
+        raise httpex
+    except Exception as e:
+        logger.error(f"Error fetching transaction {reference} for user {current_user.id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to retrieve transaction",
+                "action": "Please try again later"
+            }
         )
\ No newline at end of file
@@ -1,11 +1,8 @@
-from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from backend.app.core.db import get_session
 from backend.app.core.logging import get_logger
 from backend.app.api.routes.auth.dependency import CurrentUser
-from sqlmodel import select
-from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from backend.app.transaction.schema import (
     TransferRequestSchema,
@@ -15,29 +12,13 @@ from backend.app.transaction.schema import (
 from backend.app.core.services.transfer_otp import send_transfer_otp_email
 from backend.app.core.services.transfer_alert import send_transfer_alert_email
 from backend.app.api.services.transaction import initiate_transfer, complete_transfer
-from backend.app.transaction.models import IdempotencyKey
+from backend.app.api.services.idempotency import IdempotencyGuard, idempotency_guard, idempotency_store
 from backend.app.core.utils.number_format import format_currency
 
 logger = get_logger()
 router = APIRouter(prefix="/bank-account")
 
 
-def validate_uuid4(value: str) -> str:
-    try:
-        uuid_obj = UUID(value, version=4)
-        if str(uuid_obj) != value.lower():
-            raise ValueError("Not a valid UUID v4")
-        return value
-    except (ValueError, AttributeError, TypeError):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "status": "error",
-                "message": "Idempotency-key must be a valid UUID v4"
-            }
-        )
-
-
 @router.post(
     "/transfer/initiate",
     response_model=TransferResponseSchema,
@@ -47,40 +28,18 @@ async def initiate_money_transfer(
     transfer_data: TransferRequestSchema,
     current_user: CurrentUser,
     session: AsyncSession = Depends(get_session),
-    idempotency_key: str = Header(
-        description="Idempotency Key for the transfer request"
-    )
+    idempotency: IdempotencyGuard = Depends(idempotency_guard),
 ) -> TransferResponseSchema:
 
     try:
-        idempotency_key = validate_uuid4(idempotency_key)
-
-        if not idempotency_key:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "status": "error",
-                    "message": "Idempotency-key header is required"
-                }
-            )
-
-        existing_key_result = await session.exec(
-            select(IdempotencyKey).where(
-                IdempotencyKey.key == idempotency_key,
-                IdempotencyKey.user_id == current_user.id,
-                IdempotencyKey.endpoint == "/transfer/initiate",
-                IdempotencyKey.expires_at > datetime.now(timezone.utc)
-            )
-        )
-        existing_key = existing_key_result.first()
-        if existing_key:
+        if idempotency.cached_response is not None:
             return TransferResponseSchema(
                 status="success",
                 message="Retrieved from cache",
-                data=existing_key.response_body
+                data=idempotency.cached_response
             )
 
-        transaction, sender_account, receiver_account, sender, receiver = (
+        transaction, sender_account, receiver_account, sender, receiver, otp = (
             await initiate_transfer(
                 sender_id=current_user.id,
                 sender_account_id=transfer_data.sender_account_id,
@@ -92,7 +51,7 @@ async def initiate_money_transfer(
             )
         )
         try:
-            await send_transfer_otp_email(sender.email, sender.otp)
+            await send_transfer_otp_email(sender.email, otp)
         except Exception as e:
             logger.error(f"Failed to send OTP email: {e}")
         response = TransferResponseSchema(
@@ -115,16 +74,7 @@ async def initiate_money_transfer(
                 )
             }
         )
-        idempotency_record = IdempotencyKey(
-            key=idempotency_key,
-            user_id=current_user.id,
-            endpoint="/transfer/initiate",
-            response_code=status.HTTP_202_ACCEPTED,
-            response_body=response.model_dump(),
-            expires_at=datetime.now(timezone.utc) + timedelta(hours=24)
-        )
-        session.add(idempotency_record)
-        await session.commit()
+        await idempotency_store.save(idempotency, response.model_dump(), status.HTTP_202_ACCEPTED)
         return response
     except HTTPException as http_ex:
         raise http_ex
@@ -1,13 +1,11 @@
 from uuid import UUID
-from datetime import datetime, timezone, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status, Header
-from sqlmodel import select
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from backend.app.core.logging import get_logger
 from backend.app.api.routes.auth.dependency import CurrentUser
 from backend.app.core.db import get_session
 from backend.app.api.services.card import top_up_virtual_card
-from backend.app.transaction.models import IdempotencyKey
+from backend.app.api.services.idempotency import IdempotencyGuard, idempotency_guard, idempotency_store
 from backend.app.virtual_card.schema import TopUpResponseSchema, CardTopUpSchema
 
 
@@ -16,22 +14,6 @@ logger = get_logger()
 router = APIRouter(prefix="/virtual-card", tags=["Cards"])
 
 
-
-def validate_uuid4(value: str) -> str:
-    try:
-        uuid_obj = UUID(value, version=4)
-        if str(uuid_obj) != value.lower():
-            raise ValueError("Not a valid UUID v4")
-        return value
-    except (ValueError, AttributeError, TypeError):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "status": "error",
-                "message": "Idempotency-key must be a valid UUID v4"
-            }
-        )
-
 @router.post(
     "/{card_id}/top-up", response_model=TopUpResponseSchema,
     status_code=status.HTTP_200_OK,
@@ -42,34 +24,14 @@ async def top_up_card(
     top_up_data: CardTopUpSchema,
     current_user: CurrentUser,
     session: AsyncSession = Depends(get_session),
-    idempotency_key: str = Header(
-        description="Idempotency Key for the top-up request"
-    )
+    idempotency: IdempotencyGuard = Depends(idempotency_guard),
 ) -> TopUpResponseSchema:
     try:
-        idempotency_key = validate_uuid4(idempotency_key)
-        if not idempotency_key:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "status": "error",
-                    "message": "Idempotency-key is required"
-                }
-            )
-        existing_key = await session.exec(
-            select(IdempotencyKey).where(
-                IdempotencyKey.key == idempotency_key,
-                IdempotencyKey.user_id == current_user.id,
-                IdempotencyKey.endpoint == f"/virtual-card/{card_id}/top-up",
-                IdempotencyKey.expires_at > datetime.now(timezone.utc)
-            )
-        )
-        existing_key = existing_key.first()
-        if existing_key:
+        if idempotency.cached_response is not None:
             return TopUpResponseSchema(
                 status="success",
                 message="Retrieved from cache",
-                data=existing_key.response_body
+                data=idempotency.cached_response
                 )
 
         card, transaction = await top_up_virtual_card(
@@ -90,16 +52,7 @@ async def top_up_card(
                 "reference": transaction.reference,
             }
         )
-        new_key = IdempotencyKey(
-            key=idempotency_key,
-            user_id=current_user.id,
-            endpoint=f"/virtual-card/{card_id}/top-up",
-            response_code=status.HTTP_200_OK,
-            response_body=response.model_dump(),
-            expires_at=datetime.now(timezone.utc) + timedelta(hours=24)  # Set expiration time for the idempotency key
-        )
-        session.add(new_key)
-        await session.commit()
+        await idempotency_store.save(idempotency, response.model_dump(), status.HTTP_200_OK)
 
         return response
     
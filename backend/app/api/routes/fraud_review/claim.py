@@ -0,0 +1,95 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.fraud_review import (
+    ensure_fraud_reviewer,
+    claim_review_items,
+    release_review_items,
+)
+from backend.app.core.ai.config import ai_settings
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.transaction.schema import FraudReviewClaimSchema, FraudReviewReleaseSchema
+
+logger = get_logger()
+
+router = APIRouter(prefix="/fraud-review", tags=["Fraud Review"])
+
+@router.post(
+    "/claim",
+    status_code=status.HTTP_200_OK,
+    description="Claim the next unclaimed high-risk transactions for review. Claims lapse after a while if not resolved.",
+)
+async def claim_flagged_transactions(
+    claim_data: FraudReviewClaimSchema,
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+):
+    try:
+        ensure_fraud_reviewer(current_user)
+
+        claimed_ids = await claim_review_items(
+            session=session,
+            reviewer_id=current_user.id,
+            limit=claim_data.limit,
+            min_risk_score=claim_data.min_risk_score,
+        )
+        return {
+            "status": "success",
+            "message": f"Claimed {len(claimed_ids)} transactions for review",
+            "data": {
+                "risk_score_ids": [str(risk_score_id) for risk_score_id in claimed_ids],
+                "claim_expires_in_minutes": ai_settings.REVIEW_CLAIM_MINUTES,
+            }
+        }
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to claim flagged transactions: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to claim flagged transactions",
+                "action": "Please try again later"
+            }
+        )
+
+
+@router.post(
+    "/release",
+    status_code=status.HTTP_200_OK,
+    description="Hand claimed transactions back to the queue without reviewing them.",
+)
+async def release_flagged_transactions(
+    release_data: FraudReviewReleaseSchema,
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+):
+    try:
+        ensure_fraud_reviewer(current_user)
+
+        released_ids = await release_review_items(
+            session=session,
+            reviewer_id=current_user.id,
+            risk_score_ids=release_data.risk_score_ids,
+        )
+        return {
+            "status": "success",
+            "message": f"Released {len(released_ids)} transactions",
+            "data": {
+                "risk_score_ids": [str(risk_score_id) for risk_score_id in released_ids],
+            }
+        }
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to release flagged transactions: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to release flagged transactions",
+                "action": "Please try again later"
+            }
+        )
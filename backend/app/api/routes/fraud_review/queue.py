@@ -0,0 +1,52 @@
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.fraud_review import ensure_fraud_reviewer, get_review_queue
+from backend.app.core.ai.config import ai_settings
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.transaction.schema import FraudReviewQueueResponseSchema
+
+logger = get_logger()
+
+router = APIRouter(prefix="/fraud-review", tags=["Fraud Review"])
+
+@router.get(
+    "/queue",
+    response_model=FraudReviewQueueResponseSchema,
+    status_code=status.HTTP_200_OK,
+    description="List unreviewed high-risk transactions, highest risk first. Pass next_cursor to get the following page.",
+)
+async def list_review_queue(
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+    limit: int = Query(default=20, ge=1, le=ai_settings.REVIEW_QUEUE_MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description="next_cursor from the previous page"),
+    min_risk_score: float | None = Query(default=None, ge=0, le=1),
+    claimed: Literal["all", "mine", "unclaimed"] = Query(default="all"),
+) -> FraudReviewQueueResponseSchema:
+    try:
+        ensure_fraud_reviewer(current_user)
+
+        items, next_cursor = await get_review_queue(
+            session=session,
+            reviewer_id=current_user.id,
+            limit=limit,
+            cursor=cursor,
+            min_risk_score=min_risk_score,
+            claimed=claimed,
+        )
+        return FraudReviewQueueResponseSchema(items=items, limit=limit, next_cursor=next_cursor)
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to fetch fraud review queue: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to fetch fraud review queue",
+                "action": "Please try again later"
+            }
+        )
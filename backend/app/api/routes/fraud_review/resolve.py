@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.fraud_review import ensure_fraud_reviewer, resolve_review_items
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.transaction.schema import FraudReviewBulkResolveSchema
+
+logger = get_logger()
+
+router = APIRouter(prefix="/fraud-review", tags=["Fraud Review"])
+
+@router.post(
+    "/resolve",
+    status_code=status.HTTP_200_OK,
+    description="Confirm or clear a batch of claimed transactions. Items not currently claimed by you are skipped.",
+)
+async def resolve_flagged_transactions(
+    resolve_data: FraudReviewBulkResolveSchema,
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+):
+    try:
+        ensure_fraud_reviewer(current_user)
+
+        resolved_ids, skipped_ids = await resolve_review_items(
+            session=session,
+            reviewer_id=current_user.id,
+            risk_score_ids=resolve_data.risk_score_ids,
+            is_fraud=resolve_data.is_fraud,
+            notes=resolve_data.notes,
+        )
+        return {
+            "status": "success",
+            "message": (
+                f"{len(resolved_ids)} transactions marked as "
+                f"{'confirmed fraud' if resolve_data.is_fraud else 'cleared'}"
+            ),
+            "data": {
+                "resolved": [str(risk_score_id) for risk_score_id in resolved_ids],
+                "skipped": [str(risk_score_id) for risk_score_id in skipped_ids],
+            }
+        }
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to resolve flagged transactions: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to resolve flagged transactions",
+                "action": "Please try again later"
+            }
+        )
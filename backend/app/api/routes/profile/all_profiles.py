@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.auth.schema import AccountStatusSchema, RoleChoicesSchema
+from backend.app.user_profile.enums import KycStatusEnum
 from backend.app.user_profile.schema import PaginatedProfileResponseSchema, ProfileResponseSchema
 from backend.app.core.logging import get_logger
 from backend.app.core.db import get_session
@@ -13,30 +15,42 @@ router = APIRouter(prefix="/profile")
 async def list_user_profile(
     current_user: CurrentUser,
     session: AsyncSession = Depends(get_session),
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=20, ge=1),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="next_cursor from the previous page"),
+    role: RoleChoicesSchema | None = Query(default=None),
+    account_status: AccountStatusSchema | None = Query(default=None),
+    kyc_status: KycStatusEnum | None = Query(default=None),
 ) -> PaginatedProfileResponseSchema:
     try:
-        users, total_count = await get_all_user_profiles(session=session, current_user=current_user, skip=skip, limit=limit)
+        rows, next_cursor, total_count, total_is_estimate = await get_all_user_profiles(
+            session=session,
+            current_user=current_user,
+            limit=limit,
+            cursor=cursor,
+            role=role,
+            account_status=account_status,
+            kyc_status=kyc_status,
+        )
 
         profile_responses = [
             ProfileResponseSchema(
-                username=user.username or "",
-                first_name=user.first_name or "",
-                last_name=user.last_name or "",
-                middle_name=user.middle_name or "",
-                email=user.email or "",
-                id_no=str(user.id_no) if user.id_no else "",
-                role=user.role,
-                profile=user.profile,
-            ) for user in users
+                username=row.username or "",
+                first_name=row.first_name or "",
+                last_name=row.last_name or "",
+                middle_name=row.middle_name or "",
+                email=row.email or "",
+                id_no=str(row.id_no) if row.id_no else "",
+                role=row.role,
+                profile=row.Profile,
+            ) for row in rows
         ]
 
         return PaginatedProfileResponseSchema(
             profiles=profile_responses, 
             total=total_count,
-            skip=skip,
-            limit=limit
+            total_is_estimate=total_is_estimate,
+            limit=limit,
+            next_cursor=next_cursor,
         )
     except HTTPException as httpex:
         raise httpex
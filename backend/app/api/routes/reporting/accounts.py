@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.reporting import ensure_report_viewer, get_active_accounts_report
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.reporting.schema import ActiveAccountsReportSchema
+
+logger = get_logger()
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+@router.get(
+    "/accounts",
+    response_model=list[ActiveAccountsReportSchema],
+    status_code=status.HTTP_200_OK,
+    description="Bank accounts by type, currency and status, with KYC and balance totals. Branch managers only.",
+)
+async def active_accounts_report(
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+) -> list[ActiveAccountsReportSchema]:
+    try:
+        ensure_report_viewer(current_user)
+        return await get_active_accounts_report(session=session)
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to build accounts report for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to retrieve accounts report",
+                "action": "Please try again later"
+            }
+        )
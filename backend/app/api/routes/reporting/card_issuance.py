@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+from dateutil.relativedelta import relativedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.reporting import ensure_report_viewer, get_card_issuance_report
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.reporting.schema import CardIssuanceReportSchema
+
+logger = get_logger()
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+@router.get(
+    "/card-issuance",
+    response_model=list[CardIssuanceReportSchema],
+    status_code=status.HTTP_200_OK,
+    description="Virtual cards issued per month by type, provider, currency and status. Branch managers only.",
+)
+async def card_issuance_report(
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+    months: int = Query(default=12, ge=1, le=60, description="Number of calendar months, including the current one"),
+) -> list[CardIssuanceReportSchema]:
+    try:
+        ensure_report_viewer(current_user)
+        start_month = datetime.now(timezone.utc).date().replace(day=1) - relativedelta(months=months - 1)
+        return await get_card_issuance_report(session=session, start_month=start_month)
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to build card issuance report for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to retrieve card issuance report",
+                "action": "Please try again later"
+            }
+        )
@@ -0,0 +1,50 @@
+from datetime import date, datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.reporting import ensure_report_viewer, get_transfer_volume_report
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.reporting.schema import TransferVolumeReportSchema
+
+logger = get_logger()
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+@router.get(
+    "/transfer-volume",
+    response_model=list[TransferVolumeReportSchema],
+    status_code=status.HTTP_200_OK,
+    description="Daily transfer count and volume per sending currency, last 30 days by default. Branch managers only.",
+)
+async def transfer_volume_report(
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+    start_date: date | None = Query(default=None, description="First day, inclusive"),
+    end_date: date | None = Query(default=None, description="Last day, inclusive"),
+) -> list[TransferVolumeReportSchema]:
+    try:
+        ensure_report_viewer(current_user)
+        end_date = end_date or datetime.now(timezone.utc).date()
+        start_date = start_date or end_date - timedelta(days=29)
+        if start_date > end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "status": "error",
+                    "message": "Invalid date range: start_date must be before end_date"
+                }
+            )
+        return await get_transfer_volume_report(session=session, start_date=start_date, end_date=end_date)
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to build transfer volume report for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to retrieve transfer volume report",
+                "action": "Please try again later"
+            }
+        )
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.scheduled_transfer import get_user_scheduled_transfers
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.scheduled_transfer.schema import ScheduledTransferReadSchema
+
+logger = get_logger()
+
+router = APIRouter(prefix="/scheduled-transfer", tags=["Scheduled Transfers"])
+
+@router.get(
+    "/all",
+    response_model=list[ScheduledTransferReadSchema],
+    status_code=status.HTTP_200_OK,
+    description="List the current user's scheduled transfers, newest first.",
+)
+async def list_standing_orders(
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+) -> list[ScheduledTransferReadSchema]:
+    try:
+        schedules = await get_user_scheduled_transfers(user_id=current_user.id, session=session)
+        return [ScheduledTransferReadSchema.model_validate(schedule) for schedule in schedules]
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to list scheduled transfers for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to retrieve scheduled transfers",
+                "action": "Please try again later"
+            }
+        )
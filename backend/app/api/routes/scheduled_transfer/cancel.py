@@ -0,0 +1,43 @@
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.scheduled_transfer import cancel_scheduled_transfer
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.scheduled_transfer.schema import ScheduledTransferReadSchema
+
+logger = get_logger()
+
+router = APIRouter(prefix="/scheduled-transfer", tags=["Scheduled Transfers"])
+
+@router.patch(
+    "/{schedule_id}/cancel",
+    response_model=ScheduledTransferReadSchema,
+    status_code=status.HTTP_200_OK,
+    description="Cancel a scheduled transfer. Occurrences already running are not affected.",
+)
+async def cancel_standing_order(
+    schedule_id: uuid.UUID,
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+) -> ScheduledTransferReadSchema:
+    try:
+        schedule = await cancel_scheduled_transfer(
+            user_id=current_user.id,
+            schedule_id=schedule_id,
+            session=session,
+        )
+        return ScheduledTransferReadSchema.model_validate(schedule)
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to cancel scheduled transfer {schedule_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to cancel scheduled transfer",
+                "action": "Please try again later"
+            }
+        )
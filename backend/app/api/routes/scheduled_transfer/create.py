@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.scheduled_transfer import create_scheduled_transfer
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.scheduled_transfer.schema import ScheduledTransferCreateSchema, ScheduledTransferReadSchema
+
+logger = get_logger()
+
+router = APIRouter(prefix="/scheduled-transfer", tags=["Scheduled Transfers"])
+
+@router.post(
+    "/create",
+    response_model=ScheduledTransferReadSchema,
+    status_code=status.HTTP_201_CREATED,
+    description="Schedule a one-off or recurring transfer. The security answer authorizes every run of the schedule.",
+)
+async def create_standing_order(
+    schedule_data: ScheduledTransferCreateSchema,
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+) -> ScheduledTransferReadSchema:
+    try:
+        schedule = await create_scheduled_transfer(
+            user_id=current_user.id,
+            schedule_data=schedule_data,
+            session=session,
+        )
+        return ScheduledTransferReadSchema.model_validate(schedule)
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to create scheduled transfer for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to create scheduled transfer",
+                "action": "Please try again later"
+            }
+        )
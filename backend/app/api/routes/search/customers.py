@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.api.services.search import ensure_customer_searcher, search_customers
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.search.schema import CustomerSearchResponseSchema
+
+logger = get_logger()
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+@router.get(
+    "",
+    response_model=CustomerSearchResponseSchema,
+    status_code=status.HTTP_200_OK,
+    description="Ranked customer search by name, email, username, phone or account number. Staff only.",
+)
+async def customer_search(
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+    q: str = Query(min_length=2, max_length=100, description="Name, email, username, phone or account number"),
+    limit: int = Query(default=20, ge=1, le=50),
+    offset: int = Query(default=0, ge=0, le=200, description="Ranked results past the first few pages are rarely useful"),
+) -> CustomerSearchResponseSchema:
+    try:
+        ensure_customer_searcher(current_user)
+        results, has_more = await search_customers(session=session, query=q, limit=limit, offset=offset)
+        return CustomerSearchResponseSchema(results=results, limit=limit, offset=offset, has_more=has_more)
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Customer search failed for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to search customers",
+                "action": "Please try again later"
+            }
+        )
@@ -0,0 +1,213 @@
+import uuid
+from decimal import Decimal
+from datetime import date, datetime, timezone, timedelta
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import case, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.analytics.models import AccountDailyRollup
+from backend.app.analytics.schema import (
+    MonthlySummarySchema,
+    CategoryBreakdownSchema,
+    SpendingTrendPointSchema,
+)
+from backend.app.bank_account.models import BankAccount
+from backend.app.transaction.enums import TransactionCategoryEnum
+from backend.app.transaction.models import Transaction
+
+
+async def _upsert_rollup(
+        session: AsyncSession,
+        *,
+        account_id: uuid.UUID,
+        rollup_date: date,
+        transaction: Transaction,
+        category: TransactionCategoryEnum,
+        amount: Decimal,
+) -> None:
+    statement = insert(AccountDailyRollup).values(
+        id=uuid.uuid4(),
+        account_id=account_id,
+        rollup_date=rollup_date,
+        transaction_type=transaction.transaction_type,
+        transaction_category=category,
+        total_amount=amount,
+        transaction_count=1,
+    )
+    statement = statement.on_conflict_do_update(
+        constraint="uq_account_daily_rollup_key",
+        set_={
+            "total_amount": AccountDailyRollup.total_amount + statement.excluded.total_amount,
+            "transaction_count": AccountDailyRollup.transaction_count + 1,
+            "updated_at": func.now(),
+        },
+    )
+    await session.execute(statement)
+
+
+async def record_transaction_rollups(session: AsyncSession, *, transaction: Transaction) -> None:
+    """
+    Add a completed transaction to its accounts' daily rollups. Runs inside the
+    caller's transaction, so the rollup commits or rolls back with it.
+    """
+    completed_at = transaction.completed_at or datetime.now(timezone.utc)
+    rollup_date = completed_at.astimezone(timezone.utc).date()
+
+    if transaction.sender_account_id:
+        await _upsert_rollup(
+            session,
+            account_id=transaction.sender_account_id,
+            rollup_date=rollup_date,
+            transaction=transaction,
+            category=TransactionCategoryEnum.DEBIT,
+            amount=transaction.amount,
+        )
+    if transaction.receiver_account_id:
+        converted_amount = (transaction.transaction_metadata or {}).get("converted_amount")
+        await _upsert_rollup(
+            session,
+            account_id=transaction.receiver_account_id,
+            rollup_date=rollup_date,
+            transaction=transaction,
+            category=TransactionCategoryEnum.CREDIT,
+            amount=Decimal(converted_amount) if converted_amount else transaction.amount,
+        )
+
+
+def _credited(column):
+    return func.coalesce(
+        func.sum(case((AccountDailyRollup.transaction_category == TransactionCategoryEnum.CREDIT, column), else_=0)),
+        0,
+    )
+
+
+def _debited(column):
+    return func.coalesce(
+        func.sum(case((AccountDailyRollup.transaction_category == TransactionCategoryEnum.DEBIT, column), else_=0)),
+        0,
+    )
+
+
+def _user_rollups(statement, user_id: uuid.UUID, account_number: str | None):
+    statement = statement.join(BankAccount, BankAccount.id == AccountDailyRollup.account_id).where(
+        BankAccount.user_id == user_id
+    )
+    if account_number:
+        statement = statement.where(BankAccount.account_number == account_number)
+    return statement
+
+
+async def get_monthly_summary(
+        *,
+        user_id: uuid.UUID,
+        session: AsyncSession,
+        months: int = 12,
+        account_number: str | None = None,
+) -> list[MonthlySummarySchema]:
+    """Money in and out per calendar month and currency, oldest month first."""
+    since = datetime.now(timezone.utc).date().replace(day=1) - relativedelta(months=months - 1)
+    month = func.date_trunc("month", AccountDailyRollup.rollup_date).label("month")
+
+    statement = _user_rollups(
+        select(
+            month,
+            BankAccount.account_currency,
+            _credited(AccountDailyRollup.total_amount).label("money_in"),
+            _debited(AccountDailyRollup.total_amount).label("money_out"),
+            _credited(AccountDailyRollup.transaction_count).label("count_in"),
+            _debited(AccountDailyRollup.transaction_count).label("count_out"),
+        ).where(AccountDailyRollup.rollup_date >= since),
+        user_id,
+        account_number,
+    ).group_by(month, BankAccount.account_currency).order_by(month, BankAccount.account_currency)
+
+    result = await session.exec(statement)
+    return [
+        MonthlySummarySchema(
+            month=row.month.date(),
+            currency=row.account_currency.value,
+            money_in=row.money_in,
+            money_out=row.money_out,
+            net=row.money_in - row.money_out,
+            count_in=row.count_in,
+            count_out=row.count_out,
+        )
+        for row in result.all()
+    ]
+
+
+async def get_category_breakdown(
+        *,
+        user_id: uuid.UUID,
+        session: AsyncSession,
+        start_date: date,
+        end_date: date,
+        account_number: str | None = None,
+) -> list[CategoryBreakdownSchema]:
+    """Totals per currency, transaction type and direction between two dates, inclusive."""
+    statement = _user_rollups(
+        select(
+            BankAccount.account_currency,
+            AccountDailyRollup.transaction_type,
+            AccountDailyRollup.transaction_category,
+            func.sum(AccountDailyRollup.total_amount).label("total_amount"),
+            func.sum(AccountDailyRollup.transaction_count).label("transaction_count"),
+        ).where(
+            AccountDailyRollup.rollup_date >= start_date,
+            AccountDailyRollup.rollup_date <= end_date,
+        ),
+        user_id,
+        account_number,
+    ).group_by(
+        BankAccount.account_currency,
+        AccountDailyRollup.transaction_type,
+        AccountDailyRollup.transaction_category,
+    ).order_by(BankAccount.account_currency, func.sum(AccountDailyRollup.total_amount).desc())
+
+    result = await session.exec(statement)
+    return [
+        CategoryBreakdownSchema(
+            currency=row.account_currency.value,
+            transaction_type=row.transaction_type,
+            transaction_category=row.transaction_category,
+            total_amount=row.total_amount,
+            transaction_count=row.transaction_count,
+        )
+        for row in result.all()
+    ]
+
+
+async def get_spending_trend(
+        *,
+        user_id: uuid.UUID,
+        session: AsyncSession,
+        days: int = 30,
+        account_number: str | None = None,
+) -> list[SpendingTrendPointSchema]:
+    """Daily money in and out per currency over the last `days` days; days without activity are omitted."""
+    since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+
+    statement = _user_rollups(
+        select(
+            AccountDailyRollup.rollup_date,
+            BankAccount.account_currency,
+            _credited(AccountDailyRollup.total_amount).label("money_in"),
+            _debited(AccountDailyRollup.total_amount).label("money_out"),
+        ).where(AccountDailyRollup.rollup_date >= since),
+        user_id,
+        account_number,
+    ).group_by(AccountDailyRollup.rollup_date, BankAccount.account_currency).order_by(
+        AccountDailyRollup.rollup_date, BankAccount.account_currency
+    )
+
+    result = await session.exec(statement)
+    return [
+        SpendingTrendPointSchema(
+            day=row.rollup_date,
+            currency=row.account_currency.value,
+            money_in=row.money_in,
+            money_out=row.money_out,
+        )
+        for row in result.all()
+    ]
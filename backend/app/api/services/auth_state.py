@@ -0,0 +1,83 @@
+import hashlib
+import hmac
+import uuid
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis_client import get_redis
+
+logger = get_logger()
+
+# Compare-and-delete so a correct OTP can only be redeemed once.
+# Returns 1 on match, 0 on mismatch and -1 when no OTP is stored (never issued or expired).
+_REDEEM_OTP_SCRIPT = """
+local stored = redis.call('GET', KEYS[1])
+if not stored then
+    return -1
+end
+if stored == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+return 0
+"""
+
+
+class AuthStateStore:
+    """Ephemeral authentication state (OTPs and failed login counters) kept in Redis.
+
+    The user row is only written when an account is actually locked or unlocked.
+    """
+
+    def _otp_key(self, user_id: uuid.UUID, purpose: str) -> str:
+        return f"auth:otp:{purpose}:{user_id}"
+
+    def _failed_login_key(self, user_id: uuid.UUID) -> str:
+        return f"auth:failed_login:{user_id}"
+
+    def hash_otp(self, otp: str) -> str:
+        return hmac.new(
+            settings.SIGNING_KEY.encode(), otp.encode(), hashlib.sha256
+        ).hexdigest()
+
+    async def store_otp(
+            self, user_id: uuid.UUID,
+            otp: str,
+            purpose: str = "login",
+            ttl_seconds: int | None = None,
+    ) -> None:
+        ttl = ttl_seconds or settings.OTP_EXPIRATION_MINUTES * 60
+        await get_redis().set(self._otp_key(user_id, purpose), self.hash_otp(otp), ex=ttl)
+
+    async def redeem_otp(
+            self, user_id: uuid.UUID,
+            otp: str,
+            purpose: str = "login",
+    ) -> bool | None:
+        """Returns True on match, False on mismatch and None if there is no live OTP."""
+        result = await get_redis().eval(
+            _REDEEM_OTP_SCRIPT, 1, self._otp_key(user_id, purpose), self.hash_otp(otp)
+        )
+        if int(result) == -1:
+            return None
+        return int(result) == 1
+
+    async def clear_otp(self, user_id: uuid.UUID, purpose: str = "login") -> None:
+        await get_redis().delete(self._otp_key(user_id, purpose))
+
+    async def record_failed_login(self, user_id: uuid.UUID) -> int:
+        key = self._failed_login_key(user_id)
+        pipe = get_redis().pipeline(transaction=True)
+        pipe.incr(key)
+        pipe.expire(key, settings.FAILED_LOGIN_WINDOW_MINUTES * 60, nx=True)
+        count, _ = await pipe.execute()
+        return int(count)
+
+    async def get_failed_logins(self, user_id: uuid.UUID) -> int:
+        count = await get_redis().get(self._failed_login_key(user_id))
+        return int(count or 0)
+
+    async def clear_failed_logins(self, user_id: uuid.UUID) -> None:
+        await get_redis().delete(self._failed_login_key(user_id))
+
+
+auth_state_store = AuthStateStore()
@@ -8,6 +8,7 @@ from backend.app.bank_account.schema import BankAccountCreateSchema, BankAccount
 from backend.app.bank_account.utils import generate_account_number
 from backend.app.bank_account.enums import AccountStatusEnum
 from backend.app.auth.models import User
+from backend.app.api.services.recipient import recipient_directory
 from backend.app.core.logging import get_logger
 from backend.app.core.config import settings
 
@@ -157,6 +158,7 @@ async def activate_bank_account(
         session.add(account)
         await session.commit()
         await session.refresh(account)
+        await recipient_directory.invalidate(account.account_number)
 
         logger.info(f"Bank account {account.account_number} activated by user {verified_by}")
 
@@ -271,6 +273,7 @@ async def delete_bank_account(
 
         await session.delete(bank_account)
         await session.commit()
+        await recipient_directory.invalidate(bank_account.account_number)
 
         logger.info(f"Bank account {bank_account.account_number} deleted for user ID {user_id}")
 
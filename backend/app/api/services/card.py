@@ -22,6 +22,9 @@ from backend.app.virtual_card.utils import (
     generate_cvv,
     generate_expiry_date
 )
+from backend.app.core.velocity.engine import velocity_engine
+from backend.app.api.services.ledger import post_card_top_up
+from backend.app.api.services.analytics import record_transaction_rollups
 from backend.app.core.logging import get_logger
 
 logger = get_logger()
@@ -244,6 +247,7 @@ async def top_up_virtual_card(
     description: str,
     session: AsyncSession
 ) -> tuple[VirtualCard, Transaction]:
+    velocity_reservation = None
     try:
         statement = select(VirtualCard, BankAccount).join(BankAccount).where(VirtualCard.id == card_id, BankAccount.account_number == account_number)
         
@@ -322,17 +326,30 @@ async def top_up_virtual_card(
             }
         )
 
+        velocity_reservation = await velocity_engine.reserve(
+            amount=amount,
+            account_id=bank_account.id,
+            account_type=bank_account.account_type,
+            card=card,
+            now=current_time,
+        )
+
         bank_account.balance = float(balance_after)
 
         card.available_balance += amount
         card.total_topped_amount += amount
         card.last_topped_at = current_time
+        card.total_spent_today = velocity_reservation.totals["card:daily"]
+        card.total_spent_this_month = velocity_reservation.totals["card:monthly"]
 
         session.add(card)
         session.add(transaction)
         session.add(bank_account)
+        post_card_top_up(session, transaction=transaction, bank_account=bank_account, card=card)
+        await record_transaction_rollups(session, transaction=transaction)
 
         await session.commit()
+        velocity_reservation = None
         await session.refresh(card)
         await session.refresh(transaction)
 
@@ -347,10 +364,12 @@ async def top_up_virtual_card(
     
     except HTTPException:
         await session.rollback()
+        await velocity_engine.release(velocity_reservation)
         raise
 
     except Exception as e:
         await session.rollback()
+        await velocity_engine.release(velocity_reservation)
         logger.error(f"failed to top up virtual card {card_id}: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -399,7 +418,7 @@ async def activate_virtual_card(
                     "message": "Only executives can activate virtual cards"
                 }
             )
-        new_cvv, cvv_hash = generate_cvv()
+        new_cvv, cvv_hash = await generate_cvv()
         card.card_status = VirtualCardStatusEnum.ACTIVE
         card.cvv_hash = cvv_hash
 
@@ -0,0 +1,327 @@
+import uuid
+from datetime import datetime, timezone, timedelta
+from fastapi import HTTPException, status
+from sqlalchemy import update, tuple_, exists
+from sqlalchemy.orm import aliased
+from sqlmodel import select, desc, or_, and_
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.auth.models import User
+from backend.app.auth.schema import RoleChoicesSchema
+from backend.app.bank_account.models import BankAccount
+from backend.app.core.ai.config import ai_settings
+from backend.app.core.ai.enums import AIReviewStatusEnum
+from backend.app.core.ai.models import TransactionRiskScore
+from backend.app.transaction.models import Transaction
+from backend.app.transaction.schema import FraudReviewQueueItemSchema
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+FRAUD_REVIEWER_ROLES = (
+    RoleChoicesSchema.BRANCH_MANAGER,
+    RoleChoicesSchema.ADMIN,
+    RoleChoicesSchema.SUPER_ADMIN,
+)
+
+
+def ensure_fraud_reviewer(user: User) -> None:
+    if user.role not in FRAUD_REVIEWER_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "status": "error",
+                "message": "You are not authorized to review flagged transactions.",
+            },
+        )
+
+
+def encode_cursor(risk_score: float, risk_score_id: uuid.UUID) -> str:
+    return f"{risk_score!r}:{risk_score_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[float, uuid.UUID]:
+    try:
+        score, risk_score_id = cursor.split(":", 1)
+        return float(score), uuid.UUID(risk_score_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": "Invalid cursor",
+                "action": "Use the next_cursor value from the previous page."
+            },
+        ) from e
+
+
+def _claim_cutoff(now: datetime) -> datetime:
+    return now - timedelta(minutes=ai_settings.REVIEW_CLAIM_MINUTES)
+
+
+def _unclaimed(cutoff: datetime):
+    return or_(
+        TransactionRiskScore.claimed_by.is_(None),
+        TransactionRiskScore.claimed_at < cutoff,
+    )
+
+
+def _not_already_reviewed():
+    # Batch re-scoring under a new model version adds a fresh unreviewed row; a
+    # transaction an analyst already resolved must not come back to the queue.
+    reviewed = aliased(TransactionRiskScore)
+    return ~exists().where(
+        reviewed.transaction_id == TransactionRiskScore.transaction_id,
+        reviewed.reviewed_by.is_not(None),
+    )
+
+
+def _claimed_by(reviewer_id: uuid.UUID, cutoff: datetime):
+    return and_(
+        TransactionRiskScore.claimed_by == reviewer_id,
+        TransactionRiskScore.claimed_at >= cutoff,
+    )
+
+
+async def get_review_queue(
+        *,
+        session: AsyncSession,
+        reviewer_id: uuid.UUID,
+        limit: int,
+        cursor: str | None = None,
+        min_risk_score: float | None = None,
+        claimed: str = "all",
+) -> tuple[list[FraudReviewQueueItemSchema], str | None]:
+    """
+    Unreviewed scores at or above the threshold, for transactions no analyst has
+    resolved yet under any model version, highest risk first, joined to the
+    transaction and sender account in a single query. Keyset-paginated on
+    (risk_score, id) so every page is an index range scan regardless of depth.
+    """
+    now = datetime.now(timezone.utc)
+    cutoff = _claim_cutoff(now)
+    threshold = min_risk_score if min_risk_score is not None else ai_settings.HIGH_RISK_SCORE_THRESHOLD
+
+    statement = (
+        select(
+            TransactionRiskScore.id,
+            TransactionRiskScore.transaction_id,
+            TransactionRiskScore.risk_score,
+            TransactionRiskScore.risk_factors,
+            TransactionRiskScore.ai_model_version,
+            TransactionRiskScore.created_at,
+            TransactionRiskScore.claimed_by,
+            TransactionRiskScore.claimed_at,
+            Transaction.reference,
+            Transaction.amount,
+            Transaction.transaction_type,
+            Transaction.status,
+            Transaction.created_at.label("transaction_created_at"),
+            Transaction.sender_id,
+            BankAccount.account_number,
+            BankAccount.account_currency,
+        )
+        .join(Transaction, Transaction.id == TransactionRiskScore.transaction_id)
+        .outerjoin(BankAccount, BankAccount.id == Transaction.sender_account_id)
+        .where(
+            TransactionRiskScore.reviewed_by.is_(None),
+            TransactionRiskScore.risk_score >= threshold,
+            _not_already_reviewed(),
+        )
+        .order_by(desc(TransactionRiskScore.risk_score), desc(TransactionRiskScore.id))
+        .limit(limit + 1)
+    )
+
+    if cursor:
+        after_score, after_id = decode_cursor(cursor)
+        statement = statement.where(
+            tuple_(TransactionRiskScore.risk_score, TransactionRiskScore.id)
+            < tuple_(after_score, after_id)
+        )
+
+    if claimed == "mine":
+        statement = statement.where(_claimed_by(reviewer_id, cutoff))
+    elif claimed == "unclaimed":
+        statement = statement.where(_unclaimed(cutoff))
+
+    result = await session.exec(statement)
+    rows = result.all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    items = [
+        FraudReviewQueueItemSchema(
+            risk_score_id=row.id,
+            transaction_id=row.transaction_id,
+            reference=row.reference,
+            amount=row.amount,
+            transaction_type=row.transaction_type,
+            transaction_status=row.status,
+            transaction_created_at=row.transaction_created_at,
+            risk_score=row.risk_score,
+            risk_factors=row.risk_factors,
+            ai_model_version=row.ai_model_version,
+            scored_at=row.created_at,
+            sender_id=row.sender_id,
+            sender_account_number=row.account_number,
+            sender_account_currency=(
+                row.account_currency.value if row.account_currency else None
+            ),
+            claimed_by=row.claimed_by if row.claimed_at and row.claimed_at >= cutoff else None,
+            claimed_at=row.claimed_at if row.claimed_at and row.claimed_at >= cutoff else None,
+        )
+        for row in rows
+    ]
+
+    next_cursor = encode_cursor(rows[-1].risk_score, rows[-1].id) if has_more and rows else None
+    return items, next_cursor
+
+
+async def claim_review_items(
+        *,
+        session: AsyncSession,
+        reviewer_id: uuid.UUID,
+        limit: int,
+        min_risk_score: float | None = None,
+) -> list[uuid.UUID]:
+    """
+    Claim the next `limit` unclaimed items for a reviewer. SKIP LOCKED lets analysts
+    claim concurrently without waiting on or double-claiming each other's rows;
+    claims lapse after REVIEW_CLAIM_MINUTES.
+    """
+    now = datetime.now(timezone.utc)
+    threshold = min_risk_score if min_risk_score is not None else ai_settings.HIGH_RISK_SCORE_THRESHOLD
+
+    candidates = (
+        select(TransactionRiskScore.id)
+        .where(
+            TransactionRiskScore.reviewed_by.is_(None),
+            TransactionRiskScore.risk_score >= threshold,
+            _unclaimed(_claim_cutoff(now)),
+            _not_already_reviewed(),
+        )
+        .order_by(desc(TransactionRiskScore.risk_score), desc(TransactionRiskScore.id))
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    statement = (
+        update(TransactionRiskScore)
+        .where(TransactionRiskScore.id.in_(candidates))
+        .values(claimed_by=reviewer_id, claimed_at=now)
+        .returning(TransactionRiskScore.id)
+    )
+
+    try:
+        result = await session.execute(statement)
+        claimed_ids = list(result.scalars().all())
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+
+    logger.info(f"Reviewer {reviewer_id} claimed {len(claimed_ids)} flagged transactions")
+    return claimed_ids
+
+
+async def release_review_items(
+        *,
+        session: AsyncSession,
+        reviewer_id: uuid.UUID,
+        risk_score_ids: list[uuid.UUID],
+) -> list[uuid.UUID]:
+    statement = (
+        update(TransactionRiskScore)
+        .where(
+            TransactionRiskScore.id.in_(risk_score_ids),
+            TransactionRiskScore.claimed_by == reviewer_id,
+            TransactionRiskScore.reviewed_by.is_(None),
+        )
+        .values(claimed_by=None, claimed_at=None)
+        .returning(TransactionRiskScore.id)
+    )
+
+    try:
+        result = await session.execute(statement)
+        released_ids = list(result.scalars().all())
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+
+    return released_ids
+
+
+async def resolve_review_items(
+        *,
+        session: AsyncSession,
+        reviewer_id: uuid.UUID,
+        risk_score_ids: list[uuid.UUID],
+        is_fraud: bool,
+        notes: str | None = None,
+) -> tuple[list[uuid.UUID], list[uuid.UUID]]:
+    """
+    Confirm or clear a batch of items the reviewer currently holds. Items not claimed
+    by the reviewer (or whose claim lapsed) are skipped. Other unreviewed scores of
+    the same transactions, e.g. from an older model version, are resolved with them,
+    and the transactions' ai_review_status is updated, all in one commit.
+    """
+    now = datetime.now(timezone.utc)
+    review_details = {
+        "decision": "confirmed_fraud" if is_fraud else "cleared",
+        "notes": notes,
+    }
+    resolved_values = {
+        "is_confirmed_fraud": is_fraud,
+        "reviewed_by": reviewer_id,
+        "reviewed_at": now,
+        "review_details": review_details,
+        "claimed_by": None,
+        "claimed_at": None,
+    }
+
+    try:
+        result = await session.execute(
+            update(TransactionRiskScore)
+            .where(
+                TransactionRiskScore.id.in_(risk_score_ids),
+                TransactionRiskScore.reviewed_by.is_(None),
+                _claimed_by(reviewer_id, _claim_cutoff(now)),
+            )
+            .values(**resolved_values)
+            .returning(TransactionRiskScore.id, TransactionRiskScore.transaction_id)
+        )
+        resolved = result.all()
+        resolved_ids = [row.id for row in resolved]
+        transaction_ids = list({row.transaction_id for row in resolved})
+
+        if transaction_ids:
+            await session.execute(
+                update(TransactionRiskScore)
+                .where(
+                    TransactionRiskScore.transaction_id.in_(transaction_ids),
+                    TransactionRiskScore.reviewed_by.is_(None),
+                )
+                .values(**resolved_values)
+            )
+            await session.execute(
+                update(Transaction)
+                .where(Transaction.id.in_(transaction_ids))
+                .values(
+                    ai_review_status=(
+                        AIReviewStatusEnum.CONFIRMED_FRAUD if is_fraud else AIReviewStatusEnum.CLEARED
+                    )
+                )
+            )
+
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+
+    resolved_set = set(resolved_ids)
+    skipped_ids = [risk_score_id for risk_score_id in risk_score_ids if risk_score_id not in resolved_set]
+    logger.info(
+        f"Reviewer {reviewer_id} resolved {len(resolved_ids)} flagged transactions "
+        f"as {review_details['decision']}, skipped {len(skipped_ids)}"
+    )
+    return resolved_ids, skipped_ids
@@ -0,0 +1,215 @@
+import hashlib
+import json
+import secrets
+import uuid
+from datetime import datetime, timezone, timedelta
+from typing import Any, AsyncGenerator
+from fastapi import Header, HTTPException, Request, status
+from backend.app.api.routes.auth.dependency import CurrentUser
+from backend.app.core.config import settings
+from backend.app.core.redis_client import get_redis
+from backend.app.core.tasks.idempotency import persist_idempotency_key
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+# Delete the in-flight marker only if it is still the one this request set.
+_RELEASE_SCRIPT = """
+local stored = redis.call('GET', KEYS[1])
+if stored and cjson.decode(stored)['t'] == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+IN_FLIGHT = "in_flight"
+DONE = "done"
+
+
+def validate_uuid4(value: str) -> str:
+    try:
+        uuid_obj = uuid.UUID(value, version=4)
+        if str(uuid_obj) != value.lower():
+            raise ValueError("Not a valid UUID v4")
+        return value
+    except (ValueError, AttributeError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": "Idempotency-key must be a valid UUID v4"
+            }
+        )
+
+
+def request_fingerprint(method: str, path: str, body: bytes) -> str:
+    """Hash of the request, insensitive to JSON key order and whitespace."""
+    try:
+        canonical = json.dumps(json.loads(body or b"null"), sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        canonical = body.decode("utf-8", errors="replace")
+    return hashlib.sha256(f"{method}\n{path}\n{canonical}".encode()).hexdigest()
+
+
+class IdempotencyGuard:
+    """
+    The idempotency state of one request. `cached_response` is set when the key
+    already completed; otherwise the request holds the in-flight lock and must
+    call save() with its response.
+    """
+
+    def __init__(self, *, key: str, user_id: uuid.UUID, endpoint: str, fingerprint: str):
+        self.key = key
+        self.user_id = user_id
+        self.endpoint = endpoint
+        self.fingerprint = fingerprint
+        self.token = secrets.token_hex(8)
+        self.cached_response: dict | None = None
+        self.cached_status_code: int | None = None
+        self.locked = False
+        self.saved = False
+
+    @property
+    def redis_key(self) -> str:
+        return f"idempotency:{self.user_id}:{self.endpoint}:{self.key}"
+
+
+class IdempotencyStore:
+    """
+    Idempotency keys kept in Redis for their whole lifetime. A request first sets
+    an in-flight marker with SET NX, so concurrent retries of the same key get a
+    409 instead of running twice; the marker is replaced by the response once the
+    request succeeds, or removed if it fails so the client can retry. Completed
+    responses are copied to the IdempotencyKey table in the background as a
+    record; that copy lags, so it cannot stand in for Redis and requests fail
+    with a 503 while Redis is unavailable.
+    """
+
+    def __init__(self):
+        self._release_script = None
+
+    def _get_release_script(self):
+        if self._release_script is None:
+            self._release_script = get_redis().register_script(_RELEASE_SCRIPT)
+        return self._release_script
+
+    @staticmethod
+    def _ttl_seconds() -> int:
+        return settings.IDEMPOTENCY_KEY_TTL_HOURS * 3600
+
+    def _replay(self, guard: IdempotencyGuard, stored: dict) -> None:
+        if stored.get("f") != guard.fingerprint:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail={
+                    "status": "error",
+                    "message": "Idempotency-key was already used for a different request",
+                    "action": "Use a new Idempotency-key for a new request"
+                }
+            )
+        if stored.get("s") != DONE:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "status": "error",
+                    "message": "A request with this Idempotency-key is still being processed",
+                    "action": "Please retry shortly"
+                }
+            )
+        guard.cached_response = stored["b"]
+        guard.cached_status_code = stored["c"]
+
+    async def acquire(self, guard: IdempotencyGuard) -> IdempotencyGuard:
+        marker = json.dumps({"s": IN_FLIGHT, "f": guard.fingerprint, "t": guard.token})
+        try:
+            redis = get_redis()
+            if await redis.set(guard.redis_key, marker, nx=True, ex=settings.IDEMPOTENCY_LOCK_SECONDS):
+                guard.locked = True
+                return guard
+            stored = await redis.get(guard.redis_key)
+        except Exception as e:
+            logger.error(f"Idempotency store unavailable for key {guard.key}: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={
+                    "status": "error",
+                    "message": "Unable to verify the Idempotency-key",
+                    "action": "Please try again shortly."
+                }
+            ) from e
+
+        if stored is None:
+            # Expired between SET NX and GET: the earlier request's lock lapsed.
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "status": "error",
+                    "message": "A request with this Idempotency-key is still being processed",
+                    "action": "Please retry shortly"
+                }
+            )
+        self._replay(guard, json.loads(stored))
+        return guard
+
+    async def save(self, guard: IdempotencyGuard, response_body: dict[str, Any], status_code: int) -> None:
+        guard.saved = True
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self._ttl_seconds())
+        try:
+            await get_redis().set(
+                guard.redis_key,
+                json.dumps(
+                    {"s": DONE, "f": guard.fingerprint, "c": status_code, "b": response_body},
+                    default=str,
+                ),
+                ex=self._ttl_seconds(),
+            )
+        except Exception as e:
+            logger.error(f"Failed to cache idempotent response for key {guard.key}: {e}")
+
+        try:
+            persist_idempotency_key.delay(
+                key=guard.key,
+                user_id=str(guard.user_id),
+                endpoint=guard.endpoint,
+                response_code=status_code,
+                response_body=json.loads(json.dumps(response_body, default=str)),
+                expires_at=expires_at.isoformat(),
+            )
+        except Exception as e:
+            logger.error(f"Failed to queue idempotency key {guard.key} for persistence: {e}")
+
+    async def release(self, guard: IdempotencyGuard) -> None:
+        if not guard.locked or guard.saved:
+            return
+        try:
+            await self._get_release_script()(keys=[guard.redis_key], args=[guard.token])
+        except Exception as e:
+            logger.error(f"Failed to release idempotency key {guard.key}: {e}")
+
+
+idempotency_store = IdempotencyStore()
+
+
+async def idempotency_guard(
+    request: Request,
+    current_user: CurrentUser,
+    idempotency_key: str = Header(description="Idempotency Key for the request"),
+) -> AsyncGenerator[IdempotencyGuard, None]:
+    """
+    Route dependency for money-moving endpoints. Replays the stored response for a
+    repeated key, rejects a key reused with a different body (422) or still in
+    flight (409), refuses to run unguarded when Redis is down (503), and otherwise lets the request run, releasing the lock if the
+    route does not save a response.
+    """
+    key = validate_uuid4(idempotency_key)
+    guard = IdempotencyGuard(
+        key=key,
+        user_id=current_user.id,
+        endpoint=request.url.path,
+        fingerprint=request_fingerprint(request.method, request.url.path, await request.body()),
+    )
+    await idempotency_store.acquire(guard)
+    try:
+        yield guard
+    finally:
+        await idempotency_store.release(guard)
@@ -0,0 +1,227 @@
+import uuid
+from collections import defaultdict
+from datetime import datetime, time, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from pydantic import BaseModel
+from sqlalchemy import func
+from sqlmodel import select, desc
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.bank_account.models import BankAccount
+from backend.app.ledger.models import LedgerEntry, LedgerBalanceSnapshot, LedgerDailyBalance
+from backend.app.transaction.models import Transaction
+from backend.app.virtual_card.models import VirtualCard
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+CENT = Decimal("0.01")
+
+
+def bank_account_code(account_id: uuid.UUID) -> str:
+    return f"bank_account:{account_id}"
+
+
+def virtual_card_code(card_id: uuid.UUID) -> str:
+    return f"virtual_card:{card_id}"
+
+
+def cash_code(currency: str) -> str:
+    return f"cash:{currency}"
+
+
+def fx_clearing_code(currency: str) -> str:
+    return f"fx_clearing:{currency}"
+
+
+def fee_income_code(currency: str) -> str:
+    return f"fee_income:{currency}"
+
+
+class LedgerImbalanceError(ValueError):
+    pass
+
+
+class LedgerLeg(BaseModel):
+    account_code: str
+    currency: str
+    amount: Decimal
+
+
+def post_journal(
+        session: AsyncSession,
+        *,
+        legs: list[LedgerLeg],
+        transaction_id: uuid.UUID | None = None,
+        description: str | None = None,
+) -> uuid.UUID:
+    """
+    Add a balanced journal to the caller's session. Nothing is flushed here, so the
+    entries commit (or roll back) together with the balance changes they record.
+    """
+    totals: dict[str, Decimal] = defaultdict(Decimal)
+    amounts = []
+    for leg in legs:
+        amount = Decimal(leg.amount).quantize(CENT, rounding=ROUND_HALF_UP)
+        totals[leg.currency] += amount
+        amounts.append(amount)
+
+    unbalanced = {currency: total for currency, total in totals.items() if total != 0}
+    if len(legs) < 2 or unbalanced:
+        raise LedgerImbalanceError(f"Journal does not balance: {unbalanced or 'single leg'}")
+
+    journal_id = uuid.uuid4()
+    session.add_all([
+        LedgerEntry(
+            journal_id=journal_id,
+            transaction_id=transaction_id,
+            account_code=leg.account_code,
+            currency=leg.currency,
+            amount=amount,
+            description=description,
+        )
+        for leg, amount in zip(legs, amounts)
+    ])
+    return journal_id
+
+
+def post_deposit(session: AsyncSession, *, transaction: Transaction, account: BankAccount) -> uuid.UUID:
+    currency = account.account_currency.value
+    return post_journal(
+        session,
+        legs=[
+            LedgerLeg(account_code=bank_account_code(account.id), currency=currency, amount=transaction.amount),
+            LedgerLeg(account_code=cash_code(currency), currency=currency, amount=-transaction.amount),
+        ],
+        transaction_id=transaction.id,
+        description=transaction.reference,
+    )
+
+
+def post_withdrawal(session: AsyncSession, *, transaction: Transaction, account: BankAccount) -> uuid.UUID:
+    currency = account.account_currency.value
+    return post_journal(
+        session,
+        legs=[
+            LedgerLeg(account_code=bank_account_code(account.id), currency=currency, amount=-transaction.amount),
+            LedgerLeg(account_code=cash_code(currency), currency=currency, amount=transaction.amount),
+        ],
+        transaction_id=transaction.id,
+        description=transaction.reference,
+    )
+
+
+def post_transfer(
+        session: AsyncSession,
+        *,
+        transaction: Transaction,
+        sender_account: BankAccount,
+        receiver_account: BankAccount,
+        converted_amount: Decimal,
+) -> uuid.UUID:
+    """
+    Same-currency transfers move the amount between the two accounts. Cross-currency
+    transfers route through an FX clearing account per currency, with the conversion
+    fee booked as income in the sender's currency.
+    """
+    from_currency = sender_account.account_currency.value
+    to_currency = receiver_account.account_currency.value
+    legs = [
+        LedgerLeg(account_code=bank_account_code(sender_account.id), currency=from_currency, amount=-transaction.amount),
+        LedgerLeg(account_code=bank_account_code(receiver_account.id), currency=to_currency, amount=converted_amount),
+    ]
+
+    if from_currency != to_currency:
+        conversion_fee = Decimal((transaction.transaction_metadata or {}).get("conversion_fee", "0"))
+        legs += [
+            LedgerLeg(account_code=fx_clearing_code(from_currency), currency=from_currency, amount=transaction.amount - conversion_fee),
+            LedgerLeg(account_code=fx_clearing_code(to_currency), currency=to_currency, amount=-converted_amount),
+        ]
+        if conversion_fee:
+            legs.append(
+                LedgerLeg(account_code=fee_income_code(from_currency), currency=from_currency, amount=conversion_fee)
+            )
+
+    return post_journal(
+        session,
+        legs=legs,
+        transaction_id=transaction.id,
+        description=transaction.reference,
+    )
+
+
+def post_card_top_up(
+        session: AsyncSession,
+        *,
+        transaction: Transaction,
+        bank_account: BankAccount,
+        card: VirtualCard,
+) -> uuid.UUID:
+    currency = bank_account.account_currency.value
+    return post_journal(
+        session,
+        legs=[
+            LedgerLeg(account_code=bank_account_code(bank_account.id), currency=currency, amount=-transaction.amount),
+            LedgerLeg(account_code=virtual_card_code(card.id), currency=currency, amount=transaction.amount),
+        ],
+        transaction_id=transaction.id,
+        description=transaction.reference,
+    )
+
+
+async def get_ledger_balance(session: AsyncSession, *, account_code: str, currency: str) -> Decimal:
+    """Latest snapshot plus the entries posted after it."""
+    snapshot_result = await session.exec(
+        select(LedgerBalanceSnapshot.balance, LedgerBalanceSnapshot.last_sequence)
+        .where(
+            LedgerBalanceSnapshot.account_code == account_code,
+            LedgerBalanceSnapshot.currency == currency,
+        )
+        .order_by(desc(LedgerBalanceSnapshot.last_sequence))
+        .limit(1)
+    )
+    snapshot = snapshot_result.first()
+    opening, after_sequence = (snapshot.balance, snapshot.last_sequence) if snapshot else (Decimal("0"), 0)
+
+    delta_result = await session.exec(
+        select(func.coalesce(func.sum(LedgerEntry.amount), 0))
+        .where(
+            LedgerEntry.account_code == account_code,
+            LedgerEntry.currency == currency,
+            LedgerEntry.sequence > after_sequence,
+        )
+    )
+    return Decimal(opening) + Decimal(delta_result.one())
+
+
+async def get_balance_at(session: AsyncSession, *, account_id: uuid.UUID, ts: datetime) -> Decimal:
+    """
+    Balance of a bank account at instant `ts`, i.e. including entries created
+    before it. Starts from the closest end-of-day balance before ts's day, so the
+    delta scan covers at most the postings since the last nightly snapshot.
+    """
+    account_code = bank_account_code(account_id)
+    ts = ts.astimezone(timezone.utc) if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+    daily_result = await session.exec(
+        select(LedgerDailyBalance.balance_date, LedgerDailyBalance.balance)
+        .where(
+            LedgerDailyBalance.account_code == account_code,
+            LedgerDailyBalance.balance_date < ts.date(),
+        )
+        .order_by(desc(LedgerDailyBalance.balance_date))
+        .limit(1)
+    )
+    daily = daily_result.first()
+
+    delta_statement = select(func.coalesce(func.sum(LedgerEntry.amount), 0)).where(
+        LedgerEntry.account_code == account_code,
+        LedgerEntry.created_at < ts,
+    )
+    opening = Decimal("0")
+    if daily:
+        opening = Decimal(daily.balance)
+        after = datetime.combine(daily.balance_date + timedelta(days=1), time.min, tzinfo=timezone.utc)
+        delta_statement = delta_statement.where(LedgerEntry.created_at >= after)
+
+    delta_result = await session.exec(delta_statement)
+    return opening + Decimal(delta_result.one())
@@ -0,0 +1,78 @@
+import hmac
+import uuid
+from datetime import datetime, timezone, timedelta
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.api.services.auth_state import auth_state_store
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.transaction.models import TransferOtpChallenge
+
+logger = get_logger()
+
+
+class OtpChallengeStore:
+    """
+    One-time passwords scoped to a single transfer reference, so concurrent
+    transfers and logins of the same user never overwrite each other's OTP and
+    no user row is written per transfer.
+
+    The hashed OTP lives in Redis for OTP_EXPIRATION_MINUTES. When Redis is
+    unavailable it is added to the caller's session as a TransferOtpChallenge
+    row instead and commits with the transfer; redemption checks Redis first and
+    then the table.
+    """
+
+    def _purpose(self, reference: str) -> str:
+        return f"transfer:{reference}"
+
+    async def issue(
+            self, *,
+            reference: str,
+            user_id: uuid.UUID,
+            otp: str,
+            session: AsyncSession,
+    ) -> None:
+        try:
+            await auth_state_store.store_otp(user_id, otp, purpose=self._purpose(reference))
+        except Exception as e:
+            logger.warning(f"Redis unavailable for transfer {reference} OTP, storing it in the database: {e}")
+            session.add(
+                TransferOtpChallenge(
+                    reference=reference,
+                    user_id=user_id,
+                    otp_hash=auth_state_store.hash_otp(otp),
+                    expires_at=datetime.now(timezone.utc) + timedelta(minutes=settings.OTP_EXPIRATION_MINUTES),
+                )
+            )
+
+    async def redeem(
+            self, *,
+            reference: str,
+            user_id: uuid.UUID,
+            otp: str,
+            session: AsyncSession,
+    ) -> bool | None:
+        """
+        Returns True on match, False on mismatch and None if there is no live OTP.
+        A matched database challenge is deleted in the caller's session.
+        """
+        try:
+            redeemed = await auth_state_store.redeem_otp(user_id, otp, purpose=self._purpose(reference))
+            if redeemed is not None:
+                return redeemed
+        except Exception as e:
+            logger.warning(f"Redis unavailable for transfer {reference} OTP, checking the database: {e}")
+
+        challenge = await session.get(TransferOtpChallenge, reference)
+        if not challenge or challenge.user_id != user_id:
+            return None
+        if datetime.now(timezone.utc) > challenge.expires_at:
+            return None
+        if not hmac.compare_digest(challenge.otp_hash, auth_state_store.hash_otp(otp)):
+            return False
+
+        await session.delete(challenge)
+        return True
+
+
+otp_challenge_store = OtpChallengeStore()
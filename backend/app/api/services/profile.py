@@ -1,16 +1,21 @@
 import uuid
+from datetime import datetime, timezone, timedelta
 from backend.app.user_profile.models import Profile
 from fastapi import HTTPException, status
+from sqlalchemy import Row, tuple_, exists, and_
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select, col
+from sqlmodel import select, desc
 from backend.app.user_profile.schema import (
     ProfileCreateSchema, 
     ProfileUpdateSchema, 
     RoleChoicesSchema
 )
-from backend.app.user_profile.enums import ImageTypeEnum
+from backend.app.user_profile.enums import ImageTypeEnum, KycStatusEnum
 from backend.app.core.tasks.image_upload import upload_profile_image_task
 from backend.app.auth.models import User
+from backend.app.auth.schema import AccountStatusSchema
+from backend.app.bank_account.models import BankAccount
+from backend.app.core.utils.counting import count_rows
 from backend.app.core.logging import get_logger
 
 
@@ -228,14 +233,56 @@ async def get_user_with_profile(
         )
     
 
+_CURSOR_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def encode_profile_cursor(created_at: datetime, user_id: uuid.UUID) -> str:
+    # Whole microseconds since the epoch: exact, and safe in a query string.
+    return f"{(created_at - _CURSOR_EPOCH) // timedelta(microseconds=1)}:{user_id}"
+
+
+def decode_profile_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        micros, user_id = cursor.split(":", 1)
+        return _CURSOR_EPOCH + timedelta(microseconds=int(micros)), uuid.UUID(user_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": "Invalid cursor",
+                "action": "Use the next_cursor value from the previous page."
+            },
+        ) from e
+
+
+def _kyc_filter(kyc_status: KycStatusEnum):
+    verified = exists().where(BankAccount.user_id == User.id, BankAccount.kyc_verified.is_(True))
+    submitted = exists().where(BankAccount.user_id == User.id, BankAccount.kyc_submitted.is_(True))
+    if kyc_status == KycStatusEnum.VERIFIED:
+        return verified
+    if kyc_status == KycStatusEnum.SUBMITTED:
+        return and_(submitted, ~verified)
+    return and_(~submitted, ~verified)
+
+
 async def get_all_user_profiles(
         session: AsyncSession,
         current_user: User,
-        skip: int = 0,
         limit: int = 20,
-) -> tuple[list[User], int]:
+        cursor: str | None = None,
+        role: RoleChoicesSchema | None = None,
+        account_status: AccountStatusSchema | None = None,
+        kyc_status: KycStatusEnum | None = None,
+) -> tuple[list[Row], str | None, int, bool]:
+    """
+    Newest users first with their profile, in one query projecting only the
+    listed columns. Keyset-paginated on (created_at, id), so a deep page costs
+    the same as the first. The total is exact for small results and the
+    planner's estimate otherwise.
+    """
     try:
-        if current_user != RoleChoicesSchema.BRANCH_MANAGER:
+        if not current_user.has_role(RoleChoicesSchema.BRANCH_MANAGER):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail={
@@ -244,21 +291,47 @@ async def get_all_user_profiles(
                     "action":"Only branch managers can access all profiles",
                 }
             )
-        count_statement = select(User)
-        result = await session.exec(count_statement)
-        total_count = len(result.all())
+
+        filters = []
+        if role is not None:
+            filters.append(User.role == role)
+        if account_status is not None:
+            filters.append(User.account_status == account_status)
+        if kyc_status is not None:
+            filters.append(_kyc_filter(kyc_status))
+
+        total_count, total_is_estimate = await count_rows(session, select(User.id).where(*filters))
 
         statement = (
-            select(User).offset(skip).limit(limit).order_by(col(User.created_at).desc())
+            select(
+                User.id,
+                User.created_at,
+                User.username,
+                User.first_name,
+                User.middle_name,
+                User.last_name,
+                User.email,
+                User.id_no,
+                User.role,
+                Profile,
+            )
+            .outerjoin(Profile, Profile.user_id == User.id)
+            .where(*filters)
+            .order_by(desc(User.created_at), desc(User.id))
+            .limit(limit + 1)
         )
+        if cursor:
+            after_created_at, after_id = decode_profile_cursor(cursor)
+            statement = statement.where(tuple_(User.created_at, User.id) < tuple_(after_created_at, after_id))
 
         result = await session.exec(statement)
-        users = result.all()
+        rows = result.all()
 
-        for user in users:
-            await session.refresh(user, ["profile"])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = encode_profile_cursor(rows[-1].created_at, rows[-1].id) if has_more and rows else None
 
-        return list(users), total_count
+        return list(rows), next_cursor, total_count, total_is_estimate
     except HTTPException as httpex:
         raise httpex
     except Exception as e:
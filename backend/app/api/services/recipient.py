@@ -0,0 +1,119 @@
+import uuid
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.bank_account.enums import AccountCurrencyEnum, AccountStatusEnum
+from backend.app.bank_account.models import BankAccount
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis_client import get_redis
+
+logger = get_logger()
+
+
+class Recipient(BaseModel):
+    """What a sender may learn about a transfer counterparty before paying it."""
+
+    account_id: uuid.UUID
+    user_id: uuid.UUID
+    account_number: str
+    account_name: str
+    account_currency: AccountCurrencyEnum
+    account_status: AccountStatusEnum
+
+
+class RecipientDirectory:
+    """
+    Counterparty lookups by account number, cached in Redis.
+
+    Entries expire after RECIPIENT_CACHE_TTL_SECONDS and are dropped whenever an
+    account's status or name changes or the account is deleted. Redis errors fall
+    back to the database so lookups never fail because the cache is down. Transfers
+    themselves always validate against the account rows they read, never the cache.
+    """
+
+    def _key(self, account_number: str) -> str:
+        return f"recipient:{account_number}"
+
+    async def _read(self, account_number: str) -> Recipient | None:
+        try:
+            cached = await get_redis().get(self._key(account_number))
+        except Exception as e:
+            logger.warning(f"Recipient cache unavailable for {account_number}: {e}")
+            return None
+        return Recipient.model_validate_json(cached) if cached else None
+
+    async def _write(self, recipient: Recipient) -> None:
+        try:
+            await get_redis().set(
+                self._key(recipient.account_number),
+                recipient.model_dump_json(),
+                ex=settings.RECIPIENT_CACHE_TTL_SECONDS,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache recipient {recipient.account_number}: {e}")
+
+    async def resolve(self, account_number: str, session: AsyncSession) -> Recipient | None:
+        recipient = await self._read(account_number)
+        if recipient is not None:
+            return recipient
+
+        result = await session.exec(
+            select(
+                BankAccount.id,
+                BankAccount.user_id,
+                BankAccount.account_number,
+                BankAccount.account_name,
+                BankAccount.account_currency,
+                BankAccount.account_status,
+            ).where(BankAccount.account_number == account_number)
+        )
+        row = result.first()
+        if row is None:
+            return None
+
+        recipient = Recipient(
+            account_id=row.id,
+            user_id=row.user_id,
+            account_number=row.account_number,
+            account_name=row.account_name,
+            account_currency=row.account_currency,
+            account_status=row.account_status,
+        )
+        await self._write(recipient)
+        return recipient
+
+    async def invalidate(self, account_number: str | None) -> None:
+        if not account_number:
+            return
+        try:
+            await get_redis().delete(self._key(account_number))
+        except Exception as e:
+            logger.error(f"Failed to invalidate cached recipient {account_number}: {e}")
+
+
+recipient_directory = RecipientDirectory()
+
+
+async def name_enquiry(*, account_number: str, session: AsyncSession) -> Recipient:
+    recipient = await recipient_directory.resolve(account_number, session)
+    if recipient is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "status": "error",
+                "message": "Account not found",
+                "action": "Please check the account number and try again."
+            },
+        )
+    if recipient.account_status != AccountStatusEnum.Active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": "Account is not active",
+                "action": "Please use a different recipient account"
+            },
+        )
+    return recipient
@@ -0,0 +1,109 @@
+from datetime import date
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.auth.models import User
+from backend.app.auth.schema import RoleChoicesSchema
+from backend.app.reporting.models import (
+    active_accounts_view,
+    teller_deposits_view,
+    transfer_volume_view,
+    card_issuance_view,
+)
+from backend.app.reporting.schema import (
+    ActiveAccountsReportSchema,
+    TellerDepositsReportSchema,
+    TransferVolumeReportSchema,
+    CardIssuanceReportSchema,
+)
+
+REPORT_VIEWER_ROLES = (
+    RoleChoicesSchema.BRANCH_MANAGER,
+    RoleChoicesSchema.ADMIN,
+    RoleChoicesSchema.SUPER_ADMIN,
+)
+
+
+def ensure_report_viewer(user: User) -> None:
+    if user.role not in REPORT_VIEWER_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "status": "error",
+                "message": "Access denied",
+                "action": "Only branch managers can access reports",
+            },
+        )
+
+
+async def get_active_accounts_report(*, session: AsyncSession) -> list[ActiveAccountsReportSchema]:
+    view = active_accounts_view.c
+    result = await session.execute(
+        select(active_accounts_view).order_by(view.account_type, view.account_currency, view.account_status)
+    )
+    return [ActiveAccountsReportSchema.model_validate(dict(row._mapping)) for row in result.all()]
+
+
+async def get_teller_deposits_report(
+        *,
+        session: AsyncSession,
+        start_date: date,
+        end_date: date,
+) -> list[TellerDepositsReportSchema]:
+    """Deposits per teller and currency between two dates, inclusive, largest total first."""
+    view = teller_deposits_view.c
+    total_amount = func.sum(view.total_amount)
+    statement = (
+        select(
+            view.teller_id,
+            User.first_name,
+            User.last_name,
+            view.currency,
+            func.sum(view.deposit_count).label("deposit_count"),
+            total_amount.label("total_amount"),
+        )
+        .outerjoin(User, User.id == view.teller_id)
+        .where(view.deposit_date >= start_date, view.deposit_date <= end_date)
+        .group_by(view.teller_id, User.first_name, User.last_name, view.currency)
+        .order_by(total_amount.desc())
+    )
+    result = await session.execute(statement)
+    return [
+        TellerDepositsReportSchema(
+            teller_id=row.teller_id,
+            teller_name=f"{row.first_name} {row.last_name}".title() if row.first_name else None,
+            currency=row.currency,
+            deposit_count=row.deposit_count,
+            total_amount=row.total_amount,
+        )
+        for row in result.all()
+    ]
+
+
+async def get_transfer_volume_report(
+        *,
+        session: AsyncSession,
+        start_date: date,
+        end_date: date,
+) -> list[TransferVolumeReportSchema]:
+    view = transfer_volume_view.c
+    result = await session.execute(
+        select(transfer_volume_view)
+        .where(view.transfer_date >= start_date, view.transfer_date <= end_date)
+        .order_by(view.transfer_date, view.currency)
+    )
+    return [TransferVolumeReportSchema.model_validate(dict(row._mapping)) for row in result.all()]
+
+
+async def get_card_issuance_report(
+        *,
+        session: AsyncSession,
+        start_month: date,
+) -> list[CardIssuanceReportSchema]:
+    view = card_issuance_view.c
+    result = await session.execute(
+        select(card_issuance_view)
+        .where(view.issued_month >= start_month)
+        .order_by(view.issued_month, view.card_type, view.card_provider, view.currency, view.card_status)
+    )
+    return [CardIssuanceReportSchema.model_validate(dict(row._mapping)) for row in result.all()]
@@ -0,0 +1,459 @@
+import uuid
+from decimal import Decimal
+from datetime import datetime, timezone, timedelta
+from fastapi import HTTPException, status
+from sqlalchemy import update, text
+from sqlmodel import select, or_, desc
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.bank_account.enums import AccountStatusEnum
+from backend.app.bank_account.models import BankAccount
+from backend.app.bank_account.utils import calculate_conversion
+from backend.app.auth.models import User
+from backend.app.core.config import settings
+from backend.app.core.velocity.engine import velocity_engine, VelocityLimitExceededError
+from backend.app.scheduled_transfer.enums import ScheduledTransferStatusEnum
+from backend.app.scheduled_transfer.models import ScheduledTransfer
+from backend.app.scheduled_transfer.schema import ScheduledTransferCreateSchema
+from backend.app.scheduled_transfer.utils import next_occurrence
+from backend.app.transaction.enums import TransactionStatusEnum, TransactionTypeEnum, TransactionCategoryEnum
+from backend.app.transaction.models import Transaction
+from backend.app.api.services.ledger import post_transfer
+from backend.app.api.services.analytics import record_transaction_rollups
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+def scheduled_reference(schedule_id: uuid.UUID, due_at: datetime) -> str:
+    """Deterministic per occurrence, so the unique reference also rejects a second execution."""
+    occurrence = uuid.uuid5(schedule_id, due_at.astimezone(timezone.utc).isoformat())
+    return f"STO{occurrence.hex[:12].upper()}"
+
+
+async def create_scheduled_transfer(
+        *,
+        user_id: uuid.UUID,
+        schedule_data: ScheduledTransferCreateSchema,
+        session: AsyncSession,
+) -> ScheduledTransfer:
+    try:
+        now = datetime.now(timezone.utc)
+        start_at = schedule_data.start_at
+        if start_at.tzinfo is None:
+            start_at = start_at.replace(tzinfo=timezone.utc)
+        end_at = schedule_data.end_at
+        if end_at is not None and end_at.tzinfo is None:
+            end_at = end_at.replace(tzinfo=timezone.utc)
+
+        if start_at < now - timedelta(minutes=1):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "status": "error",
+                    "message": "Start time must be in the future",
+                }
+            )
+        if end_at is not None and end_at < start_at:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "status": "error",
+                    "message": "End time must be after the start time",
+                }
+            )
+
+        result = await session.exec(
+            select(BankAccount, User).join(User).where(
+                or_(
+                    BankAccount.id == schedule_data.sender_account_id,
+                    BankAccount.account_number == schedule_data.receiver_account_number,
+                )
+            )
+        )
+        accounts = result.all()
+        sender_data = next(
+            ((account, user) for account, user in accounts
+             if account.id == schedule_data.sender_account_id and account.user_id == user_id),
+            None,
+        )
+        receiver_account = next(
+            (account for account, _ in accounts
+             if account.account_number == schedule_data.receiver_account_number),
+            None,
+        )
+
+        if not sender_data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "status": "error",
+                    "message": "Sender account not found"
+                }
+            )
+        sender_account, sender = sender_data
+
+        if sender_account.account_status != AccountStatusEnum.Active:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "status": "error",
+                    "message": "Sender account is not active"
+                },
+            )
+        if schedule_data.security_answer != sender.security_answer:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail={
+                    "status": "error",
+                    "message": "Incorrect security answer",
+                },
+            )
+        if not receiver_account or receiver_account.account_status != AccountStatusEnum.Active:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "status": "error",
+                    "message": "Receiver account not found or not active"
+                }
+            )
+        if receiver_account.user_id == user_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "status": "error",
+                    "message": "Cannot schedule transfers to your own account",
+                    "action": "Please use a different recipient account"
+                },
+            )
+
+        schedule = ScheduledTransfer(
+            user_id=user_id,
+            sender_account_id=sender_account.id,
+            receiver_account_number=schedule_data.receiver_account_number,
+            amount=schedule_data.amount,
+            description=schedule_data.description,
+            frequency=schedule_data.frequency,
+            start_at=start_at,
+            next_run_at=start_at,
+            end_at=end_at,
+        )
+        session.add(schedule)
+        await session.commit()
+        await session.refresh(schedule)
+
+        logger.info(f"Scheduled {schedule.frequency.value} transfer {schedule.id} created for user {user_id}")
+        return schedule
+
+    except HTTPException:
+        await session.rollback()
+        raise
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Failed to create scheduled transfer: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to create scheduled transfer"
+            }
+        ) from e
+
+
+async def get_user_scheduled_transfers(*, user_id: uuid.UUID, session: AsyncSession) -> list[ScheduledTransfer]:
+    result = await session.exec(
+        select(ScheduledTransfer)
+        .where(ScheduledTransfer.user_id == user_id)
+        .order_by(desc(ScheduledTransfer.created_at))
+    )
+    return list(result.all())
+
+
+async def cancel_scheduled_transfer(
+        *,
+        user_id: uuid.UUID,
+        schedule_id: uuid.UUID,
+        session: AsyncSession,
+) -> ScheduledTransfer:
+    result = await session.exec(
+        select(ScheduledTransfer)
+        .where(ScheduledTransfer.id == schedule_id, ScheduledTransfer.user_id == user_id)
+        .with_for_update()
+    )
+    schedule = result.first()
+    if not schedule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "status": "error",
+                "message": "Scheduled transfer not found"
+            }
+        )
+    if schedule.status in (ScheduledTransferStatusEnum.COMPLETED, ScheduledTransferStatusEnum.CANCELLED):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": f"Scheduled transfer is already {schedule.status.value}"
+            }
+        )
+
+    schedule.status = ScheduledTransferStatusEnum.CANCELLED
+    session.add(schedule)
+    await session.commit()
+    await session.refresh(schedule)
+    return schedule
+
+
+async def claim_due_transfers(
+        *,
+        session: AsyncSession,
+        limit: int,
+        now: datetime | None = None,
+) -> list[tuple[uuid.UUID, datetime]]:
+    """
+    Lease the next `limit` due schedules and return (id, occurrence) pairs to run.
+    SKIP LOCKED lets several schedulers claim side by side without waiting on or
+    double-claiming each other's rows. A lease that expires before the run
+    completes makes the occurrence claimable again; execution itself is guarded
+    by the occurrence, so a re-dispatched run never executes twice.
+    """
+    now = now or datetime.now(timezone.utc)
+    due = (
+        select(ScheduledTransfer.id)
+        .where(
+            # Literal so the planner can use the partial index on active schedules.
+            text("scheduled_transfer.status = 'ACTIVE'"),
+            ScheduledTransfer.next_run_at <= now,
+            or_(
+                ScheduledTransfer.claimed_until.is_(None),
+                ScheduledTransfer.claimed_until < now,
+            ),
+        )
+        .order_by(ScheduledTransfer.next_run_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    statement = (
+        update(ScheduledTransfer)
+        .where(ScheduledTransfer.id.in_(due))
+        .values(claimed_until=now + timedelta(seconds=settings.SCHEDULED_TRANSFER_LEASE_SECONDS))
+        .returning(ScheduledTransfer.id, ScheduledTransfer.next_run_at)
+    )
+
+    try:
+        result = await session.execute(statement)
+        claimed = [(row.id, row.next_run_at) for row in result.all()]
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    return claimed
+
+
+def _advance_schedule(
+        schedule: ScheduledTransfer,
+        now: datetime,
+        *,
+        transaction_id: uuid.UUID | None = None,
+        error: str | None = None,
+) -> None:
+    schedule.last_run_at = now
+    schedule.claimed_until = None
+    schedule.occurrences += 1
+
+    if error:
+        schedule.consecutive_failures += 1
+        schedule.last_error = error[:255]
+    else:
+        schedule.runs_count += 1
+        schedule.consecutive_failures = 0
+        schedule.last_error = None
+        schedule.last_transaction_id = transaction_id
+
+    # Occurrences missed while the scheduler was down are skipped, not replayed.
+    next_run_at = next_occurrence(schedule.frequency, schedule.start_at, schedule.occurrences)
+    while next_run_at is not None and next_run_at <= now:
+        schedule.occurrences += 1
+        next_run_at = next_occurrence(schedule.frequency, schedule.start_at, schedule.occurrences)
+
+    if next_run_at is None or (schedule.end_at is not None and next_run_at > schedule.end_at):
+        schedule.status = ScheduledTransferStatusEnum.COMPLETED
+    elif schedule.consecutive_failures >= settings.SCHEDULED_TRANSFER_MAX_FAILURES:
+        schedule.status = ScheduledTransferStatusEnum.PAUSED
+        schedule.next_run_at = next_run_at
+    else:
+        schedule.next_run_at = next_run_at
+
+
+async def execute_scheduled_transfer(
+        *,
+        schedule_id: uuid.UUID,
+        due_at: datetime,
+        session: AsyncSession,
+) -> str:
+    """
+    Run one occurrence of a standing order. The schedule row is locked and must
+    still be due at `due_at`, and the sender and receiver accounts are locked in id
+    order; the transfer, its ledger journal and the schedule's next occurrence
+    commit together. Business failures (inactive account, insufficient balance,
+    velocity limits) skip the occurrence and are recorded on the schedule.
+
+    Returns "completed", "failed" or "skipped" (occurrence already handled).
+    """
+    velocity_reservation = None
+    try:
+        result = await session.exec(
+            select(ScheduledTransfer)
+            .where(
+                ScheduledTransfer.id == schedule_id,
+                ScheduledTransfer.status == ScheduledTransferStatusEnum.ACTIVE,
+                ScheduledTransfer.next_run_at == due_at,
+            )
+            .with_for_update()
+        )
+        schedule = result.first()
+        if not schedule:
+            return "skipped"
+
+        now = datetime.now(timezone.utc)
+        accounts_result = await session.exec(
+            select(BankAccount)
+            .where(
+                or_(
+                    BankAccount.id == schedule.sender_account_id,
+                    BankAccount.account_number == schedule.receiver_account_number,
+                )
+            )
+            .order_by(BankAccount.id)
+            .with_for_update()
+        )
+        accounts = accounts_result.all()
+        sender_account = next((a for a in accounts if a.id == schedule.sender_account_id), None)
+        receiver_account = next(
+            (a for a in accounts if a.account_number == schedule.receiver_account_number), None
+        )
+
+        error = None
+        amount = Decimal(schedule.amount)
+        if not sender_account or sender_account.account_status != AccountStatusEnum.Active:
+            error = "Sender account is not active"
+        elif not receiver_account or receiver_account.account_status != AccountStatusEnum.Active:
+            error = "Receiver account is not active"
+        elif Decimal(str(sender_account.balance)) < amount:
+            error = "Insufficient balance"
+
+        if not error:
+            try:
+                velocity_reservation = await velocity_engine.reserve(
+                    amount=float(amount),
+                    account_id=sender_account.id,
+                    account_type=sender_account.account_type,
+                    now=now,
+                )
+            except VelocityLimitExceededError as e:
+                error = e.detail["message"]
+
+        if error:
+            _advance_schedule(schedule, now, error=error)
+            session.add(schedule)
+            await session.commit()
+            logger.warning(f"Scheduled transfer {schedule_id} skipped occurrence {due_at}: {error}")
+            return "failed"
+
+        converted_amount, exchange_rate, conversion_fee = calculate_conversion(
+            amount, sender_account.account_currency, receiver_account.account_currency
+        )
+        balance_before = Decimal(str(sender_account.balance))
+
+        transaction = Transaction(
+            amount=amount,
+            description=schedule.description,
+            reference=scheduled_reference(schedule.id, due_at),
+            transaction_type=TransactionTypeEnum.TRANSFER,
+            transaction_category=TransactionCategoryEnum.DEBIT,
+            status=TransactionStatusEnum.COMPLETED,
+            balance_before=balance_before,
+            balance_after=balance_before - amount,
+            sender_account_id=sender_account.id,
+            receiver_account_id=receiver_account.id,
+            sender_id=schedule.user_id,
+            receiver_id=receiver_account.user_id,
+            completed_at=now,
+            transaction_metadata={
+                "account_currency": sender_account.account_currency.value,
+                "conversion_rate": str(exchange_rate),
+                "conversion_fee": str(conversion_fee),
+                "original_amount": str(amount),
+                "converted_amount": str(converted_amount),
+                "from_currency": sender_account.account_currency.value,
+                "to_currency": receiver_account.account_currency.value,
+                "scheduled_transfer_id": str(schedule.id),
+                "scheduled_for": due_at.isoformat(),
+            }
+        )
+
+        sender_account.balance = float(balance_before - amount)
+        receiver_account.balance = float(Decimal(str(receiver_account.balance)) + converted_amount)
+        _advance_schedule(schedule, now, transaction_id=transaction.id)
+
+        session.add(transaction)
+        session.add(sender_account)
+        session.add(receiver_account)
+        session.add(schedule)
+        post_transfer(
+            session,
+            transaction=transaction,
+            sender_account=sender_account,
+            receiver_account=receiver_account,
+            converted_amount=converted_amount,
+        )
+        await record_transaction_rollups(session, transaction=transaction)
+
+        await session.commit()
+        velocity_reservation = None
+
+        logger.info(f"Scheduled transfer {schedule_id} executed as {transaction.reference}")
+        return "completed"
+
+    except Exception:
+        await session.rollback()
+        await velocity_engine.release(velocity_reservation)
+        raise
+
+
+async def record_scheduled_transfer_error(
+        *,
+        schedule_id: uuid.UUID,
+        due_at: datetime,
+        error: str,
+        session: AsyncSession,
+) -> str:
+    """
+    Count an occurrence that kept failing unexpectedly as a failed run, so the
+    lease is cleared and the schedule pauses after SCHEDULED_TRANSFER_MAX_FAILURES
+    instead of being claimed again forever.
+
+    Returns "failed", or "skipped" if the occurrence was handled meanwhile.
+    """
+    try:
+        result = await session.exec(
+            select(ScheduledTransfer)
+            .where(
+                ScheduledTransfer.id == schedule_id,
+                ScheduledTransfer.status == ScheduledTransferStatusEnum.ACTIVE,
+                ScheduledTransfer.next_run_at == due_at,
+            )
+            .with_for_update()
+        )
+        schedule = result.first()
+        if not schedule:
+            return "skipped"
+
+        _advance_schedule(schedule, datetime.now(timezone.utc), error=error)
+        session.add(schedule)
+        await session.commit()
+        return "failed"
+
+    except Exception:
+        await session.rollback()
+        raise
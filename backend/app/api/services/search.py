@@ -0,0 +1,151 @@
+import re
+import uuid
+from fastapi import HTTPException, status
+from sqlalchemy import func, literal, or_, union_all
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.auth.models import User
+from backend.app.auth.schema import RoleChoicesSchema
+from backend.app.bank_account.models import BankAccount
+from backend.app.search.schema import CustomerSearchResultSchema
+from backend.app.user_profile.models import Profile
+
+CUSTOMER_SEARCH_ROLES = (
+    RoleChoicesSchema.TELLER,
+    RoleChoicesSchema.ACCOUNT_EXECUTIVE,
+    RoleChoicesSchema.BRANCH_MANAGER,
+    RoleChoicesSchema.ADMIN,
+    RoleChoicesSchema.SUPER_ADMIN,
+)
+
+MIN_DIGITS = 4
+# Account number and phone matches outrank name matches, whose scores are
+# ts_rank plus trigram word similarity and so stay well below these.
+ACCOUNT_NUMBER_SCORE = 3.0
+PHONE_SCORE = 2.0
+
+
+def ensure_customer_searcher(user: User) -> None:
+    if user.role not in CUSTOMER_SEARCH_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "status": "error",
+                "message": "You are not authorized to search customers.",
+            },
+        )
+
+
+def _prefix_tsquery(query: str) -> str | None:
+    """'jo smi' -> 'jo:* & smi:*'; tokens are word characters only, so the query is always valid."""
+    tokens = re.findall(r"\w+", query.lower())
+    return " & ".join(f"{token}:*" for token in tokens) or None
+
+
+def _candidates(query: str):
+    term = query.strip().lower()
+    tsquery = _prefix_tsquery(term)
+    if not tsquery:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": "Search query must contain letters or digits",
+            },
+        )
+
+    ts_query = func.to_tsquery("simple", tsquery)
+    search_text, search_vector = User.__table__.c.search_text, User.__table__.c.search_vector
+    branches = [
+        select(
+            User.id.label("user_id"),
+            (func.ts_rank(search_vector, ts_query) + func.word_similarity(term, search_text)).label("score"),
+        ).where(
+            or_(
+                search_vector.op("@@")(ts_query),
+                literal(term).op("<%")(search_text),
+            )
+        )
+    ]
+
+    digits = re.sub(r"\D", "", term)
+    if len(digits) >= MIN_DIGITS and len(digits) * 2 >= len(term.replace(" ", "")):
+        branches.append(
+            select(BankAccount.user_id.label("user_id"), literal(ACCOUNT_NUMBER_SCORE).label("score"))
+            .where(BankAccount.account_number.like(f"{digits}%"))
+        )
+        branches.append(
+            select(Profile.user_id.label("user_id"), literal(PHONE_SCORE).label("score"))
+            .where(Profile.phone_digits.like(f"%{digits}%"))
+        )
+
+    return union_all(*branches).subquery("candidates")
+
+
+async def search_customers(
+        *,
+        session: AsyncSession,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+) -> tuple[list[CustomerSearchResultSchema], bool]:
+    """
+    Customers matching a name, email, username, phone number or account number,
+    best match first. Names match by word prefix (tsvector) or, for typos, by
+    trigram word similarity; digits match account number prefixes and any part
+    of a phone number. Every branch is served by an index on a generated column.
+    """
+    candidates = _candidates(query)
+    score = func.max(candidates.c.score).label("score")
+
+    statement = (
+        select(
+            User.id,
+            User.first_name,
+            User.middle_name,
+            User.last_name,
+            User.username,
+            User.email,
+            User.account_status,
+            Profile.phone_number,
+            score,
+        )
+        .join(candidates, candidates.c.user_id == User.id)
+        .outerjoin(Profile, Profile.user_id == User.id)
+        .where(User.role == RoleChoicesSchema.CUSTOMER)
+        .group_by(User.id, Profile.id)
+        .order_by(score.desc(), User.id)
+        .offset(offset)
+        .limit(limit + 1)
+    )
+    result = await session.exec(statement)
+    rows = result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    accounts: dict[uuid.UUID, list[str]] = {}
+    if rows:
+        account_result = await session.exec(
+            select(BankAccount.user_id, BankAccount.account_number)
+            .where(BankAccount.user_id.in_([row.id for row in rows]), BankAccount.account_number.is_not(None))
+            .order_by(BankAccount.user_id, BankAccount.created_at)
+        )
+        for user_id, account_number in account_result.all():
+            accounts.setdefault(user_id, []).append(account_number)
+
+    results = [
+        CustomerSearchResultSchema(
+            user_id=row.id,
+            full_name=" ".join(
+                part for part in (row.first_name, row.middle_name, row.last_name) if part
+            ).title(),
+            username=row.username,
+            email=row.email,
+            phone_number=row.phone_number,
+            account_status=row.account_status,
+            account_numbers=accounts.get(row.id, []),
+            score=round(float(row.score), 4),
+        )
+        for row in rows
+    ]
+    return results, has_more
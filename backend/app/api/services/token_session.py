@@ -0,0 +1,111 @@
+import uuid
+from enum import Enum
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis_client import get_redis
+
+logger = get_logger()
+
+# Atomically swap the live refresh jti of a session for a new one.
+# Returns 1 when rotated, 0 when the presented jti is stale (reuse) and -1 when the session is gone.
+_ROTATE_REFRESH_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then
+    return -1
+end
+if current ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'KEEPTTL')
+return 1
+"""
+
+
+class RotationResultEnum(str, Enum):
+    ROTATED = "rotated"
+    REUSED = "reused"
+    UNKNOWN = "unknown"
+
+
+class TokenSessionStore:
+    """
+    Server-side state for JWT sessions, keyed by the `sid` claim shared by a
+    session's access and refresh tokens.
+
+    Only the latest refresh `jti` per session is kept; presenting an older one is
+    treated as token theft and revokes the whole session. Revoked sessions are
+    individual Redis keys that expire with the refresh token lifetime, so the
+    per-request revocation check is a single EXISTS.
+    """
+
+    @property
+    def _session_ttl(self) -> int:
+        return settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
+    def _refresh_key(self, session_id: str) -> str:
+        return f"auth:session:{session_id}:refresh_jti"
+
+    def _revoked_key(self, session_id: str) -> str:
+        return f"auth:revoked:{session_id}"
+
+    def _user_sessions_key(self, user_id: uuid.UUID | str) -> str:
+        return f"auth:user_sessions:{user_id}"
+
+    async def start_session(self, user_id: uuid.UUID) -> tuple[str, str]:
+        """Returns a new (session_id, refresh_jti) pair for a fresh login."""
+        session_id = uuid.uuid4().hex
+        refresh_jti = uuid.uuid4().hex
+
+        pipe = get_redis().pipeline(transaction=True)
+        pipe.set(self._refresh_key(session_id), refresh_jti, ex=self._session_ttl)
+        pipe.sadd(self._user_sessions_key(user_id), session_id)
+        pipe.expire(self._user_sessions_key(user_id), self._session_ttl)
+        await pipe.execute()
+
+        return session_id, refresh_jti
+
+    async def rotate_refresh(
+            self, session_id: str,
+            presented_jti: str,
+    ) -> tuple[RotationResultEnum, str | None]:
+        new_jti = uuid.uuid4().hex
+        result = int(await get_redis().eval(
+            _ROTATE_REFRESH_SCRIPT, 1, self._refresh_key(session_id), presented_jti, new_jti
+        ))
+
+        if result == 1:
+            return RotationResultEnum.ROTATED, new_jti
+
+        if result == 0:
+            logger.warning(f"Refresh token reuse detected for session {session_id}, revoking session")
+            await self.revoke_session(session_id)
+            return RotationResultEnum.REUSED, None
+
+        return RotationResultEnum.UNKNOWN, None
+
+    async def revoke_session(self, session_id: str) -> None:
+        pipe = get_redis().pipeline(transaction=True)
+        pipe.set(self._revoked_key(session_id), 1, ex=self._session_ttl)
+        pipe.delete(self._refresh_key(session_id))
+        await pipe.execute()
+
+    async def revoke_all_user_sessions(self, user_id: uuid.UUID) -> int:
+        redis = get_redis()
+        session_ids = await redis.smembers(self._user_sessions_key(user_id))
+        if not session_ids:
+            return 0
+
+        pipe = redis.pipeline(transaction=True)
+        for session_id in session_ids:
+            pipe.set(self._revoked_key(session_id), 1, ex=self._session_ttl)
+            pipe.delete(self._refresh_key(session_id))
+        pipe.delete(self._user_sessions_key(user_id))
+        await pipe.execute()
+
+        return len(session_ids)
+
+    async def is_session_revoked(self, session_id: str) -> bool:
+        return bool(await get_redis().exists(self._revoked_key(session_id)))
+
+
+token_session_store = TokenSessionStore()
@@ -1,21 +1,29 @@
+import asyncio
 import uuid
 from decimal import Decimal
 from datetime import datetime, timezone, timedelta
 from typing import Any
 from fastapi import HTTPException, status
+from sqlalchemy.orm import aliased
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select, or_, desc, func
 from backend.app.bank_account.models import BankAccount
-from backend.app.transaction.models import Transaction
+from backend.app.transaction.models import Transaction, TransactionReference
+from backend.app.transaction.archive import transaction_archive
 from backend.app.transaction.enums import TransactionStatusEnum, TransactionTypeEnum, TransactionCategoryEnum
 from backend.app.transaction.utils import TransactionFailureReasonEnum
 from backend.app.auth.utils import generate_otp
 from backend.app.core.config import settings
 from backend.app.bank_account.utils import calculate_conversion
-from backend.app.transaction.utils import mark_transaction_failed
+from backend.app.transaction.utils import mark_transaction_failed, apply_transaction_failure
 from backend.app.bank_account.enums import AccountStatusEnum
 from backend.app.auth.models import User
 from backend.app.core.tasks.statement import generate_statement_pdf
+from backend.app.core.ai.risk_engine import risk_engine
+from backend.app.core.velocity.engine import velocity_engine, VelocityLimitExceededError
+from backend.app.api.services.ledger import post_deposit, post_withdrawal, post_transfer, get_balance_at
+from backend.app.api.services.analytics import record_transaction_rollups
+from backend.app.api.services.otp_challenge import otp_challenge_store
 from backend.app.core.logging import get_logger
 
 
@@ -96,6 +104,8 @@ async def process_deposit(
 
         session.add(new_transaction)
         session.add(account)
+        post_deposit(session, transaction=new_transaction, account=account)
+        await record_transaction_rollups(session, transaction=new_transaction)
         await session.commit()
         await session.refresh(new_transaction)
         await session.refresh(account)
@@ -130,15 +140,32 @@ async def initiate_transfer(
         description: str,
         security_answer: str,
         session: AsyncSession
-) -> tuple[Transaction, BankAccount, BankAccount, User, User]:
+) -> tuple[Transaction, BankAccount, BankAccount, User, User, str]:
+    """Create a pending transfer; also returns the OTP to send to the sender."""
     try:
-        receiver_account_result = await session.exec(
-            select(BankAccount).where(BankAccount.account_number == receiver_account_number, BankAccount.user_id == sender_id)
+        # Sender and receiver, each with their owner, in one round trip.
+        result = await session.exec(
+            select(BankAccount, User).join(User).where(
+                or_(
+                    BankAccount.id == sender_account_id,
+                    BankAccount.account_number == receiver_account_number,
+                )
+            )
+        )
+        accounts = result.all()
+        sender_data = next(
+            ((account, user) for account, user in accounts
+             if account.id == sender_account_id and account.user_id == sender_id),
+            None,
+        )
+        receiver_data = next(
+            ((account, user) for account, user in accounts
+             if account.account_number == receiver_account_number),
+            None,
         )
-        receiver_account = receiver_account_result.first()
 
         # Blocks sender from send to self
-        if receiver_account:
+        if receiver_data and receiver_data[0].user_id == sender_id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -148,15 +175,6 @@ async def initiate_transfer(
                 },
             )
 
-        sender_statement = (
-            select(BankAccount, User).join(User).where(
-                BankAccount.id == sender_account_id, BankAccount.user_id == sender_id
-            )
-        )
-
-        sender_result = await session.exec(sender_statement)
-        sender_data = sender_result.first()
-
         # Validate sender is the owner of account
         if not sender_data:
             raise HTTPException(
@@ -189,11 +207,6 @@ async def initiate_transfer(
                 },
             )
 
-        receiver_statement = (select(BankAccount, User).join(User).where(BankAccount.account_number == receiver_account_number)
-                              )
-        receiver_result = await session.exec(receiver_statement)
-        receiver_data = receiver_result.first()
-
         if not receiver_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -270,18 +283,25 @@ async def initiate_transfer(
             }
         )
 
+        risk_assessment = await risk_engine.score_transfer(
+            account_id=sender_account.id,
+            amount=amount,
+            reference=reference,
+        )
+        if risk_assessment:
+            transaction.ai_review_status = risk_assessment.review_status
+
         otp = generate_otp()
-        sender.otp = otp
-        sender.otp_expiry_time = datetime.now(
-            timezone.utc) + timedelta(minutes=settings.OTP_EXPIRATION_MINUTES)
 
         session.add(transaction)
-        # check y should i add sender
-        session.add(sender)
+        await otp_challenge_store.issue(reference=reference, user_id=sender.id, otp=otp, session=session)
         await session.commit()
         await session.refresh(transaction)
 
-        return transaction, sender_account, receiver_account, sender, receiver
+        if risk_assessment:
+            risk_engine.persist(transaction.id, risk_assessment)
+
+        return transaction, sender_account, receiver_account, sender, receiver, otp
     except HTTPException:
         await session.rollback()
         raise
@@ -297,270 +317,266 @@ async def initiate_transfer(
         ) from e
 
 
-async def complete_transfer(
+def _transfer_completion_failure(
         *,
-        reference: str,
+        transaction: Transaction,
+        sender_account: BankAccount,
+        receiver_account: BankAccount,
         otp: str,
-        session: AsyncSession
-) -> tuple[Transaction, BankAccount, BankAccount, User, User]:
-    try:
-        statement = select(Transaction).where(Transaction.reference ==
-                                              reference, Transaction.status == TransactionStatusEnum.PENDING)
+        otp_valid: bool | None,
+        now: datetime,
+) -> tuple[int, TransactionFailureReasonEnum, str, dict] | None:
+    """First reason the locked transfer cannot complete, as (status code, reason, message, details)."""
+    if otp_valid is False:
+        return (
+            status.HTTP_401_UNAUTHORIZED,
+            TransactionFailureReasonEnum.INVALID_OTP,
+            "Invalid OTP",
+            {"provided_otp": otp},
+        )
 
-        result = await session.exec(statement)
-        transaction = result.first()
+    if otp_valid is None:
+        return (
+            status.HTTP_401_UNAUTHORIZED,
+            TransactionFailureReasonEnum.OTP_EXPIRED,
+            "OTP has expired",
+            {"current_time": now.isoformat()},
+        )
 
-        if not transaction:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "status": "error",
-                    "message": "Transfer not found"
-                }
-            )
+    if sender_account.account_status != AccountStatusEnum.Active:
+        return (
+            status.HTTP_400_BAD_REQUEST,
+            TransactionFailureReasonEnum.ACCOUNT_INACTIVE,
+            "Sender account is no longer active",
+            {"account": "sender"},
+        )
 
-         # Get the SENDER'S account
-        sender_account = await session.get(BankAccount, transaction.sender_account_id)
+    if receiver_account.account_status != AccountStatusEnum.Active:
+        return (
+            status.HTTP_400_BAD_REQUEST,
+            TransactionFailureReasonEnum.ACCOUNT_INACTIVE,
+            "Receiver account is no longer active",
+            {"account": "receiver"},
+        )
 
-        # Get the RECEIVER'S account
-        receiver_account = await session.get(BankAccount, transaction.receiver_account_id)
+    balance = Decimal(str(sender_account.balance))
+    if balance < transaction.amount:
+        return (
+            status.HTTP_400_BAD_REQUEST,
+            TransactionFailureReasonEnum.INSUFFICIENT_FUNDS,
+            "Insufficient balance",
+            {
+                "required_amount": str(transaction.amount),
+                "available_balance": str(sender_account.balance),
+                "shortfall": str(transaction.amount - balance)
+            },
+        )
 
-        sender = await session.get(User, transaction.sender_id)
-        receiver = await session.get(User, transaction.receiver_id)
+    if not transaction.transaction_metadata:
+        return (
+            status.HTTP_400_BAD_REQUEST,
+            TransactionFailureReasonEnum.SYSTEM_ERROR,
+            "System error: Missing transaction metadata",
+            {"error": "Missing transaction metadata"},
+        )
 
-        if not all([sender_account, receiver_account, sender, receiver]):
-            await mark_transaction_failed(
-                transaction=transaction,
-                reason=TransactionFailureReasonEnum.INVALID_ACCOUNT,
-                details={
-                    "sender_account_found": bool(sender_account),
-                    "receiver_account_found": bool(receiver_account),
-                    "sender_found": bool(sender),
-                    "receiver_found": bool(receiver)
-                },
-                session=session,
-                error_message="Account information not found"
-            )
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "status": "error",
-                    "message": "Account information not found"
-                }
-            )
+    converted_amount_str = transaction.transaction_metadata.get("converted_amount")
+    if not converted_amount_str:
+        return (
+            status.HTTP_400_BAD_REQUEST,
+            TransactionFailureReasonEnum.SYSTEM_ERROR,
+            "System error: Missing converted amount",
+            {"error": "Missing converted amount"},
+        )
+    try:
+        Decimal(converted_amount_str)
+    except (TypeError, ValueError, ArithmeticError) as e:
+        return (
+            status.HTTP_400_BAD_REQUEST,
+            TransactionFailureReasonEnum.SYSTEM_ERROR,
+            "System error: Invalid converted amount format",
+            {"error": f"Invalid converted amount format: {str(e)}"},
+        )
 
-        if not sender or not sender.otp or sender.otp != otp:
-            await mark_transaction_failed(
-                transaction=transaction,
-                reason=TransactionFailureReasonEnum.INVALID_OTP,
-                details={
-                    "provided_otp": otp,
-                },
-                session=session,
-                error_message="Invalid OTP"
-            )
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail={
-                    "status": "error",
-                    "message": "Invalid OTP"
-                }
-            )
+    return None
 
+
+async def complete_transfer(
+        *,
+        reference: str,
+        otp: str,
+        session: AsyncSession
+) -> tuple[Transaction, BankAccount, BankAccount, User, User]:
+    """
+    Complete a pending transfer once the sender confirms the OTP.
+
+    The transaction is read and locked together with both users, so concurrent
+    completions of the same transfer serialize; both accounts are then locked in
+    id order, like the scheduled transfer executor, so opposite transfers between
+    the same two accounts cannot deadlock. The OTP is redeemed against
+    the transfer's own challenge, the remaining checks run in memory, and the
+    outcome, completed or failed, is written in a single commit.
+    """
+    transaction_key = None
+    velocity_reservation = None
+    try:
+        # Pending transfers are recent, so the created_at bound prunes the lookup
+        # to the newest partitions instead of probing every month.
         now = datetime.now(timezone.utc)
-        if (not sender.otp_expiry_time or now > sender.otp_expiry_time):
-            await mark_transaction_failed(
-                transaction=transaction,
-                reason=TransactionFailureReasonEnum.OTP_EXPIRED,
-                details={
-                    "expiry_time": (
-                        sender.otp_expiry_time.isoformat() if sender.otp_expiry_time else None
-                    ),
-                    "current_time": now.isoformat()
-                },
-                session=session,
-                error_message="OTP has expired"
-            )
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail={
-                    "status": "error",
-                    "message": "OTP has expired"
-                }
+        pending_since = now - timedelta(hours=settings.TRANSACTION_PENDING_LOOKBACK_HOURS)
+        sender_table = aliased(User)
+        receiver_table = aliased(User)
+        statement = (
+            select(Transaction, sender_table, receiver_table)
+            .join(sender_table, sender_table.id == Transaction.sender_id)
+            .join(receiver_table, receiver_table.id == Transaction.receiver_id)
+            .where(
+                Transaction.reference == reference,
+                Transaction.status == TransactionStatusEnum.PENDING,
+                Transaction.created_at >= pending_since,
             )
+            .with_for_update(of=Transaction)
+        )
 
-        if sender_account and sender_account.account_status != AccountStatusEnum.Active:
-            await mark_transaction_failed(
-                transaction=transaction,
-                reason=TransactionFailureReasonEnum.ACCOUNT_INACTIVE,
-                details={"account": "sender"},
-                session=session,
-                error_message="Sender account is no longer active"
-            )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "status": "error",
-                    "message": "Sender account is no longer active"
-                }
+        result = await session.exec(statement)
+        row = result.first()
+        accounts = {}
+        if row:
+            transaction, sender, receiver = row
+            transaction_key = (transaction.id, transaction.created_at)
+            accounts_result = await session.exec(
+                select(BankAccount)
+                .where(BankAccount.id.in_([transaction.sender_account_id, transaction.receiver_account_id]))
+                .order_by(BankAccount.id)
+                .with_for_update()
             )
+            accounts = {account.id: account for account in accounts_result.all()}
 
-        if receiver_account and receiver_account.account_status != AccountStatusEnum.Active:
-            await mark_transaction_failed(
-                transaction=transaction,
-                reason=TransactionFailureReasonEnum.ACCOUNT_INACTIVE,
-                details={"account": "receiver"},
-                session=session,
-                error_message="Receiver account is no longer active"
-            )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "status": "error",
-                    "message": "Receiver account is no longer active"
-                }
-            )
-        if not sender_account:
+        if not row or transaction.sender_account_id not in accounts or transaction.receiver_account_id not in accounts:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
                     "status": "error",
-                    "message": "Sender account not found"
+                    "message": "Transfer not found"
                 }
             )
 
-        if Decimal(str(sender_account.balance)) < transaction.amount:
-            await mark_transaction_failed(
-                transaction=transaction,
-                reason=TransactionFailureReasonEnum.INSUFFICIENT_FUNDS,
-                details={"required_amount": str(transaction.amount),
-                         "available_balance": str(sender_account.balance),
-                         "shortfall": str(transaction.amount - Decimal(str(sender_account.balance)))
-                         },
-                session=session,
-                error_message="Insufficient balance"
+        sender_account = accounts[transaction.sender_account_id]
+        receiver_account = accounts[transaction.receiver_account_id]
+
+        # Reserve before the OTP is redeemed: if the velocity check cannot run the
+        # transfer stays pending with its OTP intact, and a limit hit closes it
+        # with its own reason instead of leaving a consumed OTP behind.
+        try:
+            velocity_reservation = await velocity_engine.reserve(
+                amount=float(transaction.amount),
+                account_id=sender_account.id,
+                account_type=sender_account.account_type,
+                now=now,
             )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "status": "error",
-                    "message": "Insufficient balance"
-                }
+        except VelocityLimitExceededError as e:
+            failure = (
+                e.status_code,
+                TransactionFailureReasonEnum.VELOCITY_LIMIT_EXCEEDED,
+                e.detail["message"],
+                {"amount": str(transaction.amount)},
             )
-
-        if not transaction.transaction_metadata:
-            await mark_transaction_failed(
-                transaction=transaction,
-                reason=TransactionFailureReasonEnum.SYSTEM_ERROR,
-                details={"error": "Missing transaction metadata"},
+        else:
+            otp_valid = await otp_challenge_store.redeem(
+                reference=transaction.reference,
+                user_id=transaction.sender_id,
+                otp=otp,
                 session=session,
-                error_message="System error: Missing transaction metadata"
             )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "status": "error",
-                    "message": "System error: Missing transaction metadata"
-                }
-            )
-
-        converted_amount_str = transaction.transaction_metadata.get(
-            "converted_amount")
-        if not converted_amount_str:
-            await mark_transaction_failed(
+            failure = _transfer_completion_failure(
                 transaction=transaction,
-                reason=TransactionFailureReasonEnum.SYSTEM_ERROR,
-                details={"error": "Missing converted amount"},
-                session=session,
-                error_message="System error: Missing converted amount"
+                sender_account=sender_account,
+                receiver_account=receiver_account,
+                otp=otp,
+                otp_valid=otp_valid,
+                now=now,
             )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "status": "error",
-                    "message": "System error: Missing converted amount"
-                }
+        if failure:
+            status_code, reason, message, details = failure
+            failure_details = apply_transaction_failure(
+                transaction, reason, details, message,
+                status=(
+                    TransactionStatusEnum.EXPIRED
+                    if reason == TransactionFailureReasonEnum.OTP_EXPIRED
+                    else TransactionStatusEnum.FAILED
+                ),
             )
-        try:
-            converted_amount = Decimal(converted_amount_str)
-        except (TypeError, ValueError) as e:
-            await mark_transaction_failed(
-                transaction=transaction,
-                reason=TransactionFailureReasonEnum.SYSTEM_ERROR,
-                details={
-                    "error": f"Invalid converted amount format: {str(e)}"},
-                session=session,
-                error_message="System error: Invalid converted amount format"
+            session.add(transaction)
+            await session.commit()
+            logger.error(
+                f"Transaction {transaction.reference} marked as {transaction.status.value}",
+                extra={
+                    "reference": transaction.reference,
+                    "reason": reason.value,
+                    "details": failure_details,
+                }
             )
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=status_code,
                 detail={
                     "status": "error",
-                    "message": "System error: Invalid converted amount format"
+                    "message": message
                 }
-            ) from e
+            )
+
+        converted_amount = Decimal(transaction.transaction_metadata["converted_amount"])
 
         sender_account.balance = float(
             Decimal(str(sender_account.balance)) - transaction.amount
         )
-
-        if not receiver_account:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "status": "error",
-                    "message": "Receiver account not found"
-                }
-            )
-
         receiver_account.balance = float(
             Decimal(str(receiver_account.balance)) + converted_amount
         )
 
         transaction.status = TransactionStatusEnum.COMPLETED
-        transaction.completed_at = datetime.now(timezone.utc)
-
-        sender.otp = ""
-        sender.otp_expiry_time = None
+        transaction.completed_at = now
 
         session.add(transaction)
         session.add(sender_account)
         session.add(receiver_account)
-        session.add(sender)
-        session.add(receiver)
+        post_transfer(
+            session,
+            transaction=transaction,
+            sender_account=sender_account,
+            receiver_account=receiver_account,
+            converted_amount=converted_amount,
+        )
+        await record_transaction_rollups(session, transaction=transaction)
 
         await session.commit()
+        velocity_reservation = None
 
-        await session.refresh(transaction)
-        await session.refresh(sender_account)
-        await session.refresh(receiver_account)
-        await session.refresh(sender)
-        await session.refresh(receiver)
-
-        if not receiver:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "status": "error",
-                    "message": "Receiver not found"
-                }
-            )
         return transaction, sender_account, receiver_account, sender, receiver
 
     except HTTPException:
         await session.rollback()
+        await velocity_engine.release(velocity_reservation)
         raise
     except Exception as e:
-        if transaction:
-            await mark_transaction_failed(
-                transaction=transaction,
-                reason=TransactionFailureReasonEnum.SYSTEM_ERROR,
-                details={"error": str(e)},
-                session=session,
-                error_message=" A system error occurred"
-            )
+        await velocity_engine.release(velocity_reservation)
         await session.rollback()
         logger.error(f"Failed to complete transfer: {e}")
+        # The OTP may already be redeemed, so close the transfer rather than leave
+        # it pending. The rollback expired the loaded rows; reload by key.
+        if transaction_key:
+            try:
+                transaction = await session.get(Transaction, transaction_key)
+                if transaction and transaction.status == TransactionStatusEnum.PENDING:
+                    await mark_transaction_failed(
+                        transaction=transaction,
+                        reason=TransactionFailureReasonEnum.SYSTEM_ERROR,
+                        details={"error": str(e)},
+                        session=session,
+                        error_message=" A system error occurred"
+                    )
+            except Exception as mark_error:
+                await session.rollback()
+                logger.error(f"Failed to mark transfer {reference} as failed: {mark_error}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -568,7 +584,8 @@ async def complete_transfer(
                 "message": "Failed to complete the transfer"
             }
         ) from e
-    
+
+
 async def process_withdrawal(
         *,
         amount: Decimal,
@@ -577,6 +594,7 @@ async def process_withdrawal(
         description: str,
         session: AsyncSession,
 ) -> tuple[Transaction, BankAccount, User]:
+    velocity_reservation = None
     try:
         statement = (
             select(BankAccount, User).join(User).where(
@@ -637,11 +655,20 @@ async def process_withdrawal(
             }
         )
 
+        velocity_reservation = await velocity_engine.reserve(
+            amount=float(amount),
+            account_id=account.id,
+            account_type=account.account_type,
+        )
+
         account.balance = float(balance_after)
 
         session.add(new_transaction)
         session.add(account)
+        post_withdrawal(session, transaction=new_transaction, account=account)
+        await record_transaction_rollups(session, transaction=new_transaction)
         await session.commit()
+        velocity_reservation = None
         await session.refresh(new_transaction)
         await session.refresh(account)
 
@@ -652,9 +679,11 @@ async def process_withdrawal(
 
     except HTTPException as httpex:
         await session.rollback()
+        await velocity_engine.release(velocity_reservation)
         raise httpex
     except Exception as e:
         await session.rollback()
+        await velocity_engine.release(velocity_reservation)
         logger.error(
             f"Failed to process withdrawal for account {account_number}: {e}")
         raise HTTPException(
@@ -773,6 +802,33 @@ async def get_user_transactions(
             }
         ) from e
 
+async def find_transaction_by_reference(
+        *,
+        reference: str,
+        session: AsyncSession,
+) -> Transaction | None:
+    """
+    Look a transaction up by reference in the hot table or, once archived, in its
+    archive file. transaction_reference supplies the created_at that prunes the
+    table lookup to one partition.
+    """
+    index_entry = await session.get(TransactionReference, reference)
+    if not index_entry:
+        return None
+
+    if index_entry.archived_in:
+        return await asyncio.to_thread(
+            transaction_archive.read_reference, index_entry.archived_in, reference
+        )
+
+    statement = select(Transaction).where(
+        Transaction.reference == reference,
+        Transaction.created_at == index_entry.created_at,
+    )
+    result = await session.exec(statement)
+    return result.first()
+
+
 async def get_user_statement_data(
     user_id: uuid.UUID,
     session: AsyncSession,
@@ -852,12 +908,19 @@ async def prepare_statement_data(
 
         for account in accounts:
             if account.account_number:
+                opening_balance = await get_balance_at(session, account_id=account.id, ts=start_date)
+                # end_date is inclusive
+                closing_balance = await get_balance_at(
+                    session, account_id=account.id, ts=end_date + timedelta(microseconds=1)
+                )
                 account_details.append({
                     "account_number": account.account_number,
                     "account_name": account.account_name,
                     "account_type": account.account_type.value,
                     "account_currency": account.account_currency.value,
                     "balance": account.balance,
+                    "opening_balance": str(opening_balance),
+                    "closing_balance": str(closing_balance),
                 })
         account_ids = [account.id for account in accounts]
 
@@ -872,7 +935,21 @@ async def prepare_statement_data(
         ).order_by(desc(Transaction.created_at))
         
         transaction_result = await session.exec(transaction_stmt)
-        transactions = transaction_result.all()
+        transactions = list(transaction_result.all())
+
+        # Months past the archive horizon live in Parquet files. A month that is
+        # mid-archival can be in both, so rows already read from the table win.
+        archived = await asyncio.to_thread(
+            transaction_archive.read_accounts,
+            account_ids,
+            start_date,
+            end_date,
+            TransactionStatusEnum.COMPLETED,
+        )
+        if archived:
+            hot_ids = {txn.id for txn in transactions}
+            transactions += [txn for txn in archived if txn.id not in hot_ids]
+            transactions.sort(key=lambda txn: txn.created_at, reverse=True)
 
         user_data = {
             "username": user.username,
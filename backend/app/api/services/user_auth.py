@@ -2,7 +2,7 @@ import asyncio
 import jwt
 import uuid
 from fastapi import HTTPException, status
-from sqlmodel import select
+from sqlmodel import select, func
 from sqlmodel.ext.asyncio.session import AsyncSession
 from backend.app.auth.models import User
 from backend.app.auth.schema import AccountStatusSchema, UserCreateSchema
@@ -19,6 +19,10 @@ from backend.app.core.services.activation_email import send_activation_email
 from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
 from backend.app.core.services.account_lockout import send_account_lockout_email
+from backend.app.api.services.auth_state import auth_state_store
+from backend.app.api.services.token_session import token_session_store
+from backend.app.core.hashing.config import HashPurposeEnum
+from backend.app.core.hashing.policy import hash_policy
 
 logger = get_logger()
 
@@ -77,8 +81,52 @@ class UserAuthService:
             self, plain_password: str,
             hashed_password: str
     ) -> bool:
-        return verify_password(plain_password, hashed_password)
+        return await verify_password(plain_password, hashed_password)
     
+    async def upgrade_password_hash_if_needed(
+            self, user: User,
+            plain_password: str,
+            session: AsyncSession
+    ) -> bool:
+        if not hash_policy.needs_rehash(user.hashed_password, HashPurposeEnum.PASSWORD):
+            return False
+
+        user.hashed_password = await generate_password_hash(plain_password)
+        await session.commit()
+        await session.refresh(user)
+
+        logger.info(f"Password hash for user {user.email} upgraded to current parameters")
+        return True
+
+    async def get_password_hash_population(self, session: AsyncSession) -> dict:
+        algorithm = func.split_part(User.hashed_password, "$", 2)
+        params = func.split_part(User.hashed_password, "$", 4)
+        statement = (
+            select(algorithm, params, func.count())
+            .group_by(algorithm, params)
+            .order_by(func.count().desc())
+        )
+        result = await session.exec(statement)
+        rows = result.all()
+
+        target_params = hash_policy.encoded_params(HashPurposeEnum.PASSWORD)
+        total = sum(count for _, _, count in rows)
+        outdated = sum(
+            count for algo, encoded, count in rows
+            if algo != "argon2id" or encoded != target_params
+        )
+
+        return {
+            "target_params": target_params,
+            "total_users": total,
+            "outdated_users": outdated,
+            "outdated_ratio": round(outdated / total, 4) if total else 0.0,
+            "breakdown": [
+                {"algorithm": algo, "params": encoded, "count": count}
+                for algo, encoded, count in rows
+            ],
+        }
+
     async def reset_user_state(
             self, user: User,
             session: AsyncSession,
@@ -88,18 +136,29 @@ class UserAuthService:
     ) -> None:
         previous_status = user.account_status
 
-        user.failed_login_attempts = 0
-        user.last_failed_login = None
-        
+        await auth_state_store.clear_failed_logins(user.id)
         if clear_otp:
+            await auth_state_store.clear_otp(user.id)
+
+        # Only touch the user row when there is persisted state to undo.
+        changed = False
+        if user.failed_login_attempts or user.last_failed_login is not None:
+            user.failed_login_attempts = 0
+            user.last_failed_login = None
+            changed = True
+
+        if clear_otp and (user.otp or user.otp_expiry_time is not None):
             user.otp = ""
             user.otp_expiry_time = None
+            changed = True
 
         if user.account_status == AccountStatusSchema.LOCKED:
             user.account_status = AccountStatusSchema.ACTIVE
+            changed = True
 
-        await session.commit()
-        await session.refresh(user)
+        if changed:
+            await session.commit()
+            await session.refresh(user)
 
         if log_action and previous_status != user.account_status:
             logger.info(f"User {user.email} state reset: {previous_status} -> {user.account_status}")
@@ -141,11 +200,7 @@ class UserAuthService:
     ) -> tuple[bool, str]:
         try:
             otp = generate_otp()
-            user.otp = otp
-            user.otp_expiry_time = datetime.now(timezone.utc) + timedelta(minutes=settings.OTP_EXPIRATION_MINUTES)
-
-            await session.commit()
-            await session.refresh(user)
+            await auth_state_store.store_otp(user.id, otp)
 
             for attempt in range(3):
                 try:
@@ -155,10 +210,7 @@ class UserAuthService:
                 except Exception as e:
                     logger.error(f"Failed to send OTP email(attempt {attempt + 1}): {e}")
                     if attempt == 2:
-                        user.otp=""
-                        user.otp_expiry_time=None
-                        await session.commit()
-                        await session.refresh(user)
+                        await auth_state_store.clear_otp(user.id)
                         return False, ""
                     
                     await asyncio.sleep(2**attempt)
@@ -166,10 +218,7 @@ class UserAuthService:
                 
         except Exception as e:
             logger.error(f"Failed to generate and save OTP: {e}")
-            user.otp = ""
-            user.otp_expiry_time = None
-            await session.commit()
-            await session.refresh(user)
+            await auth_state_store.clear_otp(user.id)
             return False, ""
 
     async def create_user(self, user_data: UserCreateSchema, session: AsyncSession) -> User:
@@ -185,7 +234,7 @@ class UserAuthService:
         password = user_data_dict.pop("password")
         new_user = User(
             username=generate_username(),
-            hashed_password=generate_password_hash(password),
+            hashed_password=await generate_password_hash(password),
             is_active=False,
             account_status=AccountStatusSchema.PENDING,
             **user_data_dict,
@@ -279,7 +328,9 @@ class UserAuthService:
 
             await self.check_user_lockout(user, session)
 
-            if not user.otp or user.otp != otp:
+            otp_valid = await auth_state_store.redeem_otp(user.id, otp)
+
+            if otp_valid is False:
                 await self.increment_failed_login_attempts(user, session)
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -289,7 +340,7 @@ class UserAuthService:
                         "action": "Please check your OTP and try again"
                     }
                 )
-            if user.otp_expiry_time is None or user.otp_expiry_time < datetime.now(timezone.utc):
+            if otp_valid is None:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail={
@@ -345,14 +396,19 @@ class UserAuthService:
         )
 
 
-    async def increment_failed_login_attempts(self, user: User, session: AsyncSession)-> None:
-        user.failed_login_attempts += 1
-
-        current_time = datetime.now(timezone.utc)
-        user.last_failed_login = current_time
+    async def increment_failed_login_attempts(self, user: User, session: AsyncSession)-> int:
+        failed_attempts = await auth_state_store.record_failed_login(user.id)
 
-        if user.failed_login_attempts >= settings.LOGIN_ATTEMPTS:
+        if failed_attempts >= settings.LOGIN_ATTEMPTS:
+            current_time = datetime.now(timezone.utc)
+            user.failed_login_attempts = failed_attempts
+            user.last_failed_login = current_time
             user.account_status = AccountStatusSchema.LOCKED
+
+            await session.commit()
+            await session.refresh(user)
+            await auth_state_store.clear_failed_logins(user.id)
+
             try:
                 await send_account_lockout_email(user.email, current_time)
                 logger.info(f"Lockout notification email sent to {user.email}")
@@ -360,8 +416,7 @@ class UserAuthService:
                 logger.error(f"Failed to send lockout notification email to {user.email}: {e}")
             logger.warning(f"User {user.email} has been locked out due to failed login attempts")
 
-        await session.commit()
-        await session.refresh(user)
+        return failed_attempts
 
     
     async def reset_password(
@@ -387,14 +442,15 @@ class UserAuthService:
                         "message": "User not found"
                     }
                 )
-            user.hashed_password = generate_password_hash(new_password)
+            user.hashed_password = await generate_password_hash(new_password)
 
             await self.reset_user_state(user, session, clear_otp=True, log_action=True)
 
             await session.commit()
             await session.refresh(user)
 
-            logger.info(f"Password reset successfully for user {user.email}")
+            revoked = await token_session_store.revoke_all_user_sessions(user.id)
+            logger.info(f"Password reset successfully for user {user.email}, {revoked} sessions revoked")
         except jwt.ExpiredSignatureError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,10 +1,10 @@
 import uuid
 from typing import TYPE_CHECKING
 from datetime import datetime, timezone
-from sqlmodel import Field, Column, Relationship
+from sqlmodel import Field, Column, Relationship, SQLModel
 from pydantic import computed_field
 from sqlalchemy.dialects import postgresql as pg
-from sqlalchemy import text, func
+from sqlalchemy import text, func, Index, Computed, Text, event, DDL
 from backend.app.auth.schema import BaseUserSchema, RoleChoicesSchema
 
 if TYPE_CHECKING:
@@ -13,7 +13,23 @@ if TYPE_CHECKING:
     from backend.app.bank_account.models import BankAccount
     from backend.app.transaction.models import Transaction
 
+_SEARCH_TEXT = (
+    "lower(first_name || ' ' || coalesce(middle_name, '') || ' ' || last_name"
+    " || ' ' || coalesce(username, '') || ' ' || email)"
+)
+
+# Trigram operators and index classes used by customer search.
+event.listen(SQLModel.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
 class User(BaseUserSchema, table=True): # type: ignore
+    # Keyset pagination of the profile listing, unfiltered and by role or status.
+    __table_args__ = (
+        Index("ix_user_created_id", "created_at", "id"),
+        Index("ix_user_role_created_id", "role", "created_at", "id"),
+        Index("ix_user_status_created_id", "account_status", "created_at", "id"),
+    )
+
 
     id: uuid.UUID = Field(
         sa_column=Column(
@@ -77,4 +93,26 @@ class User(BaseUserSchema, table=True): # type: ignore
         return full_name.title().strip()
     
     def has_role(self, role: RoleChoicesSchema) -> bool:
-        return self.role.value == role.value
\ No newline at end of file
+        return self.role.value == role.value
+
+
+# Customer search columns, generated by Postgres from the name, username and email.
+# Table-only rather than mapped fields, so loading a User (e.g. on every
+# authenticated request) never fetches them; search reads them through
+# User.__table__.c.
+User.__table__.append_column(Column("search_text", Text, Computed(_SEARCH_TEXT, persisted=True)))
+User.__table__.append_column(
+    Column(
+        "search_vector",
+        pg.TSVECTOR,
+        Computed(f"to_tsvector('simple'::regconfig, {_SEARCH_TEXT})", persisted=True),
+    )
+)
+# Prefix matching on the tsvector, typo-tolerant trigram matching on the lowercased text.
+Index("ix_user_search_vector", User.__table__.c.search_vector, postgresql_using="gin")
+Index(
+    "ix_user_search_text_trgm",
+    User.__table__.c.search_text,
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+)
\ No newline at end of file
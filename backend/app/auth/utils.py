@@ -6,23 +6,18 @@ import jwt
 from datetime import datetime, timedelta, timezone
 from backend.app.core.config import settings
 from fastapi import Response
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
-
-_ph = PasswordHasher()
+from backend.app.core.hashing.config import HashPurposeEnum
+from backend.app.core.hashing.service import hashing_service
 
 def generate_otp(length: int = 6) -> str:
     otp = "".join(secrets.choice(string.digits) for _ in range(length))
     return otp
 
-def generate_password_hash(password: str)-> str:
-    return _ph.hash(password)
+async def generate_password_hash(password: str)-> str:
+    return await hashing_service.hash(password, HashPurposeEnum.PASSWORD)
 
-def verify_password(password: str, hashed_password: str) -> bool:
-    try:
-        return _ph.verify(hashed_password, password)
-    except VerifyMismatchError:
-        return False
+async def verify_password(password: str, hashed_password: str) -> bool:
+    return await hashing_service.verify(hashed_password, password, HashPurposeEnum.PASSWORD)
     
 def generate_username()-> str:
     bank_name = settings.SITE_NAME
@@ -44,7 +39,12 @@ def create_activation_token(id: uuid.UUID)-> str:
 
 
 
-def create_jwt_token(id: uuid.UUID, type: str = settings.COOKIE_ACCESS_NAME) -> str:
+def create_jwt_token(
+        id: uuid.UUID,
+        type: str = settings.COOKIE_ACCESS_NAME,
+        session_id: str | None = None,
+        jti: str | None = None,
+) -> str:
     if type == settings.COOKIE_ACCESS_NAME:
         expire_delta = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
     elif type == settings.COOKIE_REFRESH_NAME:
@@ -55,9 +55,12 @@ def create_jwt_token(id: uuid.UUID, type: str = settings.COOKIE_ACCESS_NAME) ->
     payload = {
         "id": str(id),
         "type": type,
+        "jti": jti or uuid.uuid4().hex,
         "exp": datetime.now(timezone.utc) + expire_delta,
         "iat": datetime.now(timezone.utc),
     }
+    if session_id:
+        payload["sid"] = session_id
     return jwt.encode(payload, settings.SIGNING_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 from datetime import datetime, timezone
 from sqlmodel import Field, Column, Relationship
 from sqlalchemy.dialects import postgresql as pg
-from sqlalchemy import text, func
+from sqlalchemy import text, func, Index
 from backend.app.bank_account.schema import BankAccountBaseSchema
 
 if TYPE_CHECKING:
@@ -13,6 +13,17 @@ if TYPE_CHECKING:
 
 
 class BankAccount(BankAccountBaseSchema, table=True): # type: ignore
+    # Serves per-user account lookups and the profile listing's KYC filter.
+    __table_args__ = (
+        Index("ix_bankaccount_user_kyc", "user_id", "kyc_verified", "kyc_submitted"),
+        # Prefix search on account numbers.
+        Index(
+            "ix_bankaccount_account_number_prefix",
+            "account_number",
+            postgresql_ops={"account_number": "varchar_pattern_ops"},
+        ),
+    )
+
     id: uuid.UUID = Field(
         sa_column=Column(
             pg.UUID(as_uuid=True),
@@ -61,4 +61,9 @@ class BankAccountReadSchema(BankAccountBaseSchema):
 class BankAccountUpdateSchema(SQLModel):
     account_name: str | None = None
     is_primary: bool | None = None
-    account_status: AccountStatusEnum | None = None
\ No newline at end of file
+    account_status: AccountStatusEnum | None = None
+
+class NameEnquiryResponseSchema(SQLModel):
+    account_number: str
+    account_name: str
+    account_currency: AccountCurrencyEnum
@@ -0,0 +1,300 @@
+"""
+Offline re-scoring of historical transfers.
+
+Accounts are split across a process pool by hashtext(sender_account_id). Each worker
+walks its accounts in keyset order, loads every transfer of a batch of accounts
+into one DataFrame, computes the same features as the online engine with
+vectorized per-account windows and bulk-upserts TransactionRiskScore rows for the
+serving model version through COPY into a staging table. When a trained fraud
+model is registered it is loaded once in the parent and inherited by the workers,
+and its probabilities replace the rule-based score.
+
+Usage:
+    python -m backend.app.core.ai.batch_scoring --workers 8 --accounts-per-chunk 2000
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import numpy as np
+import pandas as pd
+from backend.app.core.ai.config import ai_settings
+from backend.app.core.ai.predictor import fraud_predictor
+from backend.app.core.ai.risk_engine import MIN_AMOUNT_HISTORY, MODEL_FEATURES, weighted_sum
+from backend.app.core.db import task_engine
+from backend.app.core.logging import get_logger
+from backend.app.transaction.enums import TransactionTypeEnum
+
+logger = get_logger()
+
+_NIL_ACCOUNT = uuid.UUID(int=0)
+
+_ACCOUNTS_SQL = """
+SELECT DISTINCT sender_account_id
+FROM "transaction"
+WHERE transaction_type = $1
+  AND sender_account_id > $2
+  AND abs(hashtext(sender_account_id::text)::bigint) % $3 = $4
+ORDER BY sender_account_id
+LIMIT $5
+"""
+
+_TRANSFERS_SQL = """
+SELECT id, sender_account_id AS account_id, amount, created_at
+FROM "transaction"
+WHERE transaction_type = $1
+  AND sender_account_id = ANY($2::uuid[])
+ORDER BY sender_account_id, created_at
+"""
+
+_STAGING_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS risk_score_staging
+(LIKE transaction_risk_scores INCLUDING DEFAULTS)
+ON COMMIT DELETE ROWS
+"""
+
+_UPSERT_SQL = """
+INSERT INTO transaction_risk_scores (id, transaction_id, risk_score, risk_factors, ai_model_version, created_at)
+SELECT id, transaction_id, risk_score, risk_factors, ai_model_version, created_at
+FROM risk_score_staging
+ON CONFLICT ON CONSTRAINT uq_risk_score_transaction_version
+DO UPDATE SET risk_score = EXCLUDED.risk_score, risk_factors = EXCLUDED.risk_factors
+"""
+
+_STAGING_COLUMNS = ["id", "transaction_id", "risk_score", "risk_factors", "ai_model_version"]
+
+
+def _trailing(frame: pd.DataFrame, keys: list[str], window: str, how: str) -> np.ndarray:
+    """Per-group aggregate of `amount` over the window strictly before each row."""
+    grouped = frame.groupby(keys, sort=False)
+    rolled = grouped.rolling(window, on="created_at", closed="left")["amount"]
+    # Rolling with `on` indexes the result by created_at, not by row, and emits
+    # rows in the order of the groups' row positions; map them back through those.
+    order = np.concatenate(list(grouped.indices.values()))
+    values = np.empty(len(frame))
+    values[order] = getattr(rolled, how)().to_numpy()
+    return np.nan_to_num(values, nan=0.0)
+
+
+def _decayed_amount_stats(frame: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Exponentially decayed weight, mean and variance of each account's earlier amounts,
+    matching the online engine's incremental update. Weights are expressed relative
+    to the account's first transfer so the exponentials stay in range.
+    """
+    decay = int(ai_settings.ANALYSIS_WINDOW_DAYS) * 24 * 60 * 60
+    amount = frame["amount"].to_numpy()
+    seconds = (frame["created_at"] - pd.Timestamp(0, tz="UTC")).dt.total_seconds().to_numpy()
+    first = pd.Series(seconds).groupby(frame["account_id"].to_numpy()).transform("min").to_numpy()
+    elapsed = (seconds - first) / decay
+
+    growth = np.exp(elapsed)
+    shrink = np.exp(-elapsed)
+    accounts = frame["account_id"].to_numpy()
+
+    def prior_sum(values: np.ndarray) -> np.ndarray:
+        return pd.Series(values).groupby(accounts).cumsum().to_numpy() - values
+
+    weight = prior_sum(growth) * shrink
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(weight > 0, prior_sum(growth * amount) * shrink / weight, 0.0)
+        second = np.where(weight > 0, prior_sum(growth * amount * amount) * shrink / weight, 0.0)
+    variance = np.maximum(second - mean * mean, 0.0)
+    return weight, mean, variance
+
+
+def compute_features(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorized counterpart of risk_engine.score_features. Expects account_id,
+    created_at (UTC) and amount, sorted by account_id then created_at.
+    """
+    frame = frame.reset_index(drop=True)
+    amount = frame["amount"].to_numpy()
+
+    weight, mean, variance = _decayed_amount_stats(frame)
+    absolute = np.clip(amount / ai_settings.HIGH_AMOUNT_THRESHOLD, 0.0, 1.0)
+    std = np.maximum.reduce([np.sqrt(variance), mean * 0.1, np.ones_like(mean)])
+    deviation = np.clip((amount - mean) / (3 * std), 0.0, 1.0)
+    amount_feature = np.where(weight >= MIN_AMOUNT_HISTORY, np.maximum(absolute, deviation), absolute)
+
+    hour = frame["created_at"].dt.hour.to_numpy()
+    weekday = frame["created_at"].dt.weekday.to_numpy()
+    banking = (hour >= ai_settings.BANKING_HOURS_START) & (hour < ai_settings.BANKING_HOURS_END)
+    late = (hour >= ai_settings.LATE_HOURS_START) | (hour < ai_settings.LATE_HOURS_END)
+    time_feature = weighted_sum(
+        {
+            "time_of_day": np.select(
+                [banking, late],
+                [ai_settings.BANKING_HOURS_RISK, ai_settings.LATE_HOURS_RISK],
+                ai_settings.OFF_HOURS_RISK,
+            ),
+            "day_of_week": np.where(
+                weekday >= 5, ai_settings.OFF_HOURS_RISK, ai_settings.BANKING_HOURS_RISK
+            ),
+        },
+        ai_settings.TIME_RISK_WEIGHTS,
+    )
+
+    recent = _trailing(frame, ["account_id"], f"{ai_settings.FREQUENCY_WINDOW_MINUTES}min", "count")
+    rapid = _trailing(frame, ["account_id"], f"{ai_settings.RAPID_TRANSFER_WINDOW_MINUTES}min", "count")
+    velocity = _trailing(frame, ["account_id"], f"{ai_settings.VELOCITY_WINDOW_HOURS}h", "sum")
+
+    frame["amount_key"] = np.round(amount, 2)
+    repeated = _trailing(
+        frame, ["account_id", "amount_key"], f"{ai_settings.VELOCITY_WINDOW_HOURS}h", "count"
+    ) > 0
+
+    round_amounts = np.select(
+        [(amount >= 1000) & (amount % 1000 == 0), (amount >= 100) & (amount % 100 == 0)],
+        [1.0, 0.5],
+        0.0,
+    )
+    patterns = weighted_sum(
+        {
+            "round_amounts": round_amounts,
+            "repeated_amounts": repeated.astype(float),
+            "velocity": np.clip(rapid / ai_settings.RAPID_TRANSFER_COUNT, 0.0, 1.0),
+        },
+        ai_settings.PATTERN_WEIGHTS,
+    )
+
+    features = {
+        "amount": amount_feature,
+        "time": time_feature,
+        "frequency": np.clip((recent + 1) / ai_settings.FREQUENCY_THRESHOLD, 0.0, 1.0),
+        "patterns": patterns,
+        "velocity_amount": np.clip(
+            (velocity + amount) / ai_settings.VELOCITY_THRESHOLD, 0.0, 1.0
+        ),
+    }
+    scored = pd.DataFrame({name: np.round(values, 4) for name, values in features.items()})
+    scored["recent_transfers"] = recent.astype(np.int64)
+    scored["rapid_transfers"] = rapid.astype(np.int64)
+    scored["velocity_amount_window"] = np.round(velocity, 2)
+    scored["risk_score"] = np.round(
+        np.clip(weighted_sum(features, ai_settings.RISK_WEIGHTS), 0.0, 1.0), 4
+    )
+    scored["transaction_id"] = frame["id"].to_numpy()
+    return scored
+
+
+def _model_version() -> str:
+    return fraud_predictor.version if fraud_predictor.available else ai_settings.MODEL_VERSION
+
+
+def _apply_model(scored: pd.DataFrame) -> pd.DataFrame:
+    if not fraud_predictor.available:
+        return scored
+    scored["rule_score"] = scored["risk_score"]
+    rows = scored[fraud_predictor.features].to_numpy(dtype=np.float64)
+    scored["risk_score"] = np.round(fraud_predictor.predict_many(rows), 4)
+    return scored
+
+
+def _staging_records(scored: pd.DataFrame) -> list[tuple]:
+    factor_columns = MODEL_FEATURES + (["rule_score"] if "rule_score" in scored else [])
+    factors = scored[factor_columns].to_json(orient="records", lines=True).splitlines()
+    return list(
+        zip(
+            (uuid.uuid4() for _ in range(len(scored))),
+            scored["transaction_id"],
+            scored["risk_score"].astype(float),
+            factors,
+            repeat(_model_version()),
+        )
+    )
+
+
+async def _score_partition_async(partition: int, partitions: int, accounts_per_chunk: int) -> int:
+    transfer = TransactionTypeEnum.TRANSFER.name
+    last_account = _NIL_ACCOUNT
+    scored_rows = 0
+
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        await driver.execute(_STAGING_SQL)
+
+        while True:
+            started = time.perf_counter()
+            accounts = [
+                row["sender_account_id"]
+                for row in await driver.fetch(
+                    _ACCOUNTS_SQL, transfer, last_account, partitions, partition, accounts_per_chunk
+                )
+            ]
+            if not accounts:
+                break
+            last_account = accounts[-1]
+
+            rows = await driver.fetch(_TRANSFERS_SQL, transfer, accounts)
+            if not rows:
+                continue
+
+            frame = pd.DataFrame.from_records(
+                rows, columns=["id", "account_id", "amount", "created_at"]
+            )
+            frame["amount"] = frame["amount"].astype(float)
+            frame["created_at"] = pd.to_datetime(frame["created_at"], utc=True)
+            records = _staging_records(_apply_model(compute_features(frame)))
+
+            async with driver.transaction():
+                await driver.copy_records_to_table(
+                    "risk_score_staging", records=records, columns=_STAGING_COLUMNS
+                )
+                await driver.execute(_UPSERT_SQL)
+
+            scored_rows += len(records)
+            elapsed = time.perf_counter() - started
+            logger.info(
+                f"Partition {partition}/{partitions}: scored {len(records)} transfers for "
+                f"{len(accounts)} accounts ({len(records) / elapsed:.0f} rows/s)"
+            )
+
+    await task_engine.dispose()
+    return scored_rows
+
+
+def _score_partition(partition: int, partitions: int, accounts_per_chunk: int) -> int:
+    return asyncio.run(_score_partition_async(partition, partitions, accounts_per_chunk))
+
+
+def rescore_all(workers: int, accounts_per_chunk: int) -> dict:
+    if ai_settings.USE_TRAINED_MODEL:
+        fraud_predictor.load()
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        totals = list(
+            pool.map(
+                _score_partition,
+                range(workers),
+                repeat(workers),
+                repeat(accounts_per_chunk),
+            )
+        )
+    elapsed = time.perf_counter() - started
+    rows = sum(totals)
+    report = {
+        "model_version": _model_version(),
+        "rows": rows,
+        "seconds": round(elapsed, 2),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else 0.0,
+    }
+    logger.info(f"Batch re-scoring finished: {report}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Re-score historical transfers with the current risk model"
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--accounts-per-chunk", type=int, default=2000)
+    args = parser.parse_args()
+
+    report = rescore_all(args.workers, args.accounts_per_chunk)
+    print(f"Re-scored {report['rows']} transfers for model {report['model_version']} "
+          f"in {report['seconds']}s ({report['rows_per_second']} rows/s)")
@@ -30,6 +30,14 @@ class AISettings(BaseSettings):
 
     FREQUENCY_THRESHOLD: int = 5
 
+    FREQUENCY_WINDOW_MINUTES: int = 60
+
+    VELOCITY_WINDOW_HOURS: int = 24
+
+    RAPID_TRANSFER_WINDOW_MINUTES: int = 10
+
+    RAPID_TRANSFER_COUNT: int = 3
+
     HIGH_RISK_SCORE_THRESHOLD: float = 0.7
 
     BANKING_HOURS_START: int = 9
@@ -42,6 +50,20 @@ class AISettings(BaseSettings):
 
     LATE_HOURS_RISK: float = 0.9
 
+    LATE_HOURS_START: int = 22
+
+    LATE_HOURS_END: int = 5
+
+    MODEL_REGISTRY_DIR: str = "backend/app/ml_models"
+
+    USE_TRAINED_MODEL: bool = True
+
+    MIN_TRAINING_SAMPLES: int = 200
+
+    REVIEW_CLAIM_MINUTES: int = 30
+
+    REVIEW_QUEUE_MAX_PAGE_SIZE: int = 100
+
     model_config = SettingsConfigDict(
         env_file="../../.envs/.env.local",
         env_ignore_empty=True,
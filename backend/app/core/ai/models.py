@@ -1,13 +1,26 @@
 import uuid
 from uuid import UUID
 from datetime import datetime, timezone
-from sqlalchemy import text
+from sqlalchemy import text, Index, UniqueConstraint
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Column, Field, SQLModel
 
 class TransactionRiskScore(SQLModel, table=True):
     __tablename__ = "transaction_risk_scores"
+    # One score per transaction and model version, so re-scoring is an upsert.
+    # The partial index serves the review queue's keyset scan over unreviewed rows only.
+    __table_args__ = (
+        UniqueConstraint(
+            "transaction_id", "ai_model_version", name="uq_risk_score_transaction_version"
+        ),
+        Index(
+            "ix_risk_score_review_queue",
+            "risk_score",
+            "id",
+            postgresql_where=text("reviewed_by IS NULL"),
+        ),
+    )
 
     id: uuid.UUID = Field(
         sa_column=Column(
@@ -17,10 +30,9 @@ class TransactionRiskScore(SQLModel, table=True):
         ),
         default_factory=uuid.uuid4,
     )
-    transaction_id: uuid.UUID = Field(
-        foreign_key="transaction.id",
-        index=True,
-    )
+    # No foreign key: transaction is partitioned, so its rows are only unique on
+    # (id, created_at).
+    transaction_id: uuid.UUID = Field(index=True)
     risk_score: float = Field(ge=0, le=1, index=True)
     risk_factors: dict = Field(sa_column=Column(JSONB))
     ai_model_version: str
@@ -40,3 +52,17 @@ class TransactionRiskScore(SQLModel, table=True):
     is_confirmed_fraud: bool | None = Field(
         default=None,
     )
+    reviewed_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=True),
+    )
+    review_details: dict | None = Field(default=None, sa_column=Column(JSONB))
+    claimed_by: UUID | None = Field(
+        foreign_key="user.id",
+        default=None,
+        nullable=True,
+    )
+    claimed_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=True),
+    )
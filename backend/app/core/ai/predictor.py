@@ -0,0 +1,92 @@
+import math
+from typing import Any
+import numpy as np
+from backend.app.core.ai.registry import ModelRegistry, model_registry
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+class FraudPredictor:
+    """
+    Process-wide, warm in-memory fraud model. Loaded once from the registry; a
+    scaled logistic model is folded into a single weight vector so one transfer
+    is scored with a dot product instead of a full sklearn predict call.
+    """
+
+    def __init__(self):
+        self._model: Any = None
+        self._version: str | None = None
+        self._features: list[str] = []
+        self._linear: tuple[np.ndarray, float] | None = None
+
+    @property
+    def available(self) -> bool:
+        return self._model is not None
+
+    @property
+    def version(self) -> str | None:
+        return self._version
+
+    @property
+    def features(self) -> list[str]:
+        return self._features
+
+    def _fold_linear(self, model: Any) -> tuple[np.ndarray, float] | None:
+        steps = getattr(model, "named_steps", None)
+        if not steps or set(steps) != {"standardscaler", "logisticregression"}:
+            return None
+
+        scaler = steps["standardscaler"]
+        classifier = steps["logisticregression"]
+        weights = classifier.coef_[0] / scaler.scale_
+        bias = float(classifier.intercept_[0] - np.sum(classifier.coef_[0] * scaler.mean_ / scaler.scale_))
+        return weights, bias
+
+    def load(self, version: str | None = None, registry: ModelRegistry = model_registry) -> bool:
+        try:
+            model, metadata = registry.load(version)
+        except FileNotFoundError as e:
+            logger.info(f"No trained fraud model loaded, using rule-based scoring: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to load fraud model: {e}")
+            return False
+
+        self._features = list(metadata["features"])
+        self._linear = self._fold_linear(model)
+        self._model = model
+        self._version = metadata["version"]
+
+        # Pay sklearn's first-call overhead now rather than on the first transfer.
+        self.predict_one({})
+        logger.info(
+            f"Loaded fraud model {self._version} "
+            f"({'linear fast path' if self._linear else type(model).__name__})"
+        )
+        return True
+
+    def _row(self, factors: dict[str, float]) -> np.ndarray:
+        return np.fromiter(
+            (float(factors.get(name, 0.0)) for name in self._features),
+            dtype=np.float64,
+            count=len(self._features),
+        )
+
+    def predict_one(self, factors: dict[str, float]) -> float:
+        row = self._row(factors)
+        if self._linear is not None:
+            weights, bias = self._linear
+            z = float(row @ weights) + bias
+            if z >= 0:
+                return 1.0 / (1.0 + math.exp(-z))
+            exp_z = math.exp(z)
+            return exp_z / (1.0 + exp_z)
+        return float(self._model.predict_proba(row.reshape(1, -1))[0, 1])
+
+    def predict_many(self, rows: np.ndarray) -> np.ndarray:
+        """Fraud probabilities for a 2D array whose columns follow `features`."""
+        return self._model.predict_proba(rows)[:, 1]
+
+
+fraud_predictor = FraudPredictor()
@@ -0,0 +1,82 @@
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+import joblib
+from backend.app.core.ai.config import ai_settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+LATEST_POINTER = "LATEST"
+
+
+class ModelRegistry:
+    """
+    Versioned fraud model artifacts on disk, one directory per version:
+
+        <root>/<version>/model.joblib
+        <root>/<version>/metadata.json
+        <root>/<version>/features.joblib   (training snapshot, optional)
+        <root>/LATEST                       (name of the version to serve)
+    """
+
+    def __init__(self, root: str):
+        self._root = Path(root)
+
+    def _version_dir(self, version: str) -> Path:
+        return self._root / version
+
+    def save(self, model: Any, metadata: dict[str, Any], features: Any | None = None) -> str:
+        version = f"ml-{datetime.now(timezone.utc):%Y%m%d%H%M%S}"
+        path = self._version_dir(version)
+        path.mkdir(parents=True, exist_ok=False)
+
+        joblib.dump(model, path / "model.joblib")
+        if features is not None:
+            joblib.dump(features, path / "features.joblib", compress=3)
+
+        metadata = {
+            **metadata,
+            "version": version,
+            "trained_at": datetime.now(timezone.utc).isoformat(),
+        }
+        (path / "metadata.json").write_text(json.dumps(metadata, indent=2, default=str))
+
+        self.promote(version)
+        logger.info(f"Saved fraud model {version} to {path}")
+        return version
+
+    def promote(self, version: str) -> None:
+        if not self._version_dir(version).is_dir():
+            raise FileNotFoundError(f"Model version {version} not found in {self._root}")
+
+        pointer = self._root / LATEST_POINTER
+        staged = pointer.with_suffix(".tmp")
+        staged.write_text(version)
+        os.replace(staged, pointer)
+
+    def latest_version(self) -> str | None:
+        pointer = self._root / LATEST_POINTER
+        if not pointer.is_file():
+            return None
+        return pointer.read_text().strip() or None
+
+    def list_versions(self) -> list[str]:
+        if not self._root.is_dir():
+            return []
+        return sorted(p.name for p in self._root.iterdir() if (p / "model.joblib").is_file())
+
+    def load(self, version: str | None = None) -> tuple[Any, dict[str, Any]]:
+        version = version or self.latest_version()
+        if not version:
+            raise FileNotFoundError(f"No fraud model has been trained in {self._root}")
+
+        path = self._version_dir(version)
+        model = joblib.load(path / "model.joblib")
+        metadata = json.loads((path / "metadata.json").read_text())
+        return model, metadata
+
+
+model_registry = ModelRegistry(ai_settings.MODEL_REGISTRY_DIR)
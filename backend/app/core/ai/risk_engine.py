@@ -0,0 +1,309 @@
+import math
+import uuid
+from decimal import Decimal
+from datetime import datetime, timezone
+from pydantic import BaseModel
+from backend.app.core.ai.config import ai_settings
+from backend.app.core.ai.enums import AIReviewStatusEnum
+from backend.app.core.ai.predictor import fraud_predictor
+from backend.app.core.redis_client import get_redis
+from backend.app.core.tasks.risk_score import persist_risk_score
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+# Reads the per-account aggregates as they were before this transfer, then folds the
+# transfer in, all in one round trip.
+#   KEYS: stats hash, event zset, hourly velocity hash, amount zset
+#   ARGV: now, amount, event member, decay seconds, frequency window, rapid window,
+#         velocity hours, stats ttl
+# Floats are returned as strings because Redis truncates Lua numbers to integers.
+_SCORE_AND_RECORD_SCRIPT = """
+local now = tonumber(ARGV[1])
+local amount = tonumber(ARGV[2])
+local decay = tonumber(ARGV[4])
+local frequency_window = tonumber(ARGV[5])
+local rapid_window = tonumber(ARGV[6])
+local velocity_hours = tonumber(ARGV[7])
+local stats_ttl = tonumber(ARGV[8])
+local window_ttl = velocity_hours * 3600
+
+local stats = redis.call('HMGET', KEYS[1], 'n', 'mean', 's', 'ts')
+local n = tonumber(stats[1]) or 0
+local mean = tonumber(stats[2]) or 0
+local s = tonumber(stats[3]) or 0
+local ts = tonumber(stats[4]) or now
+local w = math.exp(-math.max(now - ts, 0) / decay)
+n = n * w
+s = s * w
+
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now - math.max(frequency_window, rapid_window))
+local frequency_count = redis.call('ZCOUNT', KEYS[2], now - frequency_window, '+inf')
+local rapid_count = redis.call('ZCOUNT', KEYS[2], now - rapid_window, '+inf')
+
+local hour = math.floor(now / 3600)
+local velocity_sum = 0
+local buckets = redis.call('HGETALL', KEYS[3])
+for i = 1, #buckets, 2 do
+    if tonumber(buckets[i]) <= hour - velocity_hours then
+        redis.call('HDEL', KEYS[3], buckets[i])
+    else
+        velocity_sum = velocity_sum + tonumber(buckets[i + 1])
+    end
+end
+
+redis.call('ZREMRANGEBYSCORE', KEYS[4], '-inf', now - window_ttl)
+local last_same_amount = redis.call('ZSCORE', KEYS[4], ARGV[2])
+
+local new_n = n + 1
+local delta = amount - mean
+local new_mean = mean + delta / new_n
+local new_s = s + delta * (amount - new_mean)
+redis.call('HSET', KEYS[1], 'n', tostring(new_n), 'mean', tostring(new_mean), 's', tostring(new_s), 'ts', ARGV[1])
+redis.call('ZADD', KEYS[2], now, ARGV[3])
+redis.call('HINCRBYFLOAT', KEYS[3], tostring(hour), ARGV[2])
+redis.call('ZADD', KEYS[4], now, ARGV[2])
+redis.call('EXPIRE', KEYS[1], stats_ttl)
+redis.call('EXPIRE', KEYS[2], window_ttl)
+redis.call('EXPIRE', KEYS[3], window_ttl)
+redis.call('EXPIRE', KEYS[4], window_ttl)
+
+return {tostring(n), tostring(mean), tostring(s), frequency_count, rapid_count, tostring(velocity_sum), last_same_amount or false}
+"""
+
+# Below this many (decayed) observations the account mean is not trusted.
+MIN_AMOUNT_HISTORY = 3
+
+# Risk factors, in order, that the trained fraud model consumes.
+MODEL_FEATURES = [
+    "amount",
+    "time",
+    "frequency",
+    "patterns",
+    "velocity_amount",
+    "recent_transfers",
+    "rapid_transfers",
+    "velocity_amount_window",
+]
+
+
+class AccountAggregates(BaseModel):
+    """Rolling per-account state as it was just before the transfer being scored."""
+
+    history_weight: float = 0.0
+    mean_amount: float = 0.0
+    amount_variance: float = 0.0
+    recent_count: int = 0
+    rapid_count: int = 0
+    velocity_amount: float = 0.0
+    repeated_amount: bool = False
+
+
+class RiskAssessment(BaseModel):
+    score: float
+    factors: dict[str, float]
+    model_version: str
+
+    @property
+    def review_status(self) -> AIReviewStatusEnum:
+        if self.score >= ai_settings.HIGH_RISK_SCORE_THRESHOLD:
+            return AIReviewStatusEnum.FLAGGED
+        return AIReviewStatusEnum.PENDING
+
+
+def _clamp(value: float) -> float:
+    return max(0.0, min(value, 1.0))
+
+
+def weighted_sum(values: dict[str, float], weights: dict[str, float]) -> float:
+    total = sum(weights.values())
+    if not total:
+        return 0.0
+    return sum(weights[name] * values.get(name, 0.0) for name in weights) / total
+
+
+def amount_risk(amount: float, aggregates: AccountAggregates) -> float:
+    absolute = _clamp(amount / ai_settings.HIGH_AMOUNT_THRESHOLD)
+    if aggregates.history_weight < MIN_AMOUNT_HISTORY:
+        return absolute
+
+    std = max(
+        math.sqrt(aggregates.amount_variance),
+        aggregates.mean_amount * 0.1,
+        1.0,
+    )
+    deviation = _clamp((amount - aggregates.mean_amount) / (3 * std))
+    return max(absolute, deviation)
+
+
+def hour_risk(hour: int) -> float:
+    if ai_settings.BANKING_HOURS_START <= hour < ai_settings.BANKING_HOURS_END:
+        return ai_settings.BANKING_HOURS_RISK
+    if hour >= ai_settings.LATE_HOURS_START or hour < ai_settings.LATE_HOURS_END:
+        return ai_settings.LATE_HOURS_RISK
+    return ai_settings.OFF_HOURS_RISK
+
+
+def time_risk(at: datetime) -> float:
+    day_risk = (
+        ai_settings.OFF_HOURS_RISK if at.weekday() >= 5 else ai_settings.BANKING_HOURS_RISK
+    )
+    return weighted_sum(
+        {"time_of_day": hour_risk(at.hour), "day_of_week": day_risk},
+        ai_settings.TIME_RISK_WEIGHTS,
+    )
+
+
+def round_amount_risk(amount: float) -> float:
+    if amount >= 1000 and amount % 1000 == 0:
+        return 1.0
+    if amount >= 100 and amount % 100 == 0:
+        return 0.5
+    return 0.0
+
+
+def score_features(
+        amount: float,
+        at: datetime,
+        aggregates: AccountAggregates,
+) -> dict[str, float]:
+    """The five RISK_WEIGHTS features for one transfer, each in [0, 1]."""
+    patterns = weighted_sum(
+        {
+            "round_amounts": round_amount_risk(amount),
+            "repeated_amounts": 1.0 if aggregates.repeated_amount else 0.0,
+            "velocity": _clamp(aggregates.rapid_count / ai_settings.RAPID_TRANSFER_COUNT),
+        },
+        ai_settings.PATTERN_WEIGHTS,
+    )
+    return {
+        "amount": amount_risk(amount, aggregates),
+        "time": time_risk(at),
+        "frequency": _clamp((aggregates.recent_count + 1) / ai_settings.FREQUENCY_THRESHOLD),
+        "patterns": patterns,
+        "velocity_amount": _clamp(
+            (aggregates.velocity_amount + amount) / ai_settings.VELOCITY_THRESHOLD
+        ),
+    }
+
+
+def combine_features(features: dict[str, float]) -> float:
+    return round(_clamp(weighted_sum(features, ai_settings.RISK_WEIGHTS)), 4)
+
+
+class RiskScoringEngine:
+    """
+    Scores transfers from per-account rolling aggregates kept in Redis.
+
+    Each account has an exponentially decayed amount mean/variance whose decay
+    constant is ANALYSIS_WINDOW_DAYS, a trimmed set of recent transfer timestamps,
+    hourly amount buckets for velocity and the amounts sent in the velocity window.
+    Scoring reads and updates them in a single script call, so it never rescans
+    transaction history.
+    """
+
+    def __init__(self):
+        self._script = None
+
+    def _keys(self, account_id: uuid.UUID) -> list[str]:
+        return [
+            f"risk:stats:{account_id}",
+            f"risk:events:{account_id}",
+            f"risk:velocity:{account_id}",
+            f"risk:amounts:{account_id}",
+        ]
+
+    def _get_script(self):
+        if self._script is None:
+            self._script = get_redis().register_script(_SCORE_AND_RECORD_SCRIPT)
+        return self._script
+
+    async def _score_and_record(
+            self, account_id: uuid.UUID,
+            amount: float,
+            reference: str,
+            at: datetime,
+    ) -> AccountAggregates:
+        window_days = int(ai_settings.ANALYSIS_WINDOW_DAYS)
+        result = await self._get_script()(
+            keys=self._keys(account_id),
+            args=[
+                at.timestamp(),
+                f"{amount:.2f}",
+                reference,
+                window_days * 24 * 60 * 60,
+                ai_settings.FREQUENCY_WINDOW_MINUTES * 60,
+                ai_settings.RAPID_TRANSFER_WINDOW_MINUTES * 60,
+                ai_settings.VELOCITY_WINDOW_HOURS,
+                window_days * 24 * 60 * 60,
+            ],
+        )
+        history_weight, mean, s, recent_count, rapid_count, velocity, last_same = result
+        history_weight = float(history_weight)
+        return AccountAggregates(
+            history_weight=history_weight,
+            mean_amount=float(mean),
+            amount_variance=float(s) / history_weight if history_weight else 0.0,
+            recent_count=int(recent_count),
+            rapid_count=int(rapid_count),
+            velocity_amount=float(velocity),
+            repeated_amount=last_same is not None,
+        )
+
+    async def score_transfer(
+            self, *,
+            account_id: uuid.UUID,
+            amount: Decimal,
+            reference: str,
+            at: datetime | None = None,
+    ) -> RiskAssessment | None:
+        """
+        Score a transfer and record it in the account aggregates. Returns None if
+        the aggregates are unavailable so that scoring never blocks a transfer.
+        """
+        at = at or datetime.now(timezone.utc)
+        amount_value = float(amount)
+        try:
+            aggregates = await self._score_and_record(account_id, amount_value, reference, at)
+        except Exception as e:
+            logger.error(f"Risk scoring unavailable for account {account_id}: {e}")
+            return None
+
+        features = score_features(amount_value, at, aggregates)
+        factors = {name: round(value, 4) for name, value in features.items()}
+        factors.update(
+            recent_transfers=aggregates.recent_count,
+            rapid_transfers=aggregates.rapid_count,
+            velocity_amount_window=round(aggregates.velocity_amount, 2),
+        )
+        score = combine_features(features)
+        model_version = ai_settings.MODEL_VERSION
+
+        if fraud_predictor.available:
+            try:
+                factors["rule_score"] = score
+                score = round(fraud_predictor.predict_one(factors), 4)
+                model_version = fraud_predictor.version
+            except Exception as e:
+                logger.error(f"Fraud model prediction failed, using rule score: {e}")
+
+        return RiskAssessment(
+            score=score,
+            factors=factors,
+            model_version=model_version,
+        )
+
+    def persist(self, transaction_id: uuid.UUID, assessment: RiskAssessment) -> None:
+        """Queue the TransactionRiskScore row; the caller's request does not wait on the insert."""
+        try:
+            persist_risk_score.delay(
+                transaction_id=str(transaction_id),
+                risk_score=assessment.score,
+                risk_factors=assessment.factors,
+                ai_model_version=assessment.model_version,
+            )
+        except Exception as e:
+            logger.error(f"Failed to queue risk score for transaction {transaction_id}: {e}")
+
+
+risk_engine = RiskScoringEngine()
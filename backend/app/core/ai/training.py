@@ -0,0 +1,129 @@
+"""
+Train the fraud model from analyst-labelled transactions.
+
+The feature store is the risk_factors captured when each labelled transaction was
+scored, so training sees exactly what the scorer saw at the time. The trained
+model, its metrics and the training snapshot are written to the model registry
+and promoted to LATEST.
+
+Usage:
+    python -m backend.app.core.ai.training --algorithm gbm
+"""
+import argparse
+import asyncio
+from typing import Any
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import average_precision_score, roc_auc_score
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sqlmodel import select, desc
+from backend.app.core.ai.config import ai_settings
+from backend.app.core.ai.models import TransactionRiskScore
+from backend.app.core.ai.registry import model_registry
+from backend.app.core.ai.risk_engine import MODEL_FEATURES
+from backend.app.core.db import task_session, task_engine
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+ALGORITHMS = ("gbm", "logistic")
+
+
+async def load_feature_store() -> pd.DataFrame:
+    """Latest factors and label per labelled transaction, one row per transaction."""
+    statement = (
+        select(
+            TransactionRiskScore.transaction_id,
+            TransactionRiskScore.risk_factors,
+            TransactionRiskScore.is_confirmed_fraud,
+        )
+        .where(TransactionRiskScore.is_confirmed_fraud.is_not(None))
+        .distinct(TransactionRiskScore.transaction_id)
+        .order_by(TransactionRiskScore.transaction_id, desc(TransactionRiskScore.created_at))
+    )
+    async with task_session() as session:
+        result = await session.exec(statement)
+        rows = result.all()
+    await task_engine.dispose()
+
+    factors = pd.DataFrame.from_records([row.risk_factors or {} for row in rows])
+    frame = factors.reindex(columns=MODEL_FEATURES).astype(float)
+    frame["transaction_id"] = [row.transaction_id for row in rows]
+    frame["label"] = [int(row.is_confirmed_fraud) for row in rows]
+    return frame.dropna(subset=MODEL_FEATURES)
+
+
+def build_estimator(algorithm: str) -> Any:
+    if algorithm == "gbm":
+        return HistGradientBoostingClassifier(
+            max_iter=200,
+            learning_rate=0.1,
+            class_weight="balanced",
+            random_state=42,
+        )
+    if algorithm == "logistic":
+        return make_pipeline(
+            StandardScaler(),
+            LogisticRegression(max_iter=1000, class_weight="balanced"),
+        )
+    raise ValueError(f"Unknown algorithm: {algorithm}")
+
+
+def train_model(frame: pd.DataFrame, algorithm: str) -> tuple[Any, dict[str, Any]]:
+    labels = frame["label"].to_numpy()
+    if len(frame) < ai_settings.MIN_TRAINING_SAMPLES:
+        raise ValueError(
+            f"Need at least {ai_settings.MIN_TRAINING_SAMPLES} labelled transactions, got {len(frame)}"
+        )
+    if np.unique(labels).size < 2:
+        raise ValueError("Labelled transactions must include both fraud and non-fraud cases")
+
+    features = frame[MODEL_FEATURES].to_numpy(dtype=np.float64)
+    x_train, x_test, y_train, y_test = train_test_split(
+        features, labels, test_size=0.2, stratify=labels, random_state=42
+    )
+
+    estimator = build_estimator(algorithm)
+    estimator.fit(x_train, y_train)
+    probabilities = estimator.predict_proba(x_test)[:, 1]
+
+    metrics = {
+        "roc_auc": round(float(roc_auc_score(y_test, probabilities)), 4),
+        "average_precision": round(float(average_precision_score(y_test, probabilities)), 4),
+        "train_rows": int(len(y_train)),
+        "test_rows": int(len(y_test)),
+        "fraud_rate": round(float(labels.mean()), 4),
+    }
+    return estimator, metrics
+
+
+def train_and_register(algorithm: str) -> str:
+    frame = asyncio.run(load_feature_store())
+    logger.info(f"Loaded {len(frame)} labelled transactions for training")
+
+    estimator, metrics = train_model(frame, algorithm)
+    version = model_registry.save(
+        estimator,
+        {
+            "algorithm": algorithm,
+            "features": MODEL_FEATURES,
+            "metrics": metrics,
+            "rule_model_version": ai_settings.MODEL_VERSION,
+        },
+        features=frame,
+    )
+    logger.info(f"Trained fraud model {version}: {metrics}")
+    return version
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the fraud model from labelled transactions")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="gbm")
+    args = parser.parse_args()
+
+    version = train_and_register(args.algorithm)
+    print(f"Registered fraud model {version}")
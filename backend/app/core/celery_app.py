@@ -1,4 +1,5 @@
 from celery import Celery
+from celery.schedules import crontab
 from backend.app.core.config import settings
 
 celery_app = Celery(
@@ -34,6 +35,49 @@ celery_app.conf.update(
     worker_task_log_format="[%(asctime)s: %(levelname)s/%(processName)s][%(task_name)s(%(task_id)s)] %(message)s",
 )
 
+celery_app.conf.beat_schedule = {
+    "snapshot-ledger-balances": {
+        "task": "snapshot_ledger_balances",
+        "schedule": crontab(minute="*/15"),
+    },
+    "snapshot-daily-balances": {
+        "task": "snapshot_daily_balances",
+        "schedule": crontab(hour=0, minute=30),
+    },
+    "accrue-daily-interest": {
+        "task": "accrue_daily_interest",
+        "schedule": crontab(hour=1, minute=30),
+    },
+    "dispatch-due-transfers": {
+        "task": "dispatch_due_transfers",
+        "schedule": 15.0,
+    },
+    "expire-pending-transfers": {
+        "task": "expire_pending_transfers",
+        "schedule": 60.0,
+    },
+    "purge-expired-idempotency-keys": {
+        "task": "purge_expired_idempotency_keys",
+        "schedule": crontab(minute=15),
+    },
+    "maintain-transaction-partitions": {
+        "task": "maintain_transaction_partitions",
+        "schedule": crontab(hour=0, minute=5),
+    },
+    "archive-transactions": {
+        "task": "archive_transactions",
+        "schedule": crontab(day_of_month=2, hour=3, minute=0),
+    },
+    "refresh-reporting-views": {
+        "task": "refresh_reporting_views",
+        "schedule": crontab(minute="*/10"),
+    },
+    "reconcile-ledger": {
+        "task": "reconcile_ledger",
+        "schedule": crontab(hour=2, minute=30),
+    },
+}
+
 celery_app.autodiscover_tasks(
     packages=["backend.app.core.tasks"],
     related_name="tasks",
@@ -34,6 +34,7 @@ class Settings(BaseSettings):
 
     OTP_EXPIRATION_MINUTES: int = 3 if ENVIRONMENT == "local" else 5
     LOGIN_ATTEMPTS: int = 3
+    FAILED_LOGIN_WINDOW_MINUTES: int = 15
     LOCKOUT_DURATION_MINUTES: int = 3 if ENVIRONMENT == "local" else 5
     ACTIVATION_TOKEN_EXPIRATION_MINUTES: int = 3 if ENVIRONMENT == "local" else 5
     API_BASE_URL: str = ""
@@ -76,6 +77,47 @@ class Settings(BaseSettings):
     CURRENCY_CODE_NGR: str = ""
     MAX_BANK_ACCOUNTS: int = 3
 
+    # Entries newer than this are left out of snapshots, so a posting whose
+    # sequence was assigned before a slower transaction committed is not skipped.
+    LEDGER_SNAPSHOT_LAG_SECONDS: int = 300
+    LEDGER_RECONCILE_BATCH_SIZE: int = 10000
+
+    INTEREST_ACCRUAL_BATCH_SIZE: int = 10000
+    INTEREST_DAY_COUNT: int = 365
+
+    SCHEDULED_TRANSFER_CLAIM_BATCH_SIZE: int = 500
+    SCHEDULED_TRANSFER_MAX_DISPATCH: int = 50000
+    SCHEDULED_TRANSFER_LEASE_SECONDS: int = 300
+    SCHEDULED_TRANSFER_MAX_FAILURES: int = 3
+
+    IDEMPOTENCY_KEY_TTL_HOURS: int = 24
+    IDEMPOTENCY_LOCK_SECONDS: int = 60
+    IDEMPOTENCY_PURGE_BATCH_SIZE: int = 5000
+
+    TRANSACTION_PARTITION_MONTHS_AHEAD: int = 3
+    # Monthly partitions older than this are detached; 0 keeps every partition attached.
+    TRANSACTION_PARTITION_RETENTION_MONTHS: int = 0
+    TRANSACTION_PARTITION_LOCK_TIMEOUT_MS: int = 5000
+    # Bounds the pending-reference lookup on completion so it prunes to recent partitions.
+    TRANSACTION_PENDING_LOOKBACK_HOURS: int = 24
+
+    TRANSACTION_ARCHIVE_DIR: str = "backend/app/transaction_archive"
+    TRANSACTION_ARCHIVE_RETENTION_MONTHS: int = 24
+    TRANSACTION_ARCHIVE_BATCH_SIZE: int = 50000
+
+    # Days of transactions covered by the teller deposits report.
+    REPORTING_WINDOW_DAYS: int = 90
+    # Listings count exactly below this many (estimated) rows and report the
+    # planner's estimate above it.
+    EXACT_COUNT_THRESHOLD: int = 10000
+
+    # Name enquiry and transfer recipient lookups by account number.
+    RECIPIENT_CACHE_TTL_SECONDS: int = 600
+
+    # Pending transfers expire this long after their OTP would have.
+    PENDING_TRANSFER_EXPIRY_GRACE_MINUTES: int = 1
+    PENDING_TRANSFER_EXPIRY_BATCH_SIZE: int = 5000
+
 
 
 settings = Settings()
@@ -4,7 +4,7 @@ from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
 # from sqlalchemy.pool import text
 from sqlalchemy import text
-from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 from backend.app.core.model_registry import load_models
@@ -28,6 +28,16 @@ async_session = async_sessionmaker(
     class_=AsyncSession
 )
 
+# Celery tasks drive coroutines with asyncio.run, i.e. a fresh event loop per call,
+# so they cannot share pooled connections bound to the API's loop.
+task_engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+
+task_session = async_sessionmaker(
+    task_engine,
+    expire_on_commit=False,
+    class_=AsyncSession
+)
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     session = async_session()
     try:
@@ -0,0 +1,56 @@
+from enum import Enum
+from pydantic import BaseModel
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class HashPurposeEnum(str, Enum):
+    PASSWORD = "password"
+    CVV = "cvv"
+
+
+class Argon2Params(BaseModel):
+    """
+    Argon2id cost parameters for a single hashing purpose.
+
+    Attributes:
+        time_cost (int): Number of iterations.
+        memory_cost (int): Memory usage in KiB.
+        parallelism (int): Number of parallel lanes.
+    """
+
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+
+
+class HashingSettings(BaseSettings):
+    # Threads running Argon2; argon2-cffi releases the GIL so these run in parallel.
+    POOL_MAX_WORKERS: int = 4
+    # Hash/verify calls allowed in flight (running + queued) before new calls are rejected.
+    POOL_MAX_PENDING: int = 64
+
+    PASSWORD_TIME_COST: int = 3
+    PASSWORD_MEMORY_COST: int = 65536
+    PASSWORD_PARALLELISM: int = 4
+
+    CVV_TIME_COST: int = 2
+    CVV_MEMORY_COST: int = 19456
+    CVV_PARALLELISM: int = 1
+
+    model_config = SettingsConfigDict(
+        env_file="../../.envs/.env.local",
+        env_ignore_empty=True,
+        extra="ignore",
+        env_prefix="HASH_"
+        )
+
+    def params_for(self, purpose: HashPurposeEnum) -> Argon2Params:
+        prefix = purpose.value.upper()
+        return Argon2Params(
+            time_cost=getattr(self, f"{prefix}_TIME_COST"),
+            memory_cost=getattr(self, f"{prefix}_MEMORY_COST"),
+            parallelism=getattr(self, f"{prefix}_PARALLELISM"),
+        )
+
+
+hashing_settings = HashingSettings()
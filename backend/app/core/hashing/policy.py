@@ -0,0 +1,89 @@
+import argparse
+import time
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError
+from backend.app.core.hashing.config import Argon2Params, HashPurposeEnum, hashing_settings
+from backend.app.core.hashing.service import hashing_service
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+class HashPolicyManager:
+    """
+    Knows the target Argon2 parameters per purpose, detects hashes created with older
+    parameters and recommends new targets from a calibration run on the current host.
+    """
+
+    def target_params(self, purpose: HashPurposeEnum) -> Argon2Params:
+        return hashing_settings.params_for(purpose)
+
+    def encoded_params(self, purpose: HashPurposeEnum) -> str:
+        """The `m=...,t=...,p=...` segment every current hash for this purpose carries."""
+        params = self.target_params(purpose)
+        return f"m={params.memory_cost},t={params.time_cost},p={params.parallelism}"
+
+    def needs_rehash(self, hashed: str, purpose: HashPurposeEnum) -> bool:
+        try:
+            return hashing_service.get_hasher(purpose).check_needs_rehash(hashed)
+        except InvalidHashError:
+            logger.warning(f"Stored {purpose.value} hash could not be parsed, scheduling rehash")
+            return True
+
+    def calibrate(
+            self,
+            target_ms: float,
+            memory_cost: int,
+            parallelism: int,
+            max_time_cost: int = 20,
+            samples: int = 5,
+    ) -> tuple[Argon2Params, float]:
+        """
+        Find the largest time_cost whose median hash time stays within target_ms
+        for the given memory_cost and parallelism. Returns the params and their median ms.
+        """
+        best = Argon2Params(time_cost=1, memory_cost=memory_cost, parallelism=parallelism)
+        best_ms = 0.0
+
+        for time_cost in range(1, max_time_cost + 1):
+            hasher = PasswordHasher(
+                time_cost=time_cost,
+                memory_cost=memory_cost,
+                parallelism=parallelism,
+                type=Type.ID,
+            )
+            timings = []
+            for _ in range(samples):
+                started = time.perf_counter()
+                hasher.hash("calibration-password")
+                timings.append((time.perf_counter() - started) * 1000)
+            median_ms = sorted(timings)[len(timings) // 2]
+
+            if median_ms > target_ms and time_cost > 1:
+                break
+
+            best = Argon2Params(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+            best_ms = median_ms
+
+        return best, best_ms
+
+
+hash_policy = HashPolicyManager()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Calibrate Argon2 time_cost for the current hardware"
+    )
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--memory-cost", type=int, default=hashing_settings.PASSWORD_MEMORY_COST)
+    parser.add_argument("--parallelism", type=int, default=hashing_settings.PASSWORD_PARALLELISM)
+    args = parser.parse_args()
+
+    params, median_ms = hash_policy.calibrate(args.target_ms, args.memory_cost, args.parallelism)
+    print(f"Recommended: time_cost={params.time_cost} memory_cost={params.memory_cost} "
+          f"parallelism={params.parallelism} (~{median_ms:.1f}ms per hash)")
+    print(f"HASH_PASSWORD_TIME_COST={params.time_cost}")
+    print(f"HASH_PASSWORD_MEMORY_COST={params.memory_cost}")
+    print(f"HASH_PASSWORD_PARALLELISM={params.parallelism}")
+    hashing_service.shutdown()
@@ -0,0 +1,93 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+from fastapi import HTTPException, status
+from backend.app.core.hashing.config import HashPurposeEnum, hashing_settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+class HashingPoolSaturatedError(HTTPException):
+    """Raised when the hashing pool already has POOL_MAX_PENDING calls in flight."""
+
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "status": "error",
+                "message": "Service is busy",
+                "action": "Please try again shortly."
+            },
+            headers={"Retry-After": "1"},
+        )
+
+
+class HashingService:
+    """
+    Runs Argon2 hashing and verification on a bounded thread pool so the event loop
+    is never blocked, with one PasswordHasher per purpose built from HashingSettings.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="argon2",
+        )
+        self._max_pending = max_pending
+        self._pending = 0
+        self._hashers: dict[HashPurposeEnum, PasswordHasher] = {
+            purpose: self._build_hasher(purpose) for purpose in HashPurposeEnum
+        }
+
+    def _build_hasher(self, purpose: HashPurposeEnum) -> PasswordHasher:
+        params = hashing_settings.params_for(purpose)
+        return PasswordHasher(
+            time_cost=params.time_cost,
+            memory_cost=params.memory_cost,
+            parallelism=params.parallelism,
+        )
+
+    def get_hasher(self, purpose: HashPurposeEnum) -> PasswordHasher:
+        return self._hashers[purpose]
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def _run(self, func, *args):
+        if self._pending >= self._max_pending:
+            logger.warning(f"Hashing pool saturated with {self._pending} calls in flight")
+            raise HashingPoolSaturatedError()
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    def hash_sync(self, secret: str, purpose: HashPurposeEnum) -> str:
+        return self._hashers[purpose].hash(secret)
+
+    def verify_sync(self, hashed: str, secret: str, purpose: HashPurposeEnum) -> bool:
+        try:
+            return self._hashers[purpose].verify(hashed, secret)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    async def hash(self, secret: str, purpose: HashPurposeEnum) -> str:
+        return await self._run(self.hash_sync, secret, purpose)
+
+    async def verify(self, hashed: str, secret: str, purpose: HashPurposeEnum) -> bool:
+        return await self._run(self.verify_sync, hashed, secret, purpose)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+hashing_service = HashingService(
+    max_workers=hashing_settings.POOL_MAX_WORKERS,
+    max_pending=hashing_settings.POOL_MAX_PENDING,
+)
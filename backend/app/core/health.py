@@ -5,6 +5,7 @@ from enum import Enum
 from sqlalchemy import text
 from backend.app.core.db import async_session
 from backend.app.core.celery_app import celery_app
+from backend.app.core.redis_client import get_redis
 from backend.app.core.logging import get_logger
 
 
@@ -30,6 +31,8 @@ class HealthCheck:
         self._cache_duration: timedelta = timedelta(seconds=25)
         self._cache_status: Optional[Dict[str, Any]] = None
         self._last_check_time: Optional[datetime] = None
+        self._refresh_interval: float = 15.0
+        self._refresh_task: Optional[asyncio.Task] = None
 
     async def validate_dependencies(self, service_name: str, depends_on: list[str])-> None:
         if not depends_on:
@@ -77,29 +80,31 @@ class HealthCheck:
         
     async def check_redis(self) -> bool:
         try:
-            redis_client = celery_app.backend.client
-            redis_client.ping()
+            await get_redis().ping()
             self._last_check["redis"] = datetime.now(timezone.utc)
             return True
         except Exception as e:
             logger.error(f"Redis health check failed: {e}")
             return False
-        
+
+    def _probe_celery(self, timeout: float) -> bool:
+        # Blocking broker round-trips; only ever run in a worker thread.
+        inspect = celery_app.control.inspect(timeout=timeout)
+        workers = inspect.ping()
+
+        if not workers:
+            conn = celery_app.connection()
+            try:
+                conn.ensure_connection(max_retries=1, timeout=timeout)
+                logger.warning("No celery workers found, but Rabbitmq is reacheable")
+            finally:
+                conn.close()
+        return True
+
     async def check_celery(self)-> bool:
         try:
-            inspect = celery_app.control.inspect()
-            workers = inspect.ping()
-
-            if not workers:
-                conn = celery_app.connection()
-                try:
-                    conn.ensure_connection(max_retries=3)
-                    logger.warning("No celery workers found, but Rabbitmq is reacheable")
-                    self._last_check["celery"] = datetime.now(timezone.utc)
-                    return True
-                finally:
-                    conn.close()
-
+            timeout = self._timeouts.get("celery", 5.0) / 2
+            await asyncio.to_thread(self._probe_celery, timeout)
             self._last_check["celery"] = datetime.now(timezone.utc)
             return True
 
@@ -164,11 +169,12 @@ class HealthCheck:
         
         return ServiceStatus.UNHEALTHY
     
-    async def check_all_services(self) -> Dict[str, Any]:
+    async def check_all_services(self, use_cache: bool = True) -> Dict[str, Any]:
         current_time =  datetime.now(timezone.utc)
 
         if (
-            self._cache_status is not None 
+            use_cache
+            and self._cache_status is not None 
             and self._last_check_time is not None
             and (current_time - self._last_check_time) < self._cache_duration
         ):
@@ -205,11 +211,48 @@ class HealthCheck:
 
         return health_status
     
+    def get_cached_status(self) -> Dict[str, Any]:
+        """Last known status, kept warm by the background refresher. Never performs I/O."""
+        if self._cache_status is None:
+            return {
+                "status": ServiceStatus.STARTING,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "services": {},
+            }
+        return self._cache_status
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.check_all_services(use_cache=False)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Background health refresh failed: {e}")
+            await asyncio.sleep(self._refresh_interval)
+
+    def start_background_refresh(self, interval: float = 15.0) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_interval = interval
+        self._refresh_task = asyncio.create_task(self._refresh_loop(), name="health-refresh")
+        logger.info(f"Background health refresh started (every {interval}s)")
+
+    async def stop_background_refresh(self) -> None:
+        if self._refresh_task is None:
+            return
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+
     async def wait_for_services(self, timeout: float=30.0) -> bool:
         try:
             start_time = datetime.now()
             while(datetime.now() - start_time) < timedelta(seconds=timeout):
-                status = await self.check_all_services()
+                status = await self.check_all_services(use_cache=False)
                 if status["status"] == ServiceStatus.HEALTHY:
                     return True
                 await asyncio.sleep(1)
@@ -219,6 +262,7 @@ class HealthCheck:
             return False
                 
     async def cleanup(self) -> None:
+        await self.stop_background_refresh()
         async with self._lock:
             self._services.clear()
             self._check_functions.clear()
@@ -226,6 +270,8 @@ class HealthCheck:
             self._timeouts.clear()
             self._retry_delays.clear()
             self._max_retries.clear()
+            self._cache_status = None
+            self._last_check_time = None
 
 
 health_checker = HealthCheck()
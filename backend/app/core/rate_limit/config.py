@@ -44,6 +44,10 @@ DEFAULT_RATE_LIMIT_CONFIG: dict[str, RateLimitConfig] = {
         max_requests=20, 
         window_seconds=3600
     ),
+    "/api/v1/bank-account/name-enquiry/{account_number}": RateLimitConfig(
+        max_requests=30, 
+        window_seconds=300
+    ),
     "/api/v1/virtual-card/create": RateLimitConfig(
         max_requests=5, 
         window_seconds=86400
@@ -73,5 +77,5 @@ DEFAULT_RATE_LIMIT_CONFIG: dict[str, RateLimitConfig] = {
     
 }
 
-RATE_LIMIT_WHITELIST = {"/health"}
+RATE_LIMIT_WHITELIST = {"/health", "/health/live", "/health/ready"}
     
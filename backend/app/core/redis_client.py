@@ -0,0 +1,24 @@
+from redis.asyncio import Redis
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+redis_client = Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    decode_responses=True,
+)
+
+
+def get_redis() -> Redis:
+    return redis_client
+
+
+async def close_redis() -> None:
+    try:
+        await redis_client.aclose()
+        logger.debug("Redis client closed successfully")
+    except Exception as e:
+        logger.error(f"Error closing Redis client: {e}")
@@ -1,15 +1,49 @@
 """
 Core background tasks module for the Finbank application.
-Provides exported background tasks for email sending, image uploading, and PDF statement generation.
+Provides exported background tasks for email sending, image uploading, PDF statement generation,
+risk score persistence, ledger snapshots/reconciliation,
+interest accrual, scheduled transfers, pending transfer expiry,
+idempotency key persistence/purging, transaction partition maintenance and
+archival, spending rollup rebuilds and reporting view refreshes.
 """
 
 from .email import send_email_task
 from .image_upload import upload_profile_image_task
 from .statement import generate_statement_pdf
+from .risk_score import persist_risk_score
+from .ledger import (
+    snapshot_ledger_balances,
+    snapshot_daily_balances,
+    open_ledger_balances,
+    reconcile_ledger,
+)
+from .interest import accrue_daily_interest
+from .scheduled_transfer import dispatch_due_transfers, run_scheduled_transfer
+from .transfer_expiry import expire_pending_transfers
+from .idempotency import persist_idempotency_key, purge_expired_idempotency_keys
+from .partitions import maintain_transaction_partitions
+from .archive import archive_transactions
+from .analytics import rebuild_spending_rollups
+from .reporting import refresh_reporting_views
 
 # Exported tasks
 __all__ = [
     "send_email_task", 
     "upload_profile_image_task", 
-    "generate_statement_pdf"
+    "generate_statement_pdf",
+    "persist_risk_score",
+    "snapshot_ledger_balances",
+    "snapshot_daily_balances",
+    "open_ledger_balances",
+    "reconcile_ledger",
+    "accrue_daily_interest",
+    "dispatch_due_transfers",
+    "run_scheduled_transfer",
+    "expire_pending_transfers",
+    "persist_idempotency_key",
+    "purge_expired_idempotency_keys",
+    "maintain_transaction_partitions",
+    "archive_transactions",
+    "rebuild_spending_rollups",
+    "refresh_reporting_views",
 ]
@@ -0,0 +1,77 @@
+import asyncio
+from datetime import date, datetime, time, timedelta, timezone
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.db import task_engine
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+_DELETE_SQL = """
+DELETE FROM account_daily_rollup
+WHERE rollup_date >= $1 AND rollup_date < $2
+"""
+
+# One leg per account side of each completed transaction, as
+# record_transaction_rollups books them. Transfers complete within the pending
+# lookback of being created, which bounds created_at for partition pruning.
+_REBUILD_SQL = """
+INSERT INTO account_daily_rollup (
+    id, account_id, rollup_date, transaction_type, transaction_category,
+    total_amount, transaction_count, updated_at
+)
+SELECT gen_random_uuid(), account_id, rollup_date, transaction_type, transaction_category,
+       SUM(amount), COUNT(*), now()
+FROM (
+    SELECT sender_account_id AS account_id,
+           (completed_at AT TIME ZONE 'UTC')::date AS rollup_date,
+           transaction_type,
+           'DEBIT'::transaction_category_enum AS transaction_category,
+           amount
+    FROM "transaction"
+    WHERE status = 'COMPLETED' AND sender_account_id IS NOT NULL
+      AND completed_at >= $1 AND completed_at < $2
+      AND created_at >= $1 - make_interval(hours => $3) AND created_at < $2
+    UNION ALL
+    SELECT receiver_account_id,
+           (completed_at AT TIME ZONE 'UTC')::date,
+           transaction_type,
+           'CREDIT'::transaction_category_enum,
+           COALESCE((transaction_metadata ->> 'converted_amount')::numeric, amount)
+    FROM "transaction"
+    WHERE status = 'COMPLETED' AND receiver_account_id IS NOT NULL
+      AND completed_at >= $1 AND completed_at < $2
+      AND created_at >= $1 - make_interval(hours => $3) AND created_at < $2
+) AS legs
+GROUP BY account_id, rollup_date, transaction_type, transaction_category
+"""
+
+
+async def _rebuild_rollups(start: date, end: date) -> int:
+    lower = datetime.combine(start, time.min, timezone.utc)
+    upper = datetime.combine(end + timedelta(days=1), time.min, timezone.utc)
+
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        async with driver.transaction():
+            await driver.execute(_DELETE_SQL, start, end + timedelta(days=1))
+            status = await driver.execute(_REBUILD_SQL, lower, upper, settings.TRANSACTION_PENDING_LOOKBACK_HOURS)
+    return int(status.split()[-1])
+
+
+@celery_app.task(name="rebuild_spending_rollups", time_limit=60 * 60, soft_time_limit=55 * 60)
+def rebuild_spending_rollups(start_date: str | None = None, end_date: str | None = None) -> int:
+    """
+    Recompute daily rollups from transaction for a range of days, inclusive,
+    yesterday (UTC) by default. Backfills history from before rollups existed and
+    repairs drift; use it for closed days only, since transactions completing
+    during the rebuild are not serialized against it. Archived months are not
+    covered.
+    """
+    yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
+    end = date.fromisoformat(end_date) if end_date else yesterday
+    start = date.fromisoformat(start_date) if start_date else end
+    written = asyncio.run(_rebuild_rollups(start, end))
+    logger.info(f"Rebuilt {written} spending rollups for {start} to {end}")
+    return written
@@ -0,0 +1,95 @@
+import asyncio
+from datetime import date, datetime, timezone
+from dateutil.relativedelta import relativedelta
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.db import task_engine
+from backend.app.transaction.archive import ARCHIVE_COLUMNS, transaction_archive
+from backend.app.transaction.partitioning import ARCHIVABLE_PARTITIONS_SQL, month_start, partition_month
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+_SELECT_COLUMNS = ", ".join(ARCHIVE_COLUMNS)
+
+_MARK_ARCHIVED_SQL = """
+UPDATE transaction_reference
+SET archived_in = $1
+WHERE created_at >= $2 AND created_at < $3
+"""
+
+
+async def _partition_state(driver, name: str) -> tuple[int, datetime | None]:
+    row = await driver.fetchrow(f"SELECT count(*) AS rows, max(updated_at) AS last_updated FROM {name}")
+    return row["rows"], row["last_updated"]
+
+
+async def _archive_partition(driver, name: str, month: date, batch_size: int) -> int:
+    # Export from one snapshot, then drop the partition only if nothing changed
+    # since; a row updated in between leaves the partition for the next run.
+    async with driver.transaction(isolation="repeatable_read", readonly=True):
+        exported_state = await _partition_state(driver, name)
+        cursor = await driver.cursor(f"SELECT {_SELECT_COLUMNS} FROM {name} ORDER BY created_at")
+        with transaction_archive.open_month(month) as writer:
+            while rows := await cursor.fetch(batch_size):
+                writer.write([dict(row) for row in rows])
+
+    if writer.rows != exported_state[0]:
+        raise RuntimeError(f"Exported {writer.rows} rows from {name}, expected {exported_state[0]}")
+
+    lower = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    async with driver.transaction():
+        await driver.execute(f"SET LOCAL lock_timeout = '{settings.TRANSACTION_PARTITION_LOCK_TIMEOUT_MS}ms'")
+        await driver.execute(f"LOCK TABLE {name} IN ACCESS EXCLUSIVE MODE")
+        if await _partition_state(driver, name) != exported_state:
+            logger.warning(f"Partition {name} changed during export, will retry next run")
+            return 0
+        await driver.execute(
+            _MARK_ARCHIVED_SQL,
+            transaction_archive.relative_path(month),
+            lower,
+            lower + relativedelta(months=1),
+        )
+        await driver.execute(f"DROP TABLE {name}")
+
+    return writer.rows
+
+
+async def _archive_transactions(today: date, retention_months: int, batch_size: int) -> dict:
+    horizon = month_start(today) - relativedelta(months=retention_months)
+    archived: dict[str, int] = {}
+
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+
+        for row in await driver.fetch(ARCHIVABLE_PARTITIONS_SQL):
+            month = partition_month(row["name"])
+            if month >= horizon:
+                break
+            try:
+                archived[row["name"]] = await _archive_partition(driver, row["name"], month, batch_size)
+            except Exception as e:
+                logger.error(f"Failed to archive partition {row['name']}: {e}")
+                break
+
+    return archived
+
+
+@celery_app.task(name="archive_transactions", time_limit=2 * 60 * 60, soft_time_limit=(2 * 60 - 5) * 60)
+def archive_transactions() -> dict:
+    """
+    Move monthly transaction partitions older than
+    TRANSACTION_ARCHIVE_RETENTION_MONTHS into Parquet files, oldest first.
+    Partitions already detached by maintain_transaction_partitions are archived
+    the same way. References stay in transaction_reference, pointing at the file.
+    """
+    archived = asyncio.run(
+        _archive_transactions(
+            datetime.now(timezone.utc).date(),
+            settings.TRANSACTION_ARCHIVE_RETENTION_MONTHS,
+            settings.TRANSACTION_ARCHIVE_BATCH_SIZE,
+        )
+    )
+    logger.info(f"Archived {sum(archived.values())} transactions from {len(archived)} partitions")
+    return archived
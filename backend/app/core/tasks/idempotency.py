@@ -0,0 +1,80 @@
+import asyncio
+import uuid
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import insert
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.db import task_engine, task_session
+from backend.app.transaction.models import IdempotencyKey
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+# Batched so a large backlog never holds one long delete transaction.
+_PURGE_SQL = """
+DELETE FROM idempotencykey
+WHERE id IN (
+    SELECT id FROM idempotencykey
+    WHERE expires_at < now()
+    LIMIT $1
+)
+"""
+
+
+async def _save_idempotency_key(
+        key: str,
+        user_id: str,
+        endpoint: str,
+        response_code: int,
+        response_body: dict,
+        expires_at: str,
+) -> None:
+    statement = insert(IdempotencyKey).values(
+        id=uuid.uuid4(),
+        key=key,
+        user_id=uuid.UUID(user_id),
+        endpoint=endpoint,
+        response_code=response_code,
+        response_body=response_body,
+        expires_at=datetime.fromisoformat(expires_at),
+    ).on_conflict_do_nothing(index_elements=["key"])
+
+    async with task_session() as session:
+        await session.execute(statement)
+        await session.commit()
+
+
+async def _purge_expired(batch_size: int) -> int:
+    purged = 0
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        while True:
+            status = await driver.execute(_PURGE_SQL, batch_size)
+            deleted = int(status.split()[-1])
+            purged += deleted
+            if deleted < batch_size:
+                return purged
+
+
+@celery_app.task(
+    name="persist_idempotency_key",
+    bind=True,
+    max_retries=3,
+    soft_time_limit=30,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=60,
+)
+def persist_idempotency_key(
+    self, *, key: str, user_id: str, endpoint: str, response_code: int, response_body: dict, expires_at: str
+) -> bool:
+    asyncio.run(_save_idempotency_key(key, user_id, endpoint, response_code, response_body, expires_at))
+    return True
+
+
+@celery_app.task(name="purge_expired_idempotency_keys", soft_time_limit=240)
+def purge_expired_idempotency_keys() -> int:
+    purged = asyncio.run(_purge_expired(settings.IDEMPOTENCY_PURGE_BATCH_SIZE))
+    logger.info(f"Purged {purged} expired idempotency keys")
+    return purged
@@ -0,0 +1,157 @@
+import asyncio
+import time
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+import numpy as np
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.db import task_engine
+from backend.app.interest.utils import daily_accrual_micros, micros_to_decimal
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+# Next batch of eligible accounts after $1 (keyset on id), each with its closing
+# balance for the day from the end-of-day balances. Enums are stored by name.
+_ELIGIBLE_BATCH_SQL = """
+SELECT a.id, a.account_currency::text AS currency, a.interest_rate, COALESCE(d.balance, 0) AS balance
+FROM bankaccount a
+LEFT JOIN LATERAL (
+    SELECT balance FROM ledger_daily_balance
+    WHERE account_code = 'bank_account:' || a.id::text AND balance_date <= $3
+    ORDER BY balance_date DESC
+    LIMIT 1
+) d ON true
+WHERE a.id > $1 AND a.account_status = 'Active' AND a.interest_rate > 0
+ORDER BY a.id
+LIMIT $2
+"""
+
+# One multi-row insert per batch; the (account, day) constraint makes reruns no-ops.
+_INSERT_ACCRUALS_SQL = """
+INSERT INTO interest_accrual (id, bank_account_id, accrual_date, currency, balance, interest_rate, amount, created_at)
+SELECT gen_random_uuid(), t.account_id, $1, t.currency, t.balance, t.rate, t.amount, now()
+FROM unnest($2::uuid[], $3::text[], $4::numeric[], $5::float8[], $6::numeric[])
+    AS t(account_id, currency, balance, rate, amount)
+ON CONFLICT ON CONSTRAINT uq_interest_accrual_account_date DO NOTHING
+"""
+
+_START_RUN_SQL = """
+INSERT INTO interest_accrual_run (accrual_date, status, accounts_processed, accruals_written, duration_seconds, started_at)
+VALUES ($1, 'RUNNING', 0, 0, 0, now())
+ON CONFLICT (accrual_date) DO UPDATE SET accrual_date = EXCLUDED.accrual_date
+RETURNING status, last_account_id, accounts_processed, accruals_written
+"""
+
+_ADVANCE_RUN_SQL = """
+UPDATE interest_accrual_run
+SET last_account_id = $2,
+    accounts_processed = accounts_processed + $3,
+    accruals_written = accruals_written + $4
+WHERE accrual_date = $1
+"""
+
+_COMPLETE_RUN_SQL = """
+UPDATE interest_accrual_run
+SET status = 'COMPLETED', completed_at = now(), duration_seconds = duration_seconds + $2
+WHERE accrual_date = $1
+RETURNING accounts_processed, accruals_written
+"""
+
+
+async def _accrue_interest(accrual_date: date, batch_size: int) -> dict:
+    """
+    Accrue one day of interest for every active account with a positive rate.
+    Accounts are streamed in id order, batch by batch; each batch's accruals and
+    the run's progress marker commit together. An advisory lock keyed on the day
+    keeps two workers from running the same day at once.
+    """
+    run_key = f"interest_accrual:{accrual_date.isoformat()}"
+    started = time.perf_counter()
+    accounts = 0
+    written = 0
+    totals: dict[str, int] = defaultdict(int)
+
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+
+        if not await driver.fetchval("SELECT pg_try_advisory_lock(hashtext($1))", run_key):
+            logger.warning(f"Interest accrual for {accrual_date} is already running")
+            return {"accrual_date": accrual_date.isoformat(), "status": "locked"}
+
+        try:
+            run = await driver.fetchrow(_START_RUN_SQL, accrual_date)
+            if run["status"] == "COMPLETED":
+                logger.info(f"Interest for {accrual_date} was already accrued")
+                return {
+                    "accrual_date": accrual_date.isoformat(),
+                    "status": "already_completed",
+                    "accounts": run["accounts_processed"],
+                    "accruals": run["accruals_written"],
+                }
+
+            after = run["last_account_id"] or uuid.UUID(int=0)
+            while True:
+                rows = await driver.fetch(_ELIGIBLE_BATCH_SQL, after, batch_size, accrual_date)
+                if not rows:
+                    break
+
+                account_ids = np.array([row["id"] for row in rows], dtype=object)
+                currencies = np.array([row["currency"] for row in rows], dtype=object)
+                balances = np.array([row["balance"] for row in rows], dtype=object)
+                rates = np.fromiter((row["interest_rate"] for row in rows), dtype=np.float64, count=len(rows))
+
+                micros = daily_accrual_micros(balances.astype(np.float64), rates, settings.INTEREST_DAY_COUNT)
+                accrues = micros > 0
+
+                async with driver.transaction():
+                    status = await driver.execute(
+                        _INSERT_ACCRUALS_SQL,
+                        accrual_date,
+                        list(account_ids[accrues]),
+                        list(currencies[accrues]),
+                        list(balances[accrues]),
+                        rates[accrues].tolist(),
+                        [micros_to_decimal(value) for value in micros[accrues]],
+                    )
+                    inserted = int(status.split()[-1])
+                    await driver.execute(_ADVANCE_RUN_SQL, accrual_date, rows[-1]["id"], len(rows), inserted)
+
+                for currency in set(currencies[accrues]):
+                    totals[currency] += int(micros[accrues & (currencies == currency)].sum())
+
+                accounts += len(rows)
+                written += inserted
+                after = rows[-1]["id"]
+
+            elapsed = time.perf_counter() - started
+            await driver.fetchrow(_COMPLETE_RUN_SQL, accrual_date, elapsed)
+        finally:
+            await driver.fetchval("SELECT pg_advisory_unlock(hashtext($1))", run_key)
+
+    return {
+        "accrual_date": accrual_date.isoformat(),
+        "status": "completed",
+        "accounts": accounts,
+        "accruals": written,
+        "accrued": {currency: str(micros_to_decimal(total)) for currency, total in totals.items()},
+        "seconds": round(elapsed, 2),
+        "accounts_per_second": round(accounts / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+@celery_app.task(name="accrue_daily_interest", time_limit=4 * 60 * 60, soft_time_limit=(4 * 60 - 5) * 60)
+def accrue_daily_interest(accrual_date: str | None = None) -> dict:
+    """
+    Nightly interest accrual for yesterday (UTC) unless a date is given. Runs after
+    the end-of-day balances for that day have been materialized.
+    """
+    day = (
+        date.fromisoformat(accrual_date) if accrual_date
+        else datetime.now(timezone.utc).date() - timedelta(days=1)
+    )
+    report = asyncio.run(_accrue_interest(day, settings.INTEREST_ACCRUAL_BATCH_SIZE))
+    logger.info(f"Interest accrual report: {report}")
+    return report
@@ -0,0 +1,286 @@
+import asyncio
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.db import task_engine
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+CENT = Decimal("0.01")
+MAX_REPORTED = 20
+
+# Rolls every account with new entries forward from its latest snapshot. Accounts
+# without new entries keep their previous snapshot, so the highest last_sequence
+# is the point the previous run stopped at.
+_SNAPSHOT_SQL = """
+WITH bounds AS (
+    SELECT
+        (SELECT COALESCE(MAX(last_sequence), 0) FROM ledger_balance_snapshot) AS watermark,
+        (SELECT COALESCE(MAX(sequence), 0) FROM ledger_entry
+         WHERE created_at < now() - make_interval(secs => $1)) AS horizon
+),
+delta AS (
+    SELECT e.account_code, e.currency, SUM(e.amount) AS amount, MAX(e.sequence) AS last_sequence
+    FROM ledger_entry e, bounds b
+    WHERE e.sequence > b.watermark AND e.sequence <= b.horizon
+    GROUP BY e.account_code, e.currency
+),
+latest AS (
+    SELECT DISTINCT ON (s.account_code, s.currency) s.account_code, s.currency, s.balance
+    FROM ledger_balance_snapshot s
+    JOIN delta d ON d.account_code = s.account_code AND d.currency = s.currency
+    ORDER BY s.account_code, s.currency, s.last_sequence DESC
+)
+INSERT INTO ledger_balance_snapshot (id, account_code, currency, balance, last_sequence, created_at)
+SELECT gen_random_uuid(), d.account_code, d.currency, COALESCE(l.balance, 0) + d.amount, d.last_sequence, now()
+FROM delta d
+LEFT JOIN latest l ON l.account_code = d.account_code AND l.currency = d.currency
+"""
+
+# End-of-day balances for one UTC day, for the accounts that had postings that day,
+# rolled forward from each account's previous end-of-day balance.
+#   $1, $2: start and end of the day, $3: the day
+_DAILY_BALANCE_SQL = """
+WITH day_delta AS (
+    SELECT account_code, MIN(currency) AS currency, SUM(amount) AS amount
+    FROM ledger_entry
+    WHERE created_at >= $1 AND created_at < $2
+    GROUP BY account_code
+),
+previous AS (
+    SELECT DISTINCT ON (p.account_code) p.account_code, p.balance
+    FROM ledger_daily_balance p
+    JOIN day_delta d ON d.account_code = p.account_code
+    WHERE p.balance_date < $3
+    ORDER BY p.account_code, p.balance_date DESC
+)
+INSERT INTO ledger_daily_balance (id, account_code, currency, balance_date, balance, created_at)
+SELECT gen_random_uuid(), d.account_code, d.currency, $3, COALESCE(p.balance, 0) + d.amount, now()
+FROM day_delta d
+LEFT JOIN previous p ON p.account_code = d.account_code
+ON CONFLICT ON CONSTRAINT uq_ledger_daily_balance_account_date
+DO UPDATE SET balance = EXCLUDED.balance, created_at = EXCLUDED.created_at
+"""
+
+# Opening journals for balances that predate the ledger. The CTE is referenced
+# twice, so Postgres materializes it once and both legs share the journal id.
+_OPEN_BALANCES_SQL = """
+WITH unopened AS (
+    SELECT gen_random_uuid() AS journal_id, $1 || a.id::text AS account_code,
+           a.{currency}::text AS currency, a.{balance}::numeric(18, 2) AS balance
+    FROM {table} a
+    WHERE a.{balance} <> 0
+      AND NOT EXISTS (SELECT 1 FROM ledger_entry e WHERE e.account_code = $1 || a.id::text)
+)
+INSERT INTO ledger_entry (id, journal_id, account_code, currency, amount, description, created_at)
+SELECT gen_random_uuid(), journal_id, account_code, currency, balance, 'Opening balance', now()
+FROM unopened
+UNION ALL
+SELECT gen_random_uuid(), journal_id, 'opening_balance:' || currency, currency, -balance, 'Opening balance', now()
+FROM unopened
+"""
+
+_OPENED_SOURCES = (
+    ("bank_account:", "bankaccount", "account_currency", "balance"),
+    ("virtual_card:", "virtualcard", "currency", "available_balance"),
+)
+
+_LATEST_SNAPSHOTS_SQL = """
+SELECT account_code, currency, balance, last_sequence FROM (
+    SELECT DISTINCT ON (account_code, currency) account_code, currency, balance, last_sequence
+    FROM ledger_balance_snapshot
+    ORDER BY account_code, currency, last_sequence DESC
+) latest
+ORDER BY last_sequence
+"""
+
+_ENTRIES_SQL = "SELECT sequence, journal_id, account_code, currency, amount FROM ledger_entry ORDER BY sequence"
+
+_STORED_BALANCES_SQL = """
+SELECT 'bank_account:' || id::text AS account_code, account_currency::text AS currency, balance
+FROM bankaccount
+UNION ALL
+SELECT 'virtual_card:' || id::text, currency::text, available_balance
+FROM virtualcard
+"""
+
+
+def _cents(value) -> Decimal:
+    return Decimal(str(value)).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+async def _snapshot_balances() -> int:
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        status = await driver.execute(_SNAPSHOT_SQL, float(settings.LEDGER_SNAPSHOT_LAG_SECONDS))
+    return int(status.split()[-1])
+
+
+async def _snapshot_daily_balances(through: date) -> int:
+    """
+    Materialize every day from the last materialized one through `through`. The
+    last day is recomputed to pick up postings that committed after it ran.
+    """
+    written = 0
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+
+        day = await driver.fetchval("SELECT MAX(balance_date) FROM ledger_daily_balance")
+        if day is None:
+            first_entry = await driver.fetchval("SELECT MIN(created_at) FROM ledger_entry")
+            if first_entry is None:
+                return 0
+            day = first_entry.astimezone(timezone.utc).date()
+
+        while day <= through:
+            start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+            async with driver.transaction():
+                status = await driver.execute(_DAILY_BALANCE_SQL, start, start + timedelta(days=1), day)
+            written += int(status.split()[-1])
+            day += timedelta(days=1)
+    return written
+
+
+async def _open_balances() -> int:
+    opened = 0
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        async with driver.transaction():
+            for prefix, table, currency, balance in _OPENED_SOURCES:
+                status = await driver.execute(
+                    _OPEN_BALANCES_SQL.format(table=table, currency=currency, balance=balance), prefix
+                )
+                opened += int(status.split()[-1]) // 2
+    return opened
+
+
+async def _reconcile() -> dict:
+    """
+    One pass over the journal in sequence order, in a single repeatable-read
+    snapshot. Running totals per account are checked against each account's
+    latest snapshot as the stream passes its last_sequence, open (journal,
+    currency) sums are dropped as soon as they return to zero, and the final
+    totals are compared with the balances stored on accounts and cards.
+    """
+    balances: dict[tuple[str, str], Decimal] = defaultdict(Decimal)
+    open_journals: dict[tuple, Decimal] = {}
+    snapshot_mismatches: list[dict] = []
+    balance_mismatches: list[dict] = []
+    entries = 0
+    last_sequence = 0
+
+    def check_snapshot(snapshot) -> None:
+        key = (snapshot["account_code"], snapshot["currency"])
+        if balances[key] != snapshot["balance"]:
+            snapshot_mismatches.append({
+                "account_code": key[0],
+                "currency": key[1],
+                "last_sequence": snapshot["last_sequence"],
+                "snapshot": str(snapshot["balance"]),
+                "ledger": str(balances[key]),
+            })
+
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        async with driver.transaction(isolation="repeatable_read", readonly=True):
+            snapshots = await driver.fetch(_LATEST_SNAPSHOTS_SQL)
+            pending = 0
+
+            async for entry in driver.cursor(_ENTRIES_SQL, prefetch=settings.LEDGER_RECONCILE_BATCH_SIZE):
+                while pending < len(snapshots) and snapshots[pending]["last_sequence"] < entry["sequence"]:
+                    check_snapshot(snapshots[pending])
+                    pending += 1
+
+                key = (entry["account_code"], entry["currency"])
+                balances[key] += entry["amount"]
+
+                journal_key = (entry["journal_id"], entry["currency"])
+                total = open_journals.get(journal_key, Decimal("0")) + entry["amount"]
+                if total:
+                    open_journals[journal_key] = total
+                else:
+                    open_journals.pop(journal_key, None)
+
+                entries += 1
+                last_sequence = entry["sequence"]
+
+            for snapshot in snapshots[pending:]:
+                check_snapshot(snapshot)
+
+            async for stored in driver.cursor(_STORED_BALANCES_SQL, prefetch=settings.LEDGER_RECONCILE_BATCH_SIZE):
+                key = (stored["account_code"], stored["currency"])
+                ledger_balance = balances.get(key, Decimal("0"))
+                if _cents(stored["balance"]) != ledger_balance:
+                    balance_mismatches.append({
+                        "account_code": key[0],
+                        "currency": key[1],
+                        "stored": str(_cents(stored["balance"])),
+                        "ledger": str(ledger_balance),
+                    })
+
+    unbalanced = [
+        {"journal_id": str(journal_id), "currency": currency, "imbalance": str(total)}
+        for (journal_id, currency), total in open_journals.items()
+    ]
+    return {
+        "entries": entries,
+        "last_sequence": last_sequence,
+        "accounts": len(balances),
+        "unbalanced_journals": len(unbalanced),
+        "snapshot_mismatches": len(snapshot_mismatches),
+        "balance_mismatches": len(balance_mismatches),
+        "samples": {
+            "unbalanced_journals": unbalanced[:MAX_REPORTED],
+            "snapshot_mismatches": snapshot_mismatches[:MAX_REPORTED],
+            "balance_mismatches": balance_mismatches[:MAX_REPORTED],
+        },
+    }
+
+
+@celery_app.task(name="snapshot_ledger_balances", soft_time_limit=240)
+def snapshot_ledger_balances() -> int:
+    snapshots = asyncio.run(_snapshot_balances())
+    logger.info(f"Stored {snapshots} ledger balance snapshots")
+    return snapshots
+
+
+@celery_app.task(name="snapshot_daily_balances", time_limit=30 * 60, soft_time_limit=25 * 60)
+def snapshot_daily_balances(through_date: str | None = None) -> int:
+    """Nightly end-of-day balances, through yesterday (UTC) unless a date is given."""
+    through = (
+        date.fromisoformat(through_date) if through_date
+        else datetime.now(timezone.utc).date() - timedelta(days=1)
+    )
+    written = asyncio.run(_snapshot_daily_balances(through))
+    logger.info(f"Stored {written} end-of-day balances through {through}")
+    return written
+
+
+@celery_app.task(name="open_ledger_balances", soft_time_limit=240)
+def open_ledger_balances() -> int:
+    """
+    Post opening journals for account and card balances that predate the ledger.
+    Run once, while postings are paused, before reconciling for the first time.
+    """
+    opened = asyncio.run(_open_balances())
+    logger.info(f"Posted {opened} opening balance journals")
+    return opened
+
+
+@celery_app.task(name="reconcile_ledger", time_limit=60 * 60, soft_time_limit=55 * 60)
+def reconcile_ledger() -> dict:
+    report = asyncio.run(_reconcile())
+    if report["unbalanced_journals"] or report["snapshot_mismatches"] or report["balance_mismatches"]:
+        logger.error(f"Ledger reconciliation found discrepancies: {report}")
+    else:
+        logger.info(
+            f"Ledger reconciled: {report['entries']} entries across {report['accounts']} accounts"
+        )
+    return report
@@ -0,0 +1,97 @@
+import asyncio
+from datetime import date, datetime, timezone
+from dateutil.relativedelta import relativedelta
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.db import task_engine
+from backend.app.transaction.partitioning import (
+    DEFAULT_HAS_ROWS_SQL,
+    DEFAULT_OLDEST_SQL,
+    LIST_PARTITIONS_SQL,
+    PARTITION_EXISTS_SQL,
+    create_partition_sql,
+    detach_partition_sql,
+    month_start,
+    move_default_rows_statements,
+    months_between,
+    partition_bounds,
+    partition_month,
+    partition_name,
+)
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+async def _ensure_partition(driver, month: date) -> None:
+    if await driver.fetchval(PARTITION_EXISTS_SQL, partition_name(month)):
+        return
+    if not await driver.fetchval(DEFAULT_HAS_ROWS_SQL, *partition_bounds(month)):
+        await driver.execute(create_partition_sql(month))
+        return
+
+    logger.warning(f"Moving {month:%Y-%m} rows out of the default partition into {partition_name(month)}")
+    async with driver.transaction():
+        await driver.execute(f"SET LOCAL lock_timeout = '{settings.TRANSACTION_PARTITION_LOCK_TIMEOUT_MS}ms'")
+        for statement in move_default_rows_statements(month):
+            await driver.execute(statement)
+
+
+async def _maintain_partitions(today: date, months_ahead: int, retention_months: int) -> dict:
+    current = month_start(today)
+    created, detached = [], []
+
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+
+        # Start at the oldest month stranded in the default partition, if any (a
+        # missed run or a migration), so its rows move out as well. Each month
+        # on its own, so one failure does not stop the later months.
+        oldest_default = await driver.fetchval(DEFAULT_OLDEST_SQL)
+        first = min(current, month_start(oldest_default.date())) if oldest_default else current
+        for month in months_between(first, current + relativedelta(months=months_ahead)):
+            try:
+                await _ensure_partition(driver, month)
+                created.append(month.isoformat())
+            except Exception as e:
+                logger.error(f"Could not create partition {partition_name(month)}, will retry next run: {e}")
+
+        if retention_months > 0:
+            oldest_kept = current - relativedelta(months=retention_months)
+            await driver.execute(f"SET lock_timeout = '{settings.TRANSACTION_PARTITION_LOCK_TIMEOUT_MS}ms'")
+            for row in await driver.fetch(LIST_PARTITIONS_SQL):
+                month = partition_month(row["name"])
+                if month >= oldest_kept:
+                    break
+                try:
+                    await driver.execute(detach_partition_sql(month))
+                    detached.append(row["name"])
+                except Exception as e:
+                    logger.warning(f"Could not detach partition {row['name']}, will retry next run: {e}")
+                    break
+            await driver.execute("RESET lock_timeout")
+
+    return {"ensured": created, "detached": detached}
+
+
+@celery_app.task(name="maintain_transaction_partitions", soft_time_limit=240)
+def maintain_transaction_partitions() -> dict:
+    """
+    Create the current and next TRANSACTION_PARTITION_MONTHS_AHEAD monthly
+    partitions so inserts never fall into the default partition, and detach
+    partitions older than TRANSACTION_PARTITION_RETENTION_MONTHS (0 keeps
+    everything). Detached partitions stay as standalone tables for archival.
+    """
+    result = asyncio.run(
+        _maintain_partitions(
+            datetime.now(timezone.utc).date(),
+            settings.TRANSACTION_PARTITION_MONTHS_AHEAD,
+            settings.TRANSACTION_PARTITION_RETENTION_MONTHS,
+        )
+    )
+    logger.info(
+        f"Transaction partitions ensured for {len(result['ensured'])} months "
+        f"({', '.join(result['ensured'])}), detached {len(result['detached'])}"
+    )
+    return result
@@ -0,0 +1,33 @@
+import asyncio
+import time
+from backend.app.core.celery_app import celery_app
+from backend.app.core.db import task_engine
+from backend.app.reporting.models import REPORTING_VIEWS
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+async def _refresh_views() -> dict[str, float]:
+    refreshed: dict[str, float] = {}
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        for name in REPORTING_VIEWS:
+            started = time.perf_counter()
+            try:
+                # CONCURRENTLY keeps the view readable while it is rebuilt.
+                await driver.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {name}")
+            except Exception as e:
+                logger.error(f"Failed to refresh reporting view {name}: {e}")
+                continue
+            refreshed[name] = round(time.perf_counter() - started, 3)
+    return refreshed
+
+
+@celery_app.task(name="refresh_reporting_views", soft_time_limit=240)
+def refresh_reporting_views() -> dict[str, float]:
+    """Refresh every branch-manager reporting view; returns seconds taken per view."""
+    refreshed = asyncio.run(_refresh_views())
+    logger.info(f"Refreshed reporting views: {refreshed}")
+    return refreshed
@@ -0,0 +1,45 @@
+import asyncio
+import uuid
+from sqlalchemy.dialects.postgresql import insert
+from backend.app.core.ai.models import TransactionRiskScore
+from backend.app.core.celery_app import celery_app
+from backend.app.core.db import task_session
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+async def _save_risk_score(
+        transaction_id: str,
+        risk_score: float,
+        risk_factors: dict,
+        ai_model_version: str,
+) -> None:
+    statement = insert(TransactionRiskScore).values(
+        id=uuid.uuid4(),
+        transaction_id=uuid.UUID(transaction_id),
+        risk_score=risk_score,
+        risk_factors=risk_factors,
+        ai_model_version=ai_model_version,
+    ).on_conflict_do_nothing(constraint="uq_risk_score_transaction_version")
+
+    async with task_session() as session:
+        await session.execute(statement)
+        await session.commit()
+
+
+@celery_app.task(
+    name="persist_risk_score",
+    bind=True,
+    max_retries=3,
+    soft_time_limit=30,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=60,
+)
+def persist_risk_score(
+    self, *, transaction_id: str, risk_score: float, risk_factors: dict, ai_model_version: str
+) -> bool:
+    asyncio.run(_save_risk_score(transaction_id, risk_score, risk_factors, ai_model_version))
+    logger.info(f"Stored risk score {risk_score} for transaction {transaction_id}")
+    return True
@@ -0,0 +1,86 @@
+import asyncio
+import uuid
+from datetime import datetime
+from backend.app.api.services.scheduled_transfer import (
+    claim_due_transfers,
+    execute_scheduled_transfer,
+    record_scheduled_transfer_error,
+)
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.db import task_session
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+async def _claim_batch(limit: int) -> list[tuple[uuid.UUID, datetime]]:
+    async with task_session() as session:
+        return await claim_due_transfers(session=session, limit=limit)
+
+
+async def _execute(schedule_id: str, due_at: str) -> str:
+    async with task_session() as session:
+        return await execute_scheduled_transfer(
+            schedule_id=uuid.UUID(schedule_id),
+            due_at=datetime.fromisoformat(due_at),
+            session=session,
+        )
+
+
+async def _record_error(schedule_id: str, due_at: str, error: str) -> str:
+    async with task_session() as session:
+        return await record_scheduled_transfer_error(
+            schedule_id=uuid.UUID(schedule_id),
+            due_at=datetime.fromisoformat(due_at),
+            error=error,
+            session=session,
+        )
+
+
+@celery_app.task(name="dispatch_due_transfers", soft_time_limit=120)
+def dispatch_due_transfers() -> int:
+    """
+    Claim due schedules batch by batch and fan each occurrence out as its own task,
+    publishing over a single broker connection.
+    """
+    batch_size = settings.SCHEDULED_TRANSFER_CLAIM_BATCH_SIZE
+    dispatched = 0
+
+    with celery_app.producer_or_acquire() as producer:
+        while dispatched < settings.SCHEDULED_TRANSFER_MAX_DISPATCH:
+            claimed = asyncio.run(_claim_batch(batch_size))
+            for schedule_id, due_at in claimed:
+                run_scheduled_transfer.apply_async(
+                    kwargs={"schedule_id": str(schedule_id), "due_at": due_at.isoformat()},
+                    producer=producer,
+                )
+            dispatched += len(claimed)
+            if len(claimed) < batch_size:
+                break
+
+    if dispatched:
+        logger.info(f"Dispatched {dispatched} scheduled transfers")
+    return dispatched
+
+
+@celery_app.task(
+    name="run_scheduled_transfer",
+    bind=True,
+    max_retries=3,
+    soft_time_limit=60,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=120,
+)
+def run_scheduled_transfer(self, *, schedule_id: str, due_at: str) -> str:
+    try:
+        outcome = asyncio.run(_execute(schedule_id, due_at))
+    except Exception as e:
+        if self.request.retries < self.max_retries:
+            raise
+        # Out of retries: record the failure so the occurrence is not claimed again.
+        logger.error(f"Scheduled transfer {schedule_id} at {due_at} failed after {self.request.retries} retries: {e}")
+        outcome = asyncio.run(_record_error(schedule_id, due_at, "Transfer could not be processed"))
+    logger.debug(f"Scheduled transfer {schedule_id} at {due_at}: {outcome}")
+    return outcome
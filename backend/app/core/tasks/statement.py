@@ -93,6 +93,8 @@ def generate_statement_pdf(self, statement_data: dict, statement_id: str) -> dic
             ["Account Name:", account["account_name"]],
             ["Account Type:", account["account_type"]],
             ["Currency:", account["account_currency"]],
+            ["Opening Balance:", account.get("opening_balance", "")],
+            ["Closing Balance:", account.get("closing_balance", "")],
             ["Current Balance:", str(account["balance"])],
         ]
 
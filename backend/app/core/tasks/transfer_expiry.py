@@ -0,0 +1,74 @@
+import asyncio
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.db import task_engine
+from backend.app.transaction.enums import TransactionFailureReasonEnum
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+# One batch of stale pending transfers, oldest first, walked through the partial
+# pending index. SKIP LOCKED leaves transfers that are being completed right now
+# to complete_transfer, which holds them FOR UPDATE.
+_EXPIRE_SQL = """
+UPDATE transaction
+SET status = 'EXPIRED',
+    failed_reason = $3,
+    updated_at = now(),
+    transaction_metadata = coalesce(transaction_metadata, '{}'::jsonb) || jsonb_build_object(
+        'failure_details', jsonb_build_object(
+            'reason', $3::text,
+            'timestamp', now(),
+            'error_message', 'Transfer was not confirmed before the OTP expired'
+        )
+    )
+WHERE (id, created_at) IN (
+    SELECT id, created_at FROM transaction
+    WHERE status = 'PENDING' AND transaction_type = 'TRANSFER' AND created_at < now() - make_interval(mins => $1)
+    ORDER BY created_at
+    LIMIT $2
+    FOR UPDATE SKIP LOCKED
+)
+"""
+
+
+# Database fallback OTPs of transfers that were never confirmed.
+_PURGE_CHALLENGES_SQL = "DELETE FROM transfer_otp_challenge WHERE expires_at < now()"
+
+
+async def _expire_pending(older_than_minutes: int, batch_size: int) -> int:
+    expired = 0
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        await driver.execute(_PURGE_CHALLENGES_SQL)
+        while True:
+            status = await driver.execute(
+                _EXPIRE_SQL,
+                older_than_minutes,
+                batch_size,
+                TransactionFailureReasonEnum.OTP_EXPIRED.value,
+            )
+            updated = int(status.split()[-1])
+            expired += updated
+            if updated < batch_size:
+                return expired
+
+
+@celery_app.task(name="expire_pending_transfers", soft_time_limit=50)
+def expire_pending_transfers() -> int:
+    """
+    Move transfers still PENDING after their OTP window (OTP_EXPIRATION_MINUTES
+    plus PENDING_TRANSFER_EXPIRY_GRACE_MINUTES) to EXPIRED, in batches of
+    PENDING_TRANSFER_EXPIRY_BATCH_SIZE, so the pending set only holds transfers
+    that can still be confirmed. Expired database fallback OTPs are purged too.
+    """
+    expired = asyncio.run(
+        _expire_pending(
+            settings.OTP_EXPIRATION_MINUTES + settings.PENDING_TRANSFER_EXPIRY_GRACE_MINUTES,
+            settings.PENDING_TRANSFER_EXPIRY_BATCH_SIZE,
+        )
+    )
+    if expired:
+        logger.info(f"Expired {expired} pending transfers")
+    return expired
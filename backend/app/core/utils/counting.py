@@ -0,0 +1,40 @@
+import json
+from sqlalchemy import func, select
+from sqlalchemy.sql import Select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.core.config import settings
+
+
+async def estimate_count(session: AsyncSession, statement: Select) -> int:
+    """
+    Row estimate from the planner, without running the query. Only for
+    statements whose parameters render as literals (enums, booleans, numbers,
+    strings).
+    """
+    connection = await session.connection()
+    sql = str(statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_rows(
+        session: AsyncSession,
+        statement: Select,
+        exact_below: int | None = None,
+) -> tuple[int, bool]:
+    """
+    Number of rows `statement` returns, and whether it is an estimate. Counts
+    exactly while the planner expects fewer than `exact_below` rows
+    (EXACT_COUNT_THRESHOLD by default); past that an exact count costs a scan
+    of every matching row, so the planner's estimate is returned instead.
+    """
+    exact_below = settings.EXACT_COUNT_THRESHOLD if exact_below is None else exact_below
+    estimate = await estimate_count(session, statement)
+    if estimate >= exact_below:
+        return estimate, True
+
+    result = await session.execute(select(func.count()).select_from(statement.order_by(None).subquery()))
+    return result.scalar_one(), False
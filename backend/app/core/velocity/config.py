@@ -0,0 +1,61 @@
+from pydantic import BaseModel
+from backend.app.bank_account.enums import AccountTypeEnum
+from backend.app.core.ai.config import ai_settings
+
+
+class VelocityWindow(BaseModel):
+    """
+    A sliding spending window for debits.
+
+    Attributes:
+        name (str): Label used in keys and error messages, e.g. "hourly".
+        window_seconds (int): Length of the sliding window.
+        bucket_seconds (int): Granularity of the bucketed counters; the window slides in these steps.
+        max_amount (float | None): Maximum total debited within the window. None disables the check.
+        max_count (int | None): Maximum number of debits within the window. None disables the check.
+    """
+
+    name: str
+    window_seconds: int
+    bucket_seconds: int
+    max_amount: float | None = None
+    max_count: int | None = None
+
+
+def _hourly(max_amount: float, max_count: int) -> VelocityWindow:
+    return VelocityWindow(
+        name="hourly",
+        window_seconds=3600,
+        bucket_seconds=60,
+        max_amount=max_amount,
+        max_count=max_count,
+    )
+
+
+def _daily(max_amount: float, max_count: int) -> VelocityWindow:
+    return VelocityWindow(
+        name="daily",
+        window_seconds=86400,
+        bucket_seconds=900,
+        max_amount=max_amount,
+        max_count=max_count,
+    )
+
+
+ACCOUNT_VELOCITY_LIMITS: dict[AccountTypeEnum, list[VelocityWindow]] = {
+    AccountTypeEnum.Current: [
+        _hourly(max_amount=20000, max_count=ai_settings.FREQUENCY_THRESHOLD * 2),
+        _daily(max_amount=ai_settings.VELOCITY_THRESHOLD, max_count=50),
+    ],
+    AccountTypeEnum.Savings: [
+        _hourly(max_amount=10000, max_count=ai_settings.FREQUENCY_THRESHOLD),
+        _daily(max_amount=ai_settings.VELOCITY_THRESHOLD / 2, max_count=20),
+    ],
+    AccountTypeEnum.Fixed_deposit: [
+        _daily(max_amount=ai_settings.VELOCITY_THRESHOLD * 2, max_count=2),
+    ],
+    AccountTypeEnum.Business: [
+        _hourly(max_amount=ai_settings.VELOCITY_THRESHOLD * 2, max_count=ai_settings.FREQUENCY_THRESHOLD * 10),
+        _daily(max_amount=ai_settings.VELOCITY_THRESHOLD * 10, max_count=500),
+    ],
+}
@@ -0,0 +1,228 @@
+import math
+import uuid
+from datetime import datetime, timezone
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from backend.app.bank_account.enums import AccountTypeEnum
+from backend.app.core.redis_client import get_redis
+from backend.app.core.velocity.config import ACCOUNT_VELOCITY_LIMITS
+from backend.app.core.logging import get_logger
+from backend.app.virtual_card.models import VirtualCard
+
+logger = get_logger()
+
+# Checks every window and, only if all of them have room, books the debit into the
+# current bucket of each. Buckets are hash fields "a:<bucket>" (amount) and
+# "c:<bucket>" (count); buckets older than the window are dropped while summing.
+#   KEYS: one hash per window
+#   ARGV: amount, then per window: bucket, bucket count, max amount, max count, ttl
+#         (a negative max disables that check)
+# Returns {0, total per window...} when booked or {window index, amount, count} when rejected.
+_RESERVE_SCRIPT = """
+local amount = tonumber(ARGV[1])
+local totals = {}
+
+for i = 1, #KEYS do
+    local base = 1 + (i - 1) * 5
+    local bucket = tonumber(ARGV[base + 1])
+    local oldest = bucket - tonumber(ARGV[base + 2]) + 1
+    local max_amount = tonumber(ARGV[base + 3])
+    local max_count = tonumber(ARGV[base + 4])
+    local spent = 0
+    local count = 0
+
+    local fields = redis.call('HGETALL', KEYS[i])
+    for j = 1, #fields, 2 do
+        local kind, field_bucket = string.match(fields[j], '^(%a):(%-?%d+)$')
+        if tonumber(field_bucket) < oldest then
+            redis.call('HDEL', KEYS[i], fields[j])
+        elseif kind == 'a' then
+            spent = spent + tonumber(fields[j + 1])
+        else
+            count = count + tonumber(fields[j + 1])
+        end
+    end
+
+    if (max_amount >= 0 and spent + amount > max_amount) or (max_count >= 0 and count + 1 > max_count) then
+        return {i, tostring(spent), count}
+    end
+    totals[i] = spent
+end
+
+local result = {0}
+for i = 1, #KEYS do
+    local base = 1 + (i - 1) * 5
+    redis.call('HINCRBYFLOAT', KEYS[i], 'a:' .. ARGV[base + 1], ARGV[1])
+    redis.call('HINCRBY', KEYS[i], 'c:' .. ARGV[base + 1], 1)
+    redis.call('EXPIRE', KEYS[i], ARGV[base + 5])
+    result[#result + 1] = tostring(totals[i] + amount)
+end
+return result
+"""
+
+
+class VelocityLimitExceededError(HTTPException):
+    def __init__(self, scope: str, window: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": f"{scope.capitalize()} {window} transaction limit exceeded",
+                "action": "Please try a smaller amount or try again later."
+            },
+        )
+
+
+class _BookedWindow(BaseModel):
+    scope: str
+    name: str
+    key: str
+    bucket: int
+    buckets: int
+    max_amount: float | None
+    max_count: int | None
+    ttl: int
+
+
+class VelocityReservation(BaseModel):
+    """A debit booked into the velocity windows, with each window's total including it."""
+
+    amount: float
+    windows: list[_BookedWindow]
+    totals: dict[str, float] = {}
+
+
+class VelocityLimitEngine:
+    """
+    Per-account and per-card spending windows kept as bucketed counters in Redis.
+
+    Account windows slide (ACCOUNT_VELOCITY_LIMITS per account type). Card windows
+    are the calendar day and month, checked against the card's own spending limits.
+    A single script call checks every window and books the debit, so callers
+    reserve right before committing the debit and release the reservation if the
+    commit does not happen.
+    """
+
+    def __init__(self):
+        self._script = None
+
+    def _get_script(self):
+        if self._script is None:
+            self._script = get_redis().register_script(_RESERVE_SCRIPT)
+        return self._script
+
+    def _account_windows(
+            self, account_id: uuid.UUID,
+            account_type: AccountTypeEnum,
+            now: datetime,
+    ) -> list[_BookedWindow]:
+        timestamp = now.timestamp()
+        return [
+            _BookedWindow(
+                scope="account",
+                name=window.name,
+                key=f"velocity:account:{account_id}:{window.name}",
+                bucket=math.floor(timestamp / window.bucket_seconds),
+                buckets=math.ceil(window.window_seconds / window.bucket_seconds),
+                max_amount=window.max_amount,
+                max_count=window.max_count,
+                ttl=window.window_seconds + window.bucket_seconds,
+            )
+            for window in ACCOUNT_VELOCITY_LIMITS.get(account_type, [])
+        ]
+
+    def _card_windows(self, card: VirtualCard, now: datetime) -> list[_BookedWindow]:
+        # Calendar windows: the period is part of the key, so one bucket covers it.
+        return [
+            _BookedWindow(
+                scope="card",
+                name="daily",
+                key=f"velocity:card:{card.id}:day:{now:%Y%m%d}",
+                bucket=0,
+                buckets=1,
+                max_amount=card.daily_spending_limit,
+                max_count=None,
+                ttl=2 * 86400,
+            ),
+            _BookedWindow(
+                scope="card",
+                name="monthly",
+                key=f"velocity:card:{card.id}:month:{now:%Y%m}",
+                bucket=0,
+                buckets=1,
+                max_amount=card.monthly_spending_limit,
+                max_count=None,
+                ttl=32 * 86400,
+            ),
+        ]
+
+    async def reserve(
+            self, *,
+            amount: float,
+            account_id: uuid.UUID,
+            account_type: AccountTypeEnum,
+            card: VirtualCard | None = None,
+            now: datetime | None = None,
+    ) -> VelocityReservation:
+        now = now or datetime.now(timezone.utc)
+        windows = self._account_windows(account_id, account_type, now)
+        if card is not None:
+            windows += self._card_windows(card, now)
+
+        reservation = VelocityReservation(amount=float(amount), windows=windows)
+        if not windows:
+            return reservation
+
+        args: list = [f"{float(amount):.2f}"]
+        for window in windows:
+            args += [
+                window.bucket,
+                window.buckets,
+                -1 if window.max_amount is None else window.max_amount,
+                -1 if window.max_count is None else window.max_count,
+                window.ttl,
+            ]
+
+        try:
+            result = await self._get_script()(keys=[w.key for w in windows], args=args)
+        except Exception as e:
+            logger.error(f"Velocity limit check unavailable for account {account_id}: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={
+                    "status": "error",
+                    "message": "Unable to verify transaction limits",
+                    "action": "Please try again shortly."
+                },
+            ) from e
+
+        rejected = int(result[0])
+        if rejected:
+            window = windows[rejected - 1]
+            logger.warning(
+                f"Velocity limit hit: {window.scope} {window.name} window for account {account_id} "
+                f"(spent={result[1]}, count={result[2]}, amount={amount})"
+            )
+            raise VelocityLimitExceededError(window.scope, window.name)
+
+        reservation.totals = {
+            f"{window.scope}:{window.name}": float(total)
+            for window, total in zip(windows, result[1:])
+        }
+        return reservation
+
+    async def release(self, reservation: VelocityReservation | None) -> None:
+        """Undo a reservation whose debit was not committed."""
+        if reservation is None or not reservation.windows:
+            return
+        try:
+            pipe = get_redis().pipeline(transaction=True)
+            for window in reservation.windows:
+                pipe.hincrbyfloat(window.key, f"a:{window.bucket}", -reservation.amount)
+                pipe.hincrby(window.key, f"c:{window.bucket}", -1)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to release velocity reservation: {e}")
+
+
+velocity_engine = VelocityLimitEngine()
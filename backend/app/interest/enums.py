@@ -0,0 +1,5 @@
+from enum import Enum
+
+class InterestAccrualRunStatusEnum(str, Enum):
+    RUNNING = "running"
+    COMPLETED = "completed"
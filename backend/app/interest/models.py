@@ -0,0 +1,81 @@
+import uuid
+from decimal import Decimal
+from datetime import date, datetime, timezone
+from sqlmodel import Field, Column, SQLModel
+from sqlalchemy.dialects import postgresql as pg
+from sqlalchemy import text, Date, Numeric, UniqueConstraint
+from sqlalchemy import Enum as SAEnum
+from backend.app.interest.enums import InterestAccrualRunStatusEnum
+
+
+class InterestAccrual(SQLModel, table=True):
+    """
+    Interest accrued on one account for one day. The (account, day) key makes
+    accrual idempotent: rerunning a day never adds a second row.
+    """
+
+    __tablename__ = "interest_accrual"
+    __table_args__ = (
+        UniqueConstraint("bank_account_id", "accrual_date", name="uq_interest_accrual_account_date"),
+    )
+
+    id: uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            primary_key=True,
+        ),
+        default_factory=uuid.uuid4
+    )
+    bank_account_id: uuid.UUID = Field(foreign_key="bankaccount.id", ondelete="CASCADE")
+    accrual_date: date = Field(sa_column=Column(Date, nullable=False, index=True))
+    currency: str = Field(max_length=3)
+    balance: Decimal = Field(sa_column=Column(Numeric(18, 2), nullable=False))
+    interest_rate: float
+    # Sub-cent precision; amounts are rounded to cents when interest is credited.
+    amount: Decimal = Field(sa_column=Column(Numeric(18, 6), nullable=False))
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        )
+    )
+
+
+class InterestAccrualRun(SQLModel, table=True):
+    """
+    One accrual run per day. last_account_id is committed with each batch, so an
+    interrupted run resumes after the last account it finished.
+    """
+
+    __tablename__ = "interest_accrual_run"
+
+    accrual_date: date = Field(sa_column=Column(Date, primary_key=True))
+    status: InterestAccrualRunStatusEnum = Field(
+        default=InterestAccrualRunStatusEnum.RUNNING,
+        sa_column=Column(
+            SAEnum(
+                InterestAccrualRunStatusEnum,
+                name="interest_accrual_run_status_enum",
+                create_type=False
+            ),
+            nullable=False
+        )
+    )
+    last_account_id: uuid.UUID | None = Field(default=None)
+    accounts_processed: int = Field(default=0)
+    accruals_written: int = Field(default=0)
+    duration_seconds: float = Field(default=0.0)
+    started_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        )
+    )
+    completed_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=True)
+    )
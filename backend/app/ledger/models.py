@@ -0,0 +1,135 @@
+import uuid
+from decimal import Decimal
+from datetime import datetime, timezone
+from sqlmodel import Field, Column, SQLModel
+from sqlalchemy.dialects import postgresql as pg
+from datetime import date as date_type
+from sqlalchemy import text, event, DDL, BigInteger, Date, Identity, Index, Numeric, UniqueConstraint
+
+
+class LedgerEntry(SQLModel, table=True):
+    """
+    One leg of a journal. Amounts are signed liability-side, as credits: a positive
+    amount increases a customer balance. Bank-side accounts such as cash, FX
+    clearing and fee income carry the same sign, so a deposit posts a negative
+    cash leg and a withdrawal a positive one. The legs of a journal sum to zero
+    per currency. Rows are never updated or deleted; corrections are posted as
+    new journals.
+    """
+
+    __tablename__ = "ledger_entry"
+    # Serve "snapshot + postings after it" lookups per account, by sequence and by
+    # time, and the nightly scan of one day's postings.
+    __table_args__ = (
+        Index("ix_ledger_entry_account_sequence", "account_code", "currency", "sequence"),
+        Index("ix_ledger_entry_account_created", "account_code", "created_at"),
+        Index("ix_ledger_entry_created_at", "created_at"),
+    )
+
+    id: uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            primary_key=True,
+        ),
+        default_factory=uuid.uuid4
+    )
+    # Global posting order, assigned by the database on insert.
+    sequence: int | None = Field(
+        default=None,
+        sa_column=Column(BigInteger, Identity(always=True), unique=True, nullable=False),
+    )
+    journal_id: uuid.UUID = Field(index=True)
+    # Not a foreign key: the journal outlives the transaction row, which may be
+    # archived or live in a partitioned table.
+    transaction_id: uuid.UUID | None = Field(default=None, index=True)
+    account_code: str = Field(max_length=64)
+    currency: str = Field(max_length=3)
+    amount: Decimal = Field(sa_column=Column(Numeric(18, 2), nullable=False))
+    description: str | None = Field(default=None, max_length=250)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        )
+    )
+
+
+class LedgerBalanceSnapshot(SQLModel, table=True):
+    """Balance of an account including every entry up to and including last_sequence."""
+
+    __tablename__ = "ledger_balance_snapshot"
+    __table_args__ = (
+        Index("ix_ledger_snapshot_account_sequence", "account_code", "currency", "last_sequence"),
+    )
+
+    id: uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            primary_key=True,
+        ),
+        default_factory=uuid.uuid4
+    )
+    account_code: str = Field(max_length=64)
+    currency: str = Field(max_length=3)
+    balance: Decimal = Field(sa_column=Column(Numeric(18, 2), nullable=False))
+    last_sequence: int = Field(sa_column=Column(BigInteger, nullable=False, index=True))
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        )
+    )
+
+
+class LedgerDailyBalance(SQLModel, table=True):
+    """
+    End-of-day (UTC) balance of an account: every entry created before midnight
+    following balance_date. Rows exist only for days the account had postings, so
+    the latest row on or before a day is that day's closing balance.
+    """
+
+    __tablename__ = "ledger_daily_balance"
+    __table_args__ = (
+        UniqueConstraint("account_code", "balance_date", name="uq_ledger_daily_balance_account_date"),
+    )
+
+    id: uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            primary_key=True,
+        ),
+        default_factory=uuid.uuid4
+    )
+    account_code: str = Field(max_length=64)
+    currency: str = Field(max_length=3)
+    balance_date: date_type = Field(sa_column=Column(Date, nullable=False))
+    balance: Decimal = Field(sa_column=Column(Numeric(18, 2), nullable=False))
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        )
+    )
+
+
+# Append-only at the database level too. Autogenerated migrations do not pick up
+# triggers, so the migration that creates ledger_entry must emit these as well.
+LEDGER_APPEND_ONLY_FUNCTION = DDL(
+    "CREATE OR REPLACE FUNCTION ledger_entry_append_only() RETURNS trigger AS $$ "
+    "BEGIN RAISE EXCEPTION 'ledger_entry is append-only'; END; "
+    "$$ LANGUAGE plpgsql"
+)
+LEDGER_APPEND_ONLY_TRIGGER = DDL(
+    "CREATE TRIGGER ledger_entry_append_only "
+    "BEFORE UPDATE OR DELETE ON ledger_entry "
+    "FOR EACH ROW EXECUTE FUNCTION ledger_entry_append_only()"
+)
+
+event.listen(LedgerEntry.__table__, "after_create", LEDGER_APPEND_ONLY_FUNCTION)
+event.listen(LedgerEntry.__table__, "after_create", LEDGER_APPEND_ONLY_TRIGGER)
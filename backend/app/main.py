@@ -7,6 +7,10 @@ from backend.app.core.db import init_db, engine
 from backend.app.core.logging import get_logger
 from backend.app.core.health import health_checker, ServiceStatus
 from backend.app.core.rate_limit.middleware import RateLimitMiddleware
+from backend.app.core.redis_client import close_redis
+from backend.app.core.hashing.service import hashing_service
+from backend.app.core.ai.config import ai_settings
+from backend.app.core.ai.predictor import fraud_predictor
 import asyncio
 import time
 
@@ -48,6 +52,9 @@ async def lifespan(app: FastAPI):
         await init_db()
         logger.info("Database initialized successfully!")
 
+        if ai_settings.USE_TRAINED_MODEL:
+            fraud_predictor.load()
+
         await health_checker.add_service("database", health_checker.check_database)
 
         await health_checker.add_service("celery", health_checker.check_celery)
@@ -57,6 +64,7 @@ async def lifespan(app: FastAPI):
         if not await startup_health_check():
             raise RuntimeError("Critical services failed to start")
         logger.info("All services initialized and healthy")
+        health_checker.start_background_refresh()
         yield
     except Exception as e:
         logger.error(f"Application startup failed: {e}")
@@ -67,6 +75,8 @@ async def lifespan(app: FastAPI):
         logger.info("Shuting down application...")
         await engine.dispose()
         await health_checker.cleanup()
+        await close_redis()
+        hashing_service.shutdown()
 
 
 
@@ -79,10 +89,23 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+@app.get("/health/live", response_model=dict)
+async def liveness_check():
+    return {"status": "alive", "timestamp": time.time()}
+
+
+@app.get("/health/ready", response_model=dict)
+async def readiness_check():
+    health_status = health_checker.get_cached_status()
+    if health_status["status"] == ServiceStatus.HEALTHY:
+        return JSONResponse(status_code=status.HTTP_200_OK, content=health_status)
+    return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=health_status)
+
+
 @app.get("/health", response_model=dict)
 async def health_check():
     try:
-        health_status = await health_checker.check_all_services()
+        health_status = health_checker.get_cached_status()
 
         if health_status["status"] == ServiceStatus.HEALTHY:
             status_code = status.HTTP_200_OK
@@ -0,0 +1,121 @@
+from sqlalchemy import event, DDL, Date, Integer, Numeric, String, column, table
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects import postgresql as pg
+from sqlmodel import SQLModel
+from backend.app.bank_account.enums import AccountTypeEnum, AccountStatusEnum, AccountCurrencyEnum
+from backend.app.core.config import settings
+from backend.app.virtual_card.enums import (
+    VirtualCardTypeEnum,
+    VirtualCardProviderEnum,
+    VirtualCardCurrencyEnum,
+    VirtualCardStatusEnum,
+)
+
+# Branch-manager reports are served from materialized views refreshed by
+# refresh_reporting_views. REFRESH ... CONCURRENTLY needs a unique index on each
+# view. Autogenerate does not see views, so the migration that adds them must
+# emit create_view_statements() for each; create_all gets them via the hooks below.
+REPORTING_VIEWS: dict[str, tuple[str, str]] = {
+    "report_active_accounts": (
+        """
+        SELECT account_type, account_currency, account_status,
+               COUNT(*) AS account_count,
+               COUNT(*) FILTER (WHERE kyc_verified) AS kyc_verified_count,
+               COALESCE(SUM(balance), 0)::numeric(18, 2) AS total_balance
+        FROM bankaccount
+        GROUP BY account_type, account_currency, account_status
+        """,
+        "account_type, account_currency, account_status",
+    ),
+    "report_teller_deposits": (
+        f"""
+        SELECT processed_by AS teller_id,
+               (created_at AT TIME ZONE 'UTC')::date AS deposit_date,
+               COALESCE(transaction_metadata ->> 'account_currency', '') AS currency,
+               COUNT(*) AS deposit_count,
+               SUM(amount) AS total_amount
+        FROM "transaction"
+        WHERE transaction_type = 'DEPOSIT' AND status = 'COMPLETED' AND processed_by IS NOT NULL
+          AND created_at >= date_trunc('day', now()) - interval '{settings.REPORTING_WINDOW_DAYS} days'
+        GROUP BY 1, 2, 3
+        """,
+        "teller_id, deposit_date, currency",
+    ),
+    # Transfer debits are already rolled up per account and day, so this view
+    # never reads the transaction table.
+    "report_transfer_volume": (
+        """
+        SELECT r.rollup_date AS transfer_date,
+               b.account_currency AS currency,
+               SUM(r.transaction_count) AS transfer_count,
+               SUM(r.total_amount) AS total_amount
+        FROM account_daily_rollup r
+        JOIN bankaccount b ON b.id = r.account_id
+        WHERE r.transaction_type = 'TRANSFER' AND r.transaction_category = 'DEBIT'
+        GROUP BY 1, 2
+        """,
+        "transfer_date, currency",
+    ),
+    "report_card_issuance": (
+        """
+        SELECT date_trunc('month', created_at AT TIME ZONE 'UTC')::date AS issued_month,
+               card_type, card_provider, currency, card_status,
+               COUNT(*) AS card_count
+        FROM virtualcard
+        GROUP BY 1, 2, 3, 4, 5
+        """,
+        "issued_month, card_type, card_provider, currency, card_status",
+    ),
+}
+
+
+def create_view_statements(name: str) -> list[str]:
+    query, unique_columns = REPORTING_VIEWS[name]
+    return [
+        f"CREATE MATERIALIZED VIEW IF NOT EXISTS {name} AS {query}",
+        f"CREATE UNIQUE INDEX IF NOT EXISTS uq_{name} ON {name} ({unique_columns})",
+    ]
+
+
+for view_name in REPORTING_VIEWS:
+    for statement in create_view_statements(view_name):
+        event.listen(SQLModel.metadata, "after_create", DDL(statement))
+
+
+# Query-side handles for the views; plain table clauses, so create_all skips them.
+active_accounts_view = table(
+    "report_active_accounts",
+    column("account_type", SAEnum(AccountTypeEnum)),
+    column("account_currency", SAEnum(AccountCurrencyEnum)),
+    column("account_status", SAEnum(AccountStatusEnum)),
+    column("account_count", Integer),
+    column("kyc_verified_count", Integer),
+    column("total_balance", Numeric(18, 2)),
+)
+
+teller_deposits_view = table(
+    "report_teller_deposits",
+    column("teller_id", pg.UUID(as_uuid=True)),
+    column("deposit_date", Date),
+    column("currency", String),
+    column("deposit_count", Integer),
+    column("total_amount", Numeric(18, 2)),
+)
+
+transfer_volume_view = table(
+    "report_transfer_volume",
+    column("transfer_date", Date),
+    column("currency", SAEnum(AccountCurrencyEnum)),
+    column("transfer_count", Integer),
+    column("total_amount", Numeric(18, 2)),
+)
+
+card_issuance_view = table(
+    "report_card_issuance",
+    column("issued_month", Date),
+    column("card_type", SAEnum(VirtualCardTypeEnum)),
+    column("card_provider", SAEnum(VirtualCardProviderEnum)),
+    column("currency", SAEnum(VirtualCardCurrencyEnum)),
+    column("card_status", SAEnum(VirtualCardStatusEnum)),
+    column("card_count", Integer),
+)
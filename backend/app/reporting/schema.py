@@ -0,0 +1,44 @@
+import uuid
+from decimal import Decimal
+from datetime import date
+from sqlmodel import SQLModel
+from backend.app.bank_account.enums import AccountTypeEnum, AccountStatusEnum, AccountCurrencyEnum
+from backend.app.virtual_card.enums import (
+    VirtualCardTypeEnum,
+    VirtualCardProviderEnum,
+    VirtualCardCurrencyEnum,
+    VirtualCardStatusEnum,
+)
+
+
+class ActiveAccountsReportSchema(SQLModel):
+    account_type: AccountTypeEnum
+    account_currency: AccountCurrencyEnum
+    account_status: AccountStatusEnum
+    account_count: int
+    kyc_verified_count: int
+    total_balance: Decimal
+
+
+class TellerDepositsReportSchema(SQLModel):
+    teller_id: uuid.UUID
+    teller_name: str | None = None
+    currency: str
+    deposit_count: int
+    total_amount: Decimal
+
+
+class TransferVolumeReportSchema(SQLModel):
+    transfer_date: date
+    currency: AccountCurrencyEnum
+    transfer_count: int
+    total_amount: Decimal
+
+
+class CardIssuanceReportSchema(SQLModel):
+    issued_month: date
+    card_type: VirtualCardTypeEnum
+    card_provider: VirtualCardProviderEnum
+    currency: VirtualCardCurrencyEnum
+    card_status: VirtualCardStatusEnum
+    card_count: int
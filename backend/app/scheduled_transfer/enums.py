@@ -0,0 +1,13 @@
+from enum import Enum
+
+class TransferFrequencyEnum(str, Enum):
+    ONCE = "once"
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+class ScheduledTransferStatusEnum(str, Enum):
+    ACTIVE = "active"
+    PAUSED = "paused"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
@@ -0,0 +1,65 @@
+import uuid
+from datetime import datetime, timezone
+from sqlmodel import Field, Column
+from sqlalchemy.dialects import postgresql as pg
+from sqlalchemy import text, func, Index
+from backend.app.scheduled_transfer.schema import ScheduledTransferBaseSchema
+
+
+class ScheduledTransfer(ScheduledTransferBaseSchema, table=True): # type: ignore
+    __tablename__ = "scheduled_transfer"
+    # The scheduler only ever scans active schedules in next_run_at order.
+    __table_args__ = (
+        Index(
+            "ix_scheduled_transfer_due",
+            "next_run_at",
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
+    )
+
+    id: uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            primary_key=True,
+        ),
+        default_factory=uuid.uuid4
+    )
+    user_id: uuid.UUID = Field(foreign_key="user.id", ondelete="CASCADE", index=True)
+    sender_account_id: uuid.UUID = Field(foreign_key="bankaccount.id", ondelete="CASCADE")
+    start_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False)
+    )
+    next_run_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False)
+    )
+    end_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=True)
+    )
+    last_run_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=True)
+    )
+    # Lease taken by the scheduler when it dispatches a run; an expired lease lets
+    # a later scheduler pass dispatch the run again.
+    claimed_until: datetime | None = Field(
+        default=None,
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=True)
+    )
+    last_transaction_id: uuid.UUID | None = Field(default=None)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        )
+    )
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            onupdate=func.current_timestamp(),
+        ),
+    )
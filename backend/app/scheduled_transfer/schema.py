@@ -0,0 +1,69 @@
+import uuid
+from decimal import Decimal
+from datetime import datetime
+from sqlmodel import SQLModel, Field, Column
+from sqlalchemy import Enum as SAEnum
+from backend.app.scheduled_transfer.enums import TransferFrequencyEnum, ScheduledTransferStatusEnum
+
+
+class ScheduledTransferBaseSchema(SQLModel):
+    receiver_account_number: str = Field(min_length=16, max_length=16)
+    amount: Decimal = Field(decimal_places=2, gt=0)
+    description: str = Field(max_length=250)
+    frequency: TransferFrequencyEnum = Field(
+        sa_column=Column(
+            SAEnum(
+                TransferFrequencyEnum,
+                name="transfer_frequency_enum",
+                create_type=False
+            ),
+            nullable=False
+        )
+    )
+    status: ScheduledTransferStatusEnum = Field(
+        default=ScheduledTransferStatusEnum.ACTIVE,
+        sa_column=Column(
+            SAEnum(
+                ScheduledTransferStatusEnum,
+                name="scheduled_transfer_status_enum",
+                create_type=False
+            ),
+            nullable=False
+        )
+    )
+    # Occurrences handled so far, successful or skipped; the next run is derived
+    # from start_at and this count.
+    occurrences: int = Field(default=0)
+    runs_count: int = Field(default=0)
+    consecutive_failures: int = Field(default=0)
+    last_error: str | None = Field(default=None, max_length=255)
+
+
+class ScheduledTransferCreateSchema(SQLModel):
+    sender_account_id: uuid.UUID
+    receiver_account_number: str = Field(min_length=16, max_length=16)
+    amount: Decimal = Field(decimal_places=2, gt=0)
+    description: str = Field(max_length=250)
+    frequency: TransferFrequencyEnum
+    start_at: datetime
+    end_at: datetime | None = None
+    security_answer: str = Field(max_length=30)
+
+
+class ScheduledTransferReadSchema(SQLModel):
+    id: uuid.UUID
+    sender_account_id: uuid.UUID
+    receiver_account_number: str
+    amount: Decimal
+    description: str
+    frequency: TransferFrequencyEnum
+    status: ScheduledTransferStatusEnum
+    start_at: datetime
+    next_run_at: datetime
+    end_at: datetime | None = None
+    last_run_at: datetime | None = None
+    occurrences: int
+    runs_count: int
+    consecutive_failures: int
+    last_error: str | None = None
+    created_at: datetime
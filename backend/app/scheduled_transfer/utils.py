@@ -0,0 +1,20 @@
+from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
+from backend.app.scheduled_transfer.enums import TransferFrequencyEnum
+
+_INTERVALS = {
+    TransferFrequencyEnum.DAILY: relativedelta(days=1),
+    TransferFrequencyEnum.WEEKLY: timedelta(weeks=1),
+    TransferFrequencyEnum.MONTHLY: relativedelta(months=1),
+}
+
+
+def next_occurrence(frequency: TransferFrequencyEnum, start_at: datetime, occurrences: int) -> datetime | None:
+    """
+    The run after `occurrences` handled runs, counted from the first run so monthly
+    schedules keep their day of month (Jan 31 -> Feb 28 -> Mar 31). None once a
+    one-off transfer has run.
+    """
+    if frequency == TransferFrequencyEnum.ONCE:
+        return None if occurrences else start_at
+    return start_at + _INTERVALS[frequency] * occurrences
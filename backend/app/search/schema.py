@@ -0,0 +1,21 @@
+import uuid
+from sqlmodel import SQLModel
+from backend.app.auth.schema import AccountStatusSchema
+
+
+class CustomerSearchResultSchema(SQLModel):
+    user_id: uuid.UUID
+    full_name: str
+    username: str | None = None
+    email: str
+    phone_number: str | None = None
+    account_status: AccountStatusSchema
+    account_numbers: list[str] = []
+    score: float
+
+
+class CustomerSearchResponseSchema(SQLModel):
+    results: list[CustomerSearchResultSchema]
+    limit: int
+    offset: int
+    has_more: bool
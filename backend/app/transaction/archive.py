@@ -0,0 +1,177 @@
+import json
+import os
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+import pyarrow as pa
+import pyarrow.parquet as pq
+from backend.app.core.ai.enums import AIReviewStatusEnum
+from backend.app.core.config import settings
+from backend.app.transaction.enums import TransactionTypeEnum, TransactionStatusEnum, TransactionCategoryEnum
+from backend.app.transaction.models import Transaction
+from backend.app.transaction.partitioning import months_between
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+_MONEY = pa.decimal128(18, 2)
+_TIMESTAMP = pa.timestamp("us", tz="UTC")
+
+# Columns as stored in Postgres: enums by name, ids as text, metadata as JSON text.
+ARCHIVE_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("reference", pa.string()),
+    ("amount", _MONEY),
+    ("description", pa.string()),
+    ("transaction_type", pa.string()),
+    ("transaction_category", pa.string()),
+    ("status", pa.string()),
+    ("balance_before", _MONEY),
+    ("balance_after", _MONEY),
+    ("transaction_metadata", pa.string()),
+    ("failed_reason", pa.string()),
+    ("ai_review_status", pa.string()),
+    ("sender_account_id", pa.string()),
+    ("receiver_account_id", pa.string()),
+    ("sender_id", pa.string()),
+    ("receiver_id", pa.string()),
+    ("processed_by", pa.string()),
+    ("created_at", _TIMESTAMP),
+    ("completed_at", _TIMESTAMP),
+    ("updated_at", _TIMESTAMP),
+])
+
+ARCHIVE_COLUMNS = ARCHIVE_SCHEMA.names
+
+_UUID_COLUMNS = ("id", "sender_account_id", "receiver_account_id", "sender_id", "receiver_id", "processed_by")
+_ENUM_COLUMNS = {
+    "transaction_type": TransactionTypeEnum,
+    "transaction_category": TransactionCategoryEnum,
+    "status": TransactionStatusEnum,
+    "ai_review_status": AIReviewStatusEnum,
+}
+
+
+def _to_archive_row(row: dict[str, Any]) -> dict[str, Any]:
+    archived = dict(row)
+    for column in _UUID_COLUMNS:
+        if archived[column] is not None:
+            archived[column] = str(archived[column])
+    metadata = archived["transaction_metadata"]
+    if metadata is not None and not isinstance(metadata, str):
+        archived["transaction_metadata"] = json.dumps(metadata, default=str)
+    return archived
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Naive datetimes are taken as UTC, as asyncpg does for timestamptz parameters.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _to_transaction(row: dict[str, Any]) -> Transaction:
+    for column in _UUID_COLUMNS:
+        if row[column] is not None:
+            row[column] = uuid.UUID(row[column])
+    for column, enum in _ENUM_COLUMNS.items():
+        if row[column] is not None:
+            row[column] = enum[row[column]]
+    if row["transaction_metadata"] is not None:
+        row["transaction_metadata"] = json.loads(row["transaction_metadata"])
+    return Transaction(**row)
+
+
+class ArchiveMonthWriter:
+    def __init__(self, writer: pq.ParquetWriter):
+        self._writer = writer
+        self.rows = 0
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._writer.write_table(
+            pa.Table.from_pylist([_to_archive_row(row) for row in rows], schema=ARCHIVE_SCHEMA)
+        )
+        self.rows += len(rows)
+
+
+class TransactionArchive:
+    """
+    Archived transaction partitions as zstd-compressed Parquet, one file per month:
+
+        <root>/<year>/<year>-<month>.parquet
+
+    Rows are written oldest first, so each row group covers a narrow created_at
+    range and date filters skip most of a file. transaction_reference keeps the
+    reference index for archived rows, with the file in archived_in.
+    """
+
+    def __init__(self, root: str):
+        self._root = Path(root)
+
+    def month_path(self, month: date) -> Path:
+        return self._root / f"{month:%Y}" / f"{month:%Y-%m}.parquet"
+
+    def relative_path(self, month: date) -> str:
+        return str(self.month_path(month).relative_to(self._root))
+
+    def archived_months(self, first: date, last: date) -> list[date]:
+        return [month for month in months_between(first, last) if self.month_path(month).is_file()]
+
+    @contextmanager
+    def open_month(self, month: date) -> Iterator["ArchiveMonthWriter"]:
+        """
+        Stream rows into a month's file. The file only replaces an existing one
+        once the block exits cleanly and its row count matches what was written.
+        """
+        path = self.month_path(month)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staged = path.with_suffix(".tmp")
+
+        try:
+            with pq.ParquetWriter(staged, ARCHIVE_SCHEMA, compression="zstd") as parquet_writer:
+                writer = ArchiveMonthWriter(parquet_writer)
+                yield writer
+
+            stored = pq.ParquetFile(staged).metadata.num_rows
+            if stored != writer.rows:
+                raise IOError(f"Archive {path} holds {stored} rows, expected {writer.rows}")
+        except BaseException:
+            staged.unlink(missing_ok=True)
+            raise
+
+        os.replace(staged, path)
+        logger.info(f"Archived {writer.rows} transactions to {path}")
+
+    def read_accounts(
+            self,
+            account_ids: list[uuid.UUID],
+            start: datetime,
+            end: datetime,
+            status: TransactionStatusEnum | None = None,
+    ) -> list[Transaction]:
+        """Archived transactions touching any of the accounts with start <= created_at <= end."""
+        start, end = _as_utc(start), _as_utc(end)
+        ids = [str(account_id) for account_id in account_ids]
+        bounds = [("created_at", ">=", start), ("created_at", "<=", end)]
+        if status is not None:
+            bounds.append(("status", "==", status.name))
+        filters = [
+            [("sender_account_id", "in", ids), *bounds],
+            [("receiver_account_id", "in", ids), *bounds],
+        ]
+
+        transactions = []
+        for month in self.archived_months(start.date(), end.date()):
+            table = pq.read_table(self.month_path(month), filters=filters)
+            transactions.extend(_to_transaction(row) for row in table.to_pylist())
+        return transactions
+
+    def read_reference(self, archived_in: str, reference: str) -> Transaction | None:
+        table = pq.read_table(self._root / archived_in, filters=[("reference", "==", reference)])
+        rows = table.to_pylist()
+        return _to_transaction(rows[0]) if rows else None
+
+
+transaction_archive = TransactionArchive(settings.TRANSACTION_ARCHIVE_DIR)
@@ -10,12 +10,15 @@ class TransactionTypeEnum(str, Enum):
     LOAN_REPAYMENT = "loan_repayment"
     INTEREST_CREDITED = "interest_credited"
 
+# Transfers start PENDING and leave it exactly once: COMPLETED, FAILED, or EXPIRED
+# when the OTP is never confirmed (see core/tasks/transfer_expiry.py).
 class TransactionStatusEnum(str, Enum):
     PENDING = "pending"
     COMPLETED = "completed"
     FAILED = "failed"
     REVERSED = "reversed"
     CANCELLED = "cancelled"
+    EXPIRED = "expired"
 
 
 class TransactionCategoryEnum(str, Enum):
@@ -32,4 +35,5 @@ class TransactionFailureReasonEnum(str, Enum):
     INVALID_ACCOUNT = "invalid_account"
     SELF_TRANSFER = "self_transfer"
     SUSPICIOUS_ACTIVITY = "suspicious_activity"
+    VELOCITY_LIMIT_EXCEEDED = "velocity_limit_exceeded"
     SYSTEM_ERROR = "system_error"
\ No newline at end of file
@@ -4,7 +4,14 @@ from datetime import datetime, timezone
 from sqlmodel import Field, Column, Relationship, SQLModel
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy import text, func
+from sqlalchemy import text, func, Index, event, DDL
+from backend.app.core.config import settings
+from backend.app.transaction.partitioning import (
+    DEFAULT_PARTITION_SQL,
+    REFERENCE_FUNCTION_SQL,
+    REFERENCE_TRIGGER_SQL,
+    initial_partition_statements,
+)
 from backend.app.transaction.schema import TransactionBaseSchema
 
 if TYPE_CHECKING:
@@ -13,6 +20,21 @@ if TYPE_CHECKING:
 
 
 class Transaction(TransactionBaseSchema, table=True): # type: ignore
+    # Range-partitioned by month on created_at (see transaction/partitioning.py), so
+    # the primary key includes created_at and indexes are per partition. Global
+    # uniqueness of references is enforced through transaction_reference.
+    __table_args__ = (
+        Index("ix_transaction_sender_created", "sender_id", "created_at"),
+        Index("ix_transaction_receiver_created", "receiver_id", "created_at"),
+        Index("ix_transaction_sender_account_created", "sender_account_id", "created_at"),
+        Index("ix_transaction_receiver_account_created", "receiver_account_id", "created_at"),
+        # Pending rows only, so they stay as small as the set of open transfers:
+        # completion looks up by reference, the expiry sweep scans by age.
+        Index("ix_transaction_pending_reference", "reference", postgresql_where=text("status = 'PENDING'")),
+        Index("ix_transaction_pending_created", "created_at", postgresql_where=text("status = 'PENDING'")),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
     id: uuid.UUID = Field(
         sa_column=Column(
             pg.UUID(as_uuid=True),
@@ -46,6 +68,7 @@ class Transaction(TransactionBaseSchema, table=True): # type: ignore
         default_factory=lambda: datetime.now(timezone.utc),
         sa_column=Column(
             pg.TIMESTAMP(timezone=True), 
+            primary_key=True,
             nullable=False, 
             server_default=text("CURRENT_TIMESTAMP"),
         )
@@ -88,7 +111,28 @@ class Transaction(TransactionBaseSchema, table=True): # type: ignore
 
     
 
+class TransactionReference(SQLModel, table=True):
+    """
+    Every transaction reference, filled by a trigger on transaction. Keeps
+    references unique across partitions and archives, and maps a reference to
+    the created_at needed to prune a lookup to one partition or archive file.
+    """
+
+    __tablename__ = "transaction_reference"
+
+    reference: str = Field(primary_key=True)
+    transaction_id: uuid.UUID = Field(index=True)
+    created_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False)
+    )
+    # Archive file (relative to TRANSACTION_ARCHIVE_DIR) once the row has left the hot table.
+    archived_in: str | None = Field(default=None)
+
+
 class IdempotencyKey(SQLModel, table=True): # type: ignore
+    # Serves the periodic purge of expired keys.
+    __table_args__ = (Index("ix_idempotencykey_expires_at", "expires_at"),)
+
     id: uuid.UUID = Field(
         sa_column=Column(
             pg.UUID(as_uuid=True),
@@ -119,3 +163,35 @@ class IdempotencyKey(SQLModel, table=True): # type: ignore
             server_default=text("CURRENT_TIMESTAMP"),
         )
     )
+
+
+
+class TransferOtpChallenge(SQLModel, table=True):
+    """
+    Hashed OTP of a pending transfer, written only when Redis could not take it.
+    Rows are deleted when redeemed and purged by the pending transfer sweep.
+    """
+
+    __tablename__ = "transfer_otp_challenge"
+
+    reference: str = Field(primary_key=True)
+    user_id: uuid.UUID = Field(foreign_key="user.id", ondelete="CASCADE")
+    otp_hash: str
+    expires_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False, index=True)
+    )
+
+# A freshly created table gets the default partition, the reference trigger and
+# the partitions the maintenance task would keep, so rows never pile into the
+# default partition before its first run.
+event.listen(Transaction.__table__, "after_create", DDL(DEFAULT_PARTITION_SQL))
+event.listen(Transaction.__table__, "after_create", DDL(REFERENCE_FUNCTION_SQL))
+event.listen(Transaction.__table__, "after_create", DDL(REFERENCE_TRIGGER_SQL))
+
+
+@event.listens_for(Transaction.__table__, "after_create")
+def _create_initial_partitions(target, connection, **kw) -> None:
+    for statement in initial_partition_statements(
+        datetime.now(timezone.utc).date(), settings.TRANSACTION_PARTITION_MONTHS_AHEAD
+    ):
+        connection.execute(text(statement))
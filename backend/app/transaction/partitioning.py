@@ -0,0 +1,176 @@
+from datetime import date, datetime, timezone
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+PARENT_TABLE = "transaction"
+DEFAULT_PARTITION = "transaction_default"
+HEAP_TABLE = "transaction_heap"
+
+# Keeps transaction_reference in step with inserts. A duplicate reference fails
+# the insert, as the unique index on the unpartitioned table used to.
+REFERENCE_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION transaction_record_reference() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO transaction_reference (reference, transaction_id, created_at)
+    VALUES (NEW.reference, NEW.id, NEW.created_at);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+REFERENCE_TRIGGER_SQL = """
+CREATE TRIGGER transaction_record_reference
+AFTER INSERT ON "transaction"
+FOR EACH ROW EXECUTE FUNCTION transaction_record_reference()
+"""
+
+DEFAULT_PARTITION_SQL = f'CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF "{PARENT_TABLE}" DEFAULT'
+
+# Attached monthly partitions with their lower bound, oldest first.
+LIST_PARTITIONS_SQL = """
+SELECT child.relname AS name
+FROM pg_inherits
+JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+WHERE parent.relname = 'transaction' AND child.relname ~ '^transaction_y[0-9]{4}m[0-9]{2}$'
+ORDER BY child.relname
+"""
+
+PARTITION_EXISTS_SQL = "SELECT to_regclass($1) IS NOT NULL"
+
+# Rows that fell into the default partition because their month had no partition yet.
+DEFAULT_HAS_ROWS_SQL = (
+    f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE created_at >= $1 AND created_at < $2)"
+)
+
+DEFAULT_OLDEST_SQL = f"SELECT min(created_at) FROM {DEFAULT_PARTITION}"
+
+# Monthly partitions whether attached or already detached, oldest first.
+ARCHIVABLE_PARTITIONS_SQL = """
+SELECT relname AS name
+FROM pg_class
+WHERE relkind = 'r' AND relname ~ '^transaction_y[0-9]{4}m[0-9]{2}$'
+ORDER BY relname
+"""
+
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def partition_name(month: date) -> str:
+    return f"transaction_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> date:
+    return date(int(name[13:17]), int(name[18:20]), 1)
+
+
+def partition_bounds(month: date) -> tuple[datetime, datetime]:
+    month = month_start(month)
+    lower = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    return lower, lower + relativedelta(months=1)
+
+
+def _bounds_sql(month: date) -> str:
+    lower, upper = partition_bounds(month)
+    return f"FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+
+
+def create_partition_sql(month: date) -> str:
+    return (
+        f'CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF "{PARENT_TABLE}" '
+        f"FOR VALUES {_bounds_sql(month)}"
+    )
+
+
+def initial_partition_statements(today: date, months_ahead: int) -> list[str]:
+    """Partitions for the current month and the next `months_ahead`, for a freshly created table."""
+    current = month_start(today)
+    return [
+        create_partition_sql(month)
+        for month in months_between(current, current + relativedelta(months=months_ahead))
+    ]
+
+
+def move_default_rows_statements(month: date) -> list[str]:
+    """
+    Statements, for one transaction, that give `month` its partition when the
+    default partition already holds rows for it (Postgres refuses PARTITION OF
+    then). The rows are copied into a plain table, so the reference trigger does
+    not fire again, which is then attached as the month's partition. Inserts into
+    transaction wait while the default partition is detached.
+    """
+    lower, upper = partition_bounds(month)
+    name = partition_name(month)
+    in_month = f"created_at >= '{lower.isoformat()}' AND created_at < '{upper.isoformat()}'"
+    return [
+        f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION {DEFAULT_PARTITION}',
+        f'CREATE TABLE {name} (LIKE "{PARENT_TABLE}" INCLUDING DEFAULTS)',
+        f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_month}",
+        f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_month}",
+        f'ALTER TABLE "{PARENT_TABLE}" ATTACH PARTITION {name} FOR VALUES {_bounds_sql(month)}',
+        f'ALTER TABLE "{PARENT_TABLE}" ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT',
+    ]
+
+
+def detach_partition_sql(month: date) -> str:
+    # DETACH ... CONCURRENTLY is not allowed while a default partition exists, so
+    # callers run this with a short lock_timeout and retry on the next run.
+    return f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION {partition_name(month)}'
+
+
+def months_between(first: date, last: date) -> list[date]:
+    months, month = [], month_start(first)
+    while month <= month_start(last):
+        months.append(month)
+        month += relativedelta(months=1)
+    return months
+
+
+def _index_statements(table: Table) -> list[str]:
+    dialect = postgresql.dialect()
+    return [str(CreateIndex(index).compile(dialect=dialect)) for index in table.indexes]
+
+
+def _foreign_key_statements(table: Table) -> list[str]:
+    return [
+        f'ALTER TABLE "{PARENT_TABLE}" ADD FOREIGN KEY ({fk.parent.name}) '
+        f'REFERENCES "{fk.column.table.name}" ({fk.column.name})'
+        for fk in table.foreign_keys
+    ]
+
+
+def conversion_statements(table: Table, first_month: date, last_month: date) -> list[str]:
+    """
+    Statements for the migration that converts an existing unpartitioned
+    transaction table, in order, for op.execute(). `table` is
+    Transaction.__table__, whose foreign keys and indexes are recreated on the
+    partitioned parent. Partitions cover first_month
+    (the month of the oldest row) through last_month (a few months ahead); rows
+    outside that range land in the default partition. transaction_reference
+    must already exist. Run during a maintenance window: the copy holds an
+    exclusive lock on the old table.
+    """
+    return [
+        "ALTER TABLE transaction_risk_scores DROP CONSTRAINT IF EXISTS transaction_risk_scores_transaction_id_fkey",
+        f'ALTER TABLE "{PARENT_TABLE}" RENAME TO {HEAP_TABLE}',
+        f"ALTER TABLE {HEAP_TABLE} RENAME CONSTRAINT transaction_pkey TO {HEAP_TABLE}_pkey",
+        f"ALTER INDEX IF EXISTS ix_transaction_reference RENAME TO ix_{HEAP_TABLE}_reference",
+        f'CREATE TABLE "{PARENT_TABLE}" (LIKE {HEAP_TABLE} INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)',
+        f'ALTER TABLE "{PARENT_TABLE}" ADD PRIMARY KEY (id, created_at)',
+        *_foreign_key_statements(table),
+        *_index_statements(table),
+        DEFAULT_PARTITION_SQL,
+        *(create_partition_sql(month) for month in months_between(first_month, last_month)),
+        f'INSERT INTO "{PARENT_TABLE}" SELECT * FROM {HEAP_TABLE}',
+        f"INSERT INTO transaction_reference (reference, transaction_id, created_at) "
+        f"SELECT reference, id, created_at FROM {HEAP_TABLE} ON CONFLICT DO NOTHING",
+        REFERENCE_FUNCTION_SQL,
+        REFERENCE_TRIGGER_SQL,
+        f"DROP TABLE {HEAP_TABLE}",
+    ]
+
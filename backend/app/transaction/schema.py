@@ -19,7 +19,7 @@ class TransactionBaseSchema(SQLModel):
 
     amount: Annotated[Decimal, Field(decimal_places=2, ge=0)]
     description: str = Field(max_length=250)
-    reference: str = Field(unique=True, index=True)
+    reference: str = Field(index=True)
     transaction_type: TransactionTypeEnum = Field(
         sa_column=Column(
             SAEnum(
@@ -216,4 +216,44 @@ class PaginatedRiskHistoryResponseSchema(SQLModel):
     total: int
     skip: int
     limit: int
-    items: list[RiskHistoryItemSchema]
\ No newline at end of file
+    items: list[RiskHistoryItemSchema]
+
+
+class FraudReviewQueueItemSchema(SQLModel):
+    risk_score_id: uuid.UUID
+    transaction_id: uuid.UUID
+    reference: str
+    amount: Decimal
+    transaction_type: TransactionTypeEnum
+    transaction_status: TransactionStatusEnum
+    transaction_created_at: datetime
+    risk_score: float
+    risk_factors: dict | None = None
+    ai_model_version: str
+    scored_at: datetime
+    sender_id: uuid.UUID | None = None
+    sender_account_number: str | None = None
+    sender_account_currency: str | None = None
+    claimed_by: uuid.UUID | None = None
+    claimed_at: datetime | None = None
+
+
+class FraudReviewQueueResponseSchema(SQLModel):
+    items: list[FraudReviewQueueItemSchema]
+    limit: int
+    next_cursor: str | None = None
+
+
+class FraudReviewClaimSchema(SQLModel):
+    limit: int = Field(default=10, ge=1, le=100)
+    min_risk_score: float | None = Field(default=None, ge=0, le=1)
+
+
+class FraudReviewReleaseSchema(SQLModel):
+    risk_score_ids: list[uuid.UUID] = Field(min_length=1, max_length=500)
+
+
+class FraudReviewBulkResolveSchema(SQLModel):
+    risk_score_ids: list[uuid.UUID] = Field(min_length=1, max_length=500)
+    is_fraud: bool
+    notes: str | None = Field(default=None, max_length=500)
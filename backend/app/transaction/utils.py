@@ -7,6 +7,34 @@ from backend.app.core.logging import get_logger
 
 logger = get_logger()
 
+def apply_transaction_failure(
+    transaction: Transaction,
+    reason: TransactionFailureReasonEnum,
+    details: dict,
+    error_message: Optional[str] = None,
+    status: TransactionStatusEnum = TransactionStatusEnum.FAILED,
+) -> dict:
+    """Mark the transaction failed (or expired) in memory; the caller commits."""
+    transaction.status = status
+
+    transaction.failed_reason = reason.value
+
+    current_metadata = transaction.transaction_metadata or {}
+
+    failure_details = {
+        "reason": reason.value,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "error_message": error_message,
+        **details,
+    }
+
+    transaction.transaction_metadata = {
+        **current_metadata,
+        "failure_details": failure_details
+    }
+    return failure_details
+
+
 async def mark_transaction_failed(
     transaction: Transaction,
     reason: TransactionFailureReasonEnum,
@@ -16,23 +44,7 @@ async def mark_transaction_failed(
 ):
 
     try:
-        transaction.status = TransactionStatusEnum.FAILED
-
-        transaction.failed_reason = reason.value
-
-        current_metadata = transaction.transaction_metadata or {}
-
-        failure_details = {
-            "reason": reason.value,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "error_message": error_message,
-            **details,
-        }
-
-        transaction.transaction_metadata = {
-            **current_metadata,
-            "failure_details": failure_details
-        }
+        failure_details = apply_transaction_failure(transaction, reason, details, error_message)
 
         session.add(transaction)
         await session.commit()
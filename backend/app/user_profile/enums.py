@@ -37,4 +37,10 @@ class EmploymentStatusEnum(str, Enum):
 class ImageTypeEnum(str, Enum):
     PROFILE_PHOTO = "profile_photo"
     ID_PHOTO = "id_photo"
-    SIGNATURE_PHOTO = "signature_photo"
\ No newline at end of file
+    SIGNATURE_PHOTO = "signature_photo"
+
+
+class KycStatusEnum(str, Enum):
+    NOT_SUBMITTED = "not_submitted"
+    SUBMITTED = "submitted"
+    VERIFIED = "verified"
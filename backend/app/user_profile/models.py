@@ -3,13 +3,22 @@ from typing import TYPE_CHECKING
 from datetime import datetime, timezone
 from sqlmodel import Field, Column, Relationship
 from sqlalchemy.dialects import postgresql as pg
-from sqlalchemy import text, func
+from sqlalchemy import text, func, Computed, Text, Index
 from backend.app.user_profile.schema import ProfileBaseSchema
 
 if TYPE_CHECKING:
     from backend.app.auth.models import User
 
 class Profile(ProfileBaseSchema, table=True): # type: ignore
+    __table_args__ = (
+        Index(
+            "ix_profile_phone_digits_trgm",
+            "phone_digits",
+            postgresql_using="gin",
+            postgresql_ops={"phone_digits": "gin_trgm_ops"},
+        ),
+    )
+
     id: uuid.UUID = Field(
         sa_column=Column(
             pg.UUID(as_uuid=True),
@@ -20,7 +29,8 @@ class Profile(ProfileBaseSchema, table=True): # type: ignore
 
     user_id: uuid.UUID = Field(
         foreign_key="user.id",
-        ondelete="CASCADE"
+        ondelete="CASCADE",
+        index=True,
     )
 
     created_at: datetime = Field(
@@ -41,4 +51,10 @@ class Profile(ProfileBaseSchema, table=True): # type: ignore
         ),
     )
 
+    # Digits of phone_number, generated by Postgres for customer search.
+    phone_digits: str | None = Field(
+        default=None,
+        sa_column=Column(Text, Computed(r"regexp_replace(phone_number, '\D', '', 'g')", persisted=True)),
+    )
+
     user: "User" = Relationship(back_populates="profile")
\ No newline at end of file
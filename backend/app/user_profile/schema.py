@@ -166,5 +166,7 @@ class ProfileResponseSchema(SQLModel):
 class PaginatedProfileResponseSchema(SQLModel):
     profiles: list[ProfileResponseSchema]
     total: int
-    skip: int
-    limit: int
\ No newline at end of file
+    # True when total is the planner's estimate rather than an exact count.
+    total_is_estimate: bool = False
+    limit: int
+    next_cursor: str | None = None
\ No newline at end of file
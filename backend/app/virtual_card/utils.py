@@ -1,7 +1,8 @@
 import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Tuple
-from argon2 import PasswordHasher
+from backend.app.core.hashing.config import HashPurposeEnum
+from backend.app.core.hashing.service import hashing_service
 from backend.app.virtual_card.enums import VirtualCardProviderEnum
 from backend.app.core.logging import get_logger
 
@@ -101,23 +102,21 @@ def generate_card_for_provider(provider: VirtualCardProviderEnum) -> str:
     return full_card
 
 
-def generate_cvv() -> Tuple[str, str]:
+async def generate_cvv() -> Tuple[str, str]:
     """
     Generate a random 3-digit CVV and its hashed version.
     """
     cvv = "".join(secrets.choice("0123456789") for _ in range(3))
-    ph = PasswordHasher()
-    cvv_hash = ph.hash(cvv)
+    cvv_hash = await hashing_service.hash(cvv, HashPurposeEnum.CVV)
     return cvv, cvv_hash
 
-def verify_cvv(cvv: str, cvv_hash: str) -> bool:
+async def verify_cvv(cvv: str, cvv_hash: str) -> bool:
     """
     Verify a CVV against its hashed version.
     """
 
     try:
-        ph = PasswordHasher()
-        return ph.verify(cvv_hash, cvv)
+        return await hashing_service.verify(cvv_hash, cvv, HashPurposeEnum.CVV)
     except Exception as e:
         logger.error(f"CVV verification failed: {e}")
         return False
@@ -0,0 +1,115 @@
+"""
+Customer search latency benchmark.
+
+Seeds USERS throwaway customers (tagged through middle_name) with names drawn
+from small first/last name lists, so every query matches many rows as it would
+at scale. Then runs search_customers for a mix of exact, prefix, email and
+misspelt queries and reports p50/p95/p99 against the 50ms p95 target. Seeded
+users are deleted afterwards.
+
+Usage:
+    python -m backend.benchmarks.customer_search --users 1000000 --iterations 500
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from backend.app.api.services.search import search_customers
+from backend.app.core.db import task_engine, task_session
+
+FIRST_NAMES = ["james", "mary", "john", "patricia", "robert", "jennifer", "michael", "linda", "chinedu", "ngozi",
+               "oluwaseun", "aisha", "emeka", "fatima", "tunde", "amara", "ibrahim", "zainab", "david", "grace"]
+LAST_NAMES = ["smith", "johnson", "williams", "okafor", "adeyemi", "balogun", "okonkwo", "mohammed", "brown",
+              "garcia", "eze", "nwosu", "bello", "abubakar", "taylor", "anderson", "obi", "lawal", "martin", "lee"]
+
+_SEED_SQL = """
+INSERT INTO "user" (
+    id, email, first_name, middle_name, last_name, id_no, is_active, is_superuser, security_question,
+    security_answer, account_status, role, hashed_password, failed_login_attempts, otp,
+    created_at, updated_at
+)
+SELECT gen_random_uuid(),
+       f || '.' || l || g || '@example.com', f, $1, l, $2 + g, true, false, 'FAVORITE_COLOR', 'blue',
+       'ACTIVE', 'CUSTOMER', 'x', 0, '', now(), now()
+FROM (
+    SELECT g,
+           ($3::text[])[1 + floor(random() * array_length($3::text[], 1))::int] AS f,
+           ($4::text[])[1 + floor(random() * array_length($4::text[], 1))::int] AS l
+    FROM generate_series(1, $5) AS g
+) AS names
+"""
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    index = rng.randrange(1, len(word))
+    return word[:index] + word[index + 1:]
+
+
+def sample_query(rng: random.Random, users: int) -> tuple[str, str]:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    kind = rng.choice(["full", "prefix", "email", "typo"])
+    if kind == "full":
+        return kind, f"{first} {last}"
+    if kind == "prefix":
+        return kind, f"{first[:3]} {last[:3]}"
+    if kind == "email":
+        return kind, f"{first}.{last}{rng.randint(1, users)}@example.com"
+    return kind, f"{misspell(first, rng)} {misspell(last, rng)}"
+
+
+async def seed(users: int, tag: str) -> None:
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        id_base = await driver.fetchval('SELECT COALESCE(MAX(id_no), 0) FROM "user"')
+        async with driver.transaction():
+            await driver.execute(_SEED_SQL, tag, id_base, FIRST_NAMES, LAST_NAMES, users)
+        await driver.execute('ANALYZE "user"')
+
+
+async def cleanup(tag: str) -> None:
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.execute('DELETE FROM "user" WHERE middle_name = $1', tag)
+
+
+async def main(args: argparse.Namespace) -> None:
+    tag = f"b{uuid.uuid4().hex[:10]}"
+    rng = random.Random(42)
+    await seed(args.users, tag)
+    print(f"Seeded {args.users:,} customers")
+
+    latencies: dict[str, list[float]] = {}
+    try:
+        async with task_session() as session:
+            for _ in range(args.iterations):
+                kind, query = sample_query(rng, args.users)
+                started = time.perf_counter()
+                await search_customers(session=session, query=query, limit=20)
+                latencies.setdefault(kind, []).append(time.perf_counter() - started)
+                session.expunge_all()
+    finally:
+        await cleanup(tag)
+
+    everything = [latency for samples in latencies.values() for latency in samples]
+    for kind, samples in sorted(latencies.items()) + [("all", everything)]:
+        print(
+            f"{kind:>8}: p50={percentile(samples, 50) * 1e3:.1f}ms p95={percentile(samples, 95) * 1e3:.1f}ms "
+            f"p99={percentile(samples, 99) * 1e3:.1f}ms (n={len(samples)})"
+        )
+    if percentile(everything, 95) > 0.050:
+        print("p95 above the 50ms target")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=500)
+    asyncio.run(main(parser.parse_args()))
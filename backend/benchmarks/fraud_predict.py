@@ -0,0 +1,93 @@
+"""
+Single-transfer fraud model latency benchmark.
+
+Trains a model on synthetic factors into a throwaway registry (or loads a real
+version with --registry/--version) and compares FraudPredictor.predict_one against
+calling predict_proba on a one-row DataFrame, reporting p50/p99/p999 latency.
+
+Usage:
+    python -m backend.benchmarks.fraud_predict --algorithm logistic --iterations 20000
+"""
+import argparse
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from backend.app.core.ai.predictor import FraudPredictor
+from backend.app.core.ai.registry import ModelRegistry
+from backend.app.core.ai.risk_engine import MODEL_FEATURES
+from backend.app.core.ai.training import ALGORITHMS, build_estimator
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def synthetic_factors(rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    frame = pd.DataFrame(rng.random((rows, 5)), columns=MODEL_FEATURES[:5])
+    frame["recent_transfers"] = rng.poisson(2, rows)
+    frame["rapid_transfers"] = rng.poisson(0.5, rows)
+    frame["velocity_amount_window"] = rng.gamma(2.0, 5000.0, rows)
+    logits = 4 * frame["amount"] + 3 * frame["patterns"] + frame["rapid_transfers"] - 5
+    frame["label"] = (rng.random(rows) < 1 / (1 + np.exp(-logits))).astype(int)
+    return frame
+
+
+def train_synthetic(registry: ModelRegistry, algorithm: str, rows: int, rng: np.random.Generator) -> str:
+    frame = synthetic_factors(rows, rng)
+    estimator = build_estimator(algorithm)
+    estimator.fit(frame[MODEL_FEATURES].to_numpy(dtype=np.float64), frame["label"].to_numpy())
+    return registry.save(estimator, {"algorithm": algorithm, "features": MODEL_FEATURES})
+
+
+def time_calls(call, samples: list[dict]) -> list[float]:
+    latencies = []
+    for factors in samples:
+        started = time.perf_counter()
+        call(factors)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def report(label: str, latencies: list[float]) -> None:
+    print(
+        f"{label:>14}: p50={percentile(latencies, 50) * 1e6:.1f}us "
+        f"p99={percentile(latencies, 99) * 1e6:.1f}us "
+        f"p999={percentile(latencies, 99.9) * 1e6:.1f}us"
+    )
+
+
+def main(args: argparse.Namespace) -> None:
+    rng = np.random.default_rng(42)
+    with tempfile.TemporaryDirectory() as scratch:
+        if args.registry:
+            registry, version = ModelRegistry(args.registry), args.version
+        else:
+            registry = ModelRegistry(scratch)
+            version = train_synthetic(registry, args.algorithm, args.train_rows, rng)
+
+        predictor = FraudPredictor()
+        if not predictor.load(version, registry=registry):
+            raise SystemExit("Could not load a fraud model")
+        model, _ = registry.load(version)
+
+        samples = synthetic_factors(args.iterations, rng)[MODEL_FEATURES].to_dict("records")
+        features = predictor.features
+
+        report("predict_one", time_calls(predictor.predict_one, samples))
+        report(
+            "dataframe_row",
+            time_calls(lambda factors: model.predict_proba(pd.DataFrame([factors])[features].to_numpy()), samples),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="logistic")
+    parser.add_argument("--train-rows", type=int, default=20000)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--registry", help="Existing registry directory to load from")
+    parser.add_argument("--version", help="Model version inside --registry (defaults to LATEST)")
+    main(parser.parse_args())
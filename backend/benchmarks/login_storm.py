@@ -0,0 +1,82 @@
+"""
+Login-storm benchmark for Argon2 password verification.
+
+Fires CONCURRENCY concurrent password verifications and compares running them
+inline on the event loop against the bounded hashing pool, reporting p50/p99
+request latency and the worst event-loop lag observed by a 10ms ticker.
+
+Usage:
+    python -m backend.benchmarks.login_storm --requests 200 --concurrency 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from backend.app.core.hashing.config import HashPurposeEnum
+from backend.app.core.hashing.service import HashingService, hashing_service
+
+TICK_SECONDS = 0.01
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(time.perf_counter() - started - TICK_SECONDS)
+
+
+async def run_storm(service: HashingService, hashed: str, requests: int, concurrency: int, inline: bool) -> dict:
+    latencies: list[float] = []
+    lags: list[float] = []
+    gate = asyncio.Semaphore(concurrency)
+    stop = asyncio.Event()
+
+    async def login() -> None:
+        async with gate:
+            started = time.perf_counter()
+            if inline:
+                service.verify_sync(hashed, "correct-horse-battery", HashPurposeEnum.PASSWORD)
+            else:
+                await service.verify(hashed, "correct-horse-battery", HashPurposeEnum.PASSWORD)
+            latencies.append(time.perf_counter() - started)
+
+    ticker = asyncio.create_task(measure_loop_lag(stop, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+
+    return {
+        "mode": "inline" if inline else "pool",
+        "throughput_rps": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_loop_lag_ms": max(lags, default=0.0) * 1000,
+    }
+
+
+async def main(requests: int, concurrency: int) -> None:
+    hashed = hashing_service.hash_sync("correct-horse-battery", HashPurposeEnum.PASSWORD)
+    for inline in (True, False):
+        result = await run_storm(hashing_service, hashed, requests, concurrency, inline)
+        print(
+            f"{result['mode']:>6}: {result['throughput_rps']:.1f} req/s "
+            f"p50={result['p50_ms']:.1f}ms p99={result['p99_ms']:.1f}ms "
+            f"max_loop_lag={result['max_loop_lag_ms']:.1f}ms"
+        )
+    hashing_service.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
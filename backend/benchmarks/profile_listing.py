@@ -0,0 +1,131 @@
+"""
+All-profiles listing benchmark: OFFSET paging vs keyset paging.
+
+Seeds USERS throwaway users (tagged through last_name), then times, at several
+depths, the old query shape (full User rows with OFFSET) against
+get_all_user_profiles with a keyset cursor at the same position. Also compares
+counting by loading every id against count_rows. Reports p50/p99 per depth.
+Seeded users are deleted afterwards.
+
+Usage:
+    python -m backend.benchmarks.profile_listing --users 1000000 --iterations 50
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from sqlmodel import select, desc
+from backend.app.api.services.profile import encode_profile_cursor, get_all_user_profiles
+from backend.app.auth.models import User
+from backend.app.auth.schema import RoleChoicesSchema
+from backend.app.core.db import task_engine, task_session
+from backend.app.core.utils.counting import count_rows
+
+PAGE_SIZE = 20
+
+_SEED_SQL = """
+INSERT INTO "user" (
+    id, email, first_name, last_name, id_no, is_active, is_superuser, security_question,
+    security_answer, account_status, role, hashed_password, failed_login_attempts, otp,
+    created_at, updated_at
+)
+SELECT gen_random_uuid(), $1 || g || '@example.com', 'Bench', $1, $2 + g, true, false,
+       'FAVORITE_COLOR', 'blue',
+       (ARRAY['ACTIVE', 'INACTIVE', 'LOCKED', 'PENDING'])[1 + g % 4]::account_status_enum,
+       (CASE WHEN g % 50 = 0 THEN 'TELLER' ELSE 'CUSTOMER' END)::role_enum,
+       'x', 0, '', now() - g * interval '1 second', now()
+FROM generate_series(1, $3) AS g
+"""
+
+_CURSOR_AT_SQL = """
+SELECT created_at, id FROM "user" ORDER BY created_at DESC, id DESC OFFSET $1 LIMIT 1
+"""
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(label: str, latencies: list[float]) -> None:
+    print(f"{label:>28}: p50={percentile(latencies, 50) * 1e3:.2f}ms p99={percentile(latencies, 99) * 1e3:.2f}ms")
+
+
+async def timed(iterations: int, call) -> list[float]:
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def seed(users: int, tag: str) -> None:
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        id_base = await driver.fetchval('SELECT COALESCE(MAX(id_no), 0) FROM "user"')
+        async with driver.transaction():
+            await driver.execute(_SEED_SQL, tag, id_base, users)
+        await driver.execute('ANALYZE "user"')
+
+
+async def cleanup(tag: str) -> None:
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.execute('DELETE FROM "user" WHERE last_name = $1', tag)
+
+
+async def cursor_at(depth: int) -> str | None:
+    if depth == 0:
+        return None
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        row = await raw.driver_connection.fetchrow(_CURSOR_AT_SQL, depth - 1)
+    return encode_profile_cursor(row["created_at"], row["id"])
+
+
+async def main(args: argparse.Namespace) -> None:
+    tag = f"bench{uuid.uuid4().hex[:10]}"
+    manager = User(role=RoleChoicesSchema.BRANCH_MANAGER)
+    await seed(args.users, tag)
+    print(f"Seeded {args.users:,} users")
+
+    try:
+        async with task_session() as session:
+            async def load_all_ids():
+                result = await session.exec(select(User.id))
+                return len(result.all())
+
+            async def estimated_count():
+                return await count_rows(session, select(User.id))
+
+            report("count (load every id)", await timed(max(1, args.iterations // 10), load_all_ids))
+            report("count (count_rows)", await timed(args.iterations, estimated_count))
+
+            for depth in (0, args.users // 2, args.users - PAGE_SIZE):
+                cursor = await cursor_at(depth)
+
+                async def offset_page():
+                    statement = select(User).order_by(desc(User.created_at)).offset(depth).limit(PAGE_SIZE)
+                    result = await session.exec(statement)
+                    return result.all()
+
+                async def keyset_page():
+                    return await get_all_user_profiles(
+                        session=session, current_user=manager, limit=PAGE_SIZE, cursor=cursor
+                    )
+
+                report(f"offset page @ {depth:,}", await timed(args.iterations, offset_page))
+                report(f"keyset page @ {depth:,}", await timed(args.iterations, keyset_page))
+                session.expunge_all()
+    finally:
+        await cleanup(tag)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
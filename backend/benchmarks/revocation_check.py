@@ -0,0 +1,65 @@
+"""
+Latency of the per-request session revocation check at scale.
+
+Seeds SESSIONS revoked-session keys into Redis (the same key layout used by
+TokenSessionStore), then times is_session_revoked() for a mix of revoked and
+live session ids and prints p50/p99/p999 latency.
+
+Usage:
+    python -m backend.benchmarks.revocation_check --sessions 2000000 --lookups 20000
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from backend.app.api.services.token_session import token_session_store
+from backend.app.core.redis_client import get_redis, close_redis
+
+SEED_BATCH = 10_000
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def seed(session_ids: list[str], ttl: int) -> None:
+    redis = get_redis()
+    for start in range(0, len(session_ids), SEED_BATCH):
+        pipe = redis.pipeline(transaction=False)
+        for session_id in session_ids[start:start + SEED_BATCH]:
+            pipe.set(token_session_store._revoked_key(session_id), 1, ex=ttl)
+        await pipe.execute()
+
+
+async def main(sessions: int, lookups: int) -> None:
+    revoked = [f"bench{uuid.uuid4().hex}" for _ in range(sessions)]
+
+    started = time.perf_counter()
+    await seed(revoked, ttl=3600)
+    print(f"Seeded {sessions:,} revoked sessions in {time.perf_counter() - started:.1f}s")
+
+    latencies = []
+    for _ in range(lookups):
+        session_id = random.choice(revoked) if random.random() < 0.5 else uuid.uuid4().hex
+        started = time.perf_counter()
+        await token_session_store.is_session_revoked(session_id)
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+
+    print(
+        f"is_session_revoked over {lookups:,} lookups: "
+        f"p50={percentile(latencies, 50):.0f}us "
+        f"p99={percentile(latencies, 99):.0f}us "
+        f"p999={percentile(latencies, 99.9):.0f}us"
+    )
+    await close_redis()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=2_000_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.lookups))
@@ -0,0 +1,134 @@
+"""
+Scheduler throughput and exactly-once check for scheduled transfers.
+
+Seeds SCHEDULES one-off schedules that are already due (between an existing
+sender and receiver account), then runs SCHEDULERS concurrent claim loops using
+claim_due_transfers() feeding EXECUTORS workers. Executors stand in for
+run_scheduled_transfer: they apply the same occurrence guard (status ACTIVE and
+next_run_at equal to the claimed occurrence) but only mark the schedule
+completed, so no money moves. Reports claims and executions per minute, and
+fails if any occurrence was claimed or executed twice. Seeded rows are removed
+afterwards.
+
+Usage:
+    python -m backend.benchmarks.scheduled_transfers --schedules 50000 --schedulers 4 --executors 32
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from collections import Counter
+from backend.app.api.services.scheduled_transfer import claim_due_transfers
+from backend.app.core.db import task_engine, task_session
+
+_ACCOUNTS_SQL = """
+SELECT s.id AS sender_account_id, s.user_id, r.account_number AS receiver_account_number
+FROM bankaccount s
+JOIN bankaccount r ON r.user_id <> s.user_id AND r.account_number IS NOT NULL
+LIMIT 1
+"""
+
+_SEED_SQL = """
+INSERT INTO scheduled_transfer (
+    id, user_id, sender_account_id, receiver_account_number, amount, description, frequency,
+    status, occurrences, runs_count, consecutive_failures, start_at, next_run_at, created_at, updated_at
+)
+SELECT gen_random_uuid(), $1, $2, $3, 1, $4, 'ONCE', 'ACTIVE', 0, 0, 0,
+       now() - (g * interval '1 millisecond'), now() - (g * interval '1 millisecond'), now(), now()
+FROM generate_series(1, $5) AS g
+"""
+
+_EXECUTE_SQL = """
+UPDATE scheduled_transfer
+SET status = 'COMPLETED', occurrences = occurrences + 1, runs_count = runs_count + 1, claimed_until = NULL
+WHERE id = $1 AND next_run_at = $2 AND status = 'ACTIVE'
+RETURNING id
+"""
+
+
+async def seed(schedules: int, tag: str) -> None:
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        accounts = await driver.fetchrow(_ACCOUNTS_SQL)
+        if not accounts:
+            raise SystemExit("Need bank accounts for at least two users to seed schedules")
+        async with driver.transaction():
+            await driver.execute(
+                _SEED_SQL,
+                accounts["user_id"],
+                accounts["sender_account_id"],
+                accounts["receiver_account_number"],
+                tag,
+                schedules,
+            )
+
+
+async def cleanup(tag: str) -> None:
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.execute("DELETE FROM scheduled_transfer WHERE description = $1", tag)
+
+
+async def scheduler(queue: asyncio.Queue, claims: Counter, batch_size: int) -> None:
+    while True:
+        async with task_session() as session:
+            claimed = await claim_due_transfers(session=session, limit=batch_size)
+        for occurrence in claimed:
+            claims[occurrence] += 1
+            await queue.put(occurrence)
+        if not claimed:
+            return
+
+
+async def executor(queue: asyncio.Queue, executions: Counter) -> None:
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        while True:
+            occurrence = await queue.get()
+            if occurrence is None:
+                return
+            if await driver.fetchval(_EXECUTE_SQL, *occurrence):
+                executions[occurrence[0]] += 1
+
+
+async def main(args: argparse.Namespace) -> None:
+    tag = f"benchmark:{uuid.uuid4().hex[:12]}"
+    await seed(args.schedules, tag)
+    print(f"Seeded {args.schedules:,} due schedules")
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=args.batch_size * args.schedulers * 2)
+    claims: Counter = Counter()
+    executions: Counter = Counter()
+
+    try:
+        started = time.perf_counter()
+        executors = [asyncio.create_task(executor(queue, executions)) for _ in range(args.executors)]
+        await asyncio.gather(*(scheduler(queue, claims, args.batch_size) for _ in range(args.schedulers)))
+        claimed_in = time.perf_counter() - started
+        for _ in executors:
+            await queue.put(None)
+        await asyncio.gather(*executors)
+        elapsed = time.perf_counter() - started
+    finally:
+        await cleanup(tag)
+
+    double_claims = sum(1 for count in claims.values() if count > 1)
+    double_executions = sum(1 for count in executions.values() if count > 1)
+    print(
+        f"claimed {len(claims):,} in {claimed_in:.1f}s ({len(claims) / claimed_in * 60:,.0f}/min), "
+        f"executed {sum(executions.values()):,} in {elapsed:.1f}s ({sum(executions.values()) / elapsed * 60:,.0f}/min)"
+    )
+    print(f"double claims: {double_claims}, double executions: {double_executions}")
+    if double_claims or double_executions or len(executions) != args.schedules:
+        raise SystemExit("Scheduler claimed or executed an occurrence more than once, or missed one")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--schedules", type=int, default=50_000)
+    parser.add_argument("--schedulers", type=int, default=4)
+    parser.add_argument("--executors", type=int, default=32)
+    parser.add_argument("--batch-size", type=int, default=500)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,145 @@
+"""
+Heap vs monthly-partitioned transaction history benchmark.
+
+Builds two tables in a scratch schema with the columns and (sender_id,
+created_at) index the history queries use: an unpartitioned heap and a table
+range-partitioned by month like transaction. Loads ROWS rows spread across
+MONTHS months and SENDERS senders into both, then times a recent-history page
+(last 30 days, newest first) and a one-month sum for random senders, reporting
+p50/p99 latency. Run once at --rows 10000000 and once at --rows 100000000 to see
+how each layout degrades with size. The scratch schema is dropped afterwards
+unless --keep is given.
+
+Usage:
+    python -m backend.benchmarks.transaction_partitioning --rows 10000000 --months 24 --queries 2000
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from dateutil.relativedelta import relativedelta
+from backend.app.core.db import task_engine
+
+SCHEMA = "bench_partitioning"
+
+_TABLE_COLUMNS = "id uuid NOT NULL, sender_id integer NOT NULL, amount numeric(12, 2) NOT NULL, created_at timestamptz NOT NULL"
+
+_LOAD_SQL = """
+INSERT INTO {table} (id, sender_id, amount, created_at)
+SELECT gen_random_uuid(),
+       (random() * ($1 - 1))::integer,
+       round((random() * 1000)::numeric, 2),
+       $2::timestamptz + random() * ($3::timestamptz - $2::timestamptz)
+FROM generate_series(1, $4)
+"""
+
+_HISTORY_SQL = """
+SELECT id, amount, created_at FROM {table}
+WHERE sender_id = $1 AND created_at >= $2
+ORDER BY created_at DESC
+LIMIT 20
+"""
+
+_MONTH_SUM_SQL = """
+SELECT coalesce(sum(amount), 0) FROM {table}
+WHERE sender_id = $1 AND created_at >= $2 AND created_at < $3
+"""
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def month_bounds(months: int) -> list[date]:
+    first = date.today().replace(day=1) - relativedelta(months=months - 1)
+    return [first + relativedelta(months=offset) for offset in range(months + 1)]
+
+
+async def build(driver, args: argparse.Namespace) -> tuple[datetime, datetime]:
+    bounds = month_bounds(args.months)
+    start = datetime.combine(bounds[0], datetime.min.time(), timezone.utc)
+    end = datetime.now(timezone.utc)
+
+    await driver.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    await driver.execute(f"CREATE SCHEMA {SCHEMA}")
+    await driver.execute(f"CREATE TABLE {SCHEMA}.heap ({_TABLE_COLUMNS}, PRIMARY KEY (id))")
+    await driver.execute(
+        f"CREATE TABLE {SCHEMA}.partitioned ({_TABLE_COLUMNS}, PRIMARY KEY (id, created_at)) "
+        f"PARTITION BY RANGE (created_at)"
+    )
+    for lower, upper in zip(bounds, bounds[1:]):
+        await driver.execute(
+            f"CREATE TABLE {SCHEMA}.partitioned_{lower:%Y%m} PARTITION OF {SCHEMA}.partitioned "
+            f"FOR VALUES FROM ('{lower} 00:00:00+00') TO ('{upper} 00:00:00+00')"
+        )
+
+    for table in ("heap", "partitioned"):
+        started = time.perf_counter()
+        loaded = 0
+        while loaded < args.rows:
+            chunk = min(args.chunk, args.rows - loaded)
+            await driver.execute(_LOAD_SQL.format(table=f"{SCHEMA}.{table}"), args.senders, start, end, chunk)
+            loaded += chunk
+        await driver.execute(f"CREATE INDEX ON {SCHEMA}.{table} (sender_id, created_at)")
+        await driver.execute(f"ANALYZE {SCHEMA}.{table}")
+        print(f"{table:>12}: loaded and indexed {loaded:,} rows in {time.perf_counter() - started:.1f}s")
+
+    return start, end
+
+
+async def time_queries(driver, table: str, args: argparse.Namespace, start: datetime, end: datetime) -> None:
+    rng = random.Random(42)
+    history_sql = _HISTORY_SQL.format(table=f"{SCHEMA}.{table}")
+    month_sum_sql = _MONTH_SUM_SQL.format(table=f"{SCHEMA}.{table}")
+    months = month_bounds(args.months)
+    history, month_sum = [], []
+
+    for _ in range(args.queries):
+        sender = rng.randrange(args.senders)
+        started = time.perf_counter()
+        await driver.fetch(history_sql, sender, end - timedelta(days=30))
+        history.append(time.perf_counter() - started)
+
+        lower = rng.choice(months[:-1])
+        upper = lower + relativedelta(months=1)
+        started = time.perf_counter()
+        await driver.fetchval(
+            month_sum_sql,
+            sender,
+            datetime.combine(lower, datetime.min.time(), timezone.utc),
+            datetime.combine(upper, datetime.min.time(), timezone.utc),
+        )
+        month_sum.append(time.perf_counter() - started)
+
+    for label, latencies in (("history", history), ("month_sum", month_sum)):
+        print(
+            f"{table:>12} {label:>9}: p50={percentile(latencies, 50) * 1e3:.2f}ms "
+            f"p99={percentile(latencies, 99) * 1e3:.2f}ms"
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        try:
+            start, end = await build(driver, args)
+            for table in ("heap", "partitioned"):
+                await time_queries(driver, table, args, start, end)
+        finally:
+            if not args.keep:
+                await driver.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--senders", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--chunk", type=int, default=1_000_000, help="Rows per INSERT while loading")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema for inspection")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,196 @@
+"""
+Transfer completion throughput benchmark.
+
+Seeds PAIRS throwaway sender/receiver customers (tagged through last_name), each
+with an active business account, and TRANSFERS pending 0.01 transfers per pair.
+WORKERS concurrent workers then drive complete_transfer through the API's pooled
+sessions, one pair per worker at a time. Before each completion the worker issues
+the transfer's OTP and clears the sender's velocity windows; that setup is outside
+the timed call. With --hot-receiver every transfer pays the first receiver, so
+completions contend on one account row.
+
+Reports completed transfers per second over the whole run and p50/p99 latency
+of complete_transfer. Completions post real ledger journals and rollups, so run
+it against a local development database. Seeded users, accounts, transactions
+and their journals are deleted afterwards.
+
+Usage:
+    python -m backend.benchmarks.transfer_completion --pairs 64 --transfers 200 --workers 8
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from backend.app.api.services.ledger import bank_account_code
+from backend.app.api.services.otp_challenge import otp_challenge_store
+from backend.app.api.services.transaction import complete_transfer
+from backend.app.bank_account.enums import AccountTypeEnum
+from backend.app.core.db import async_session, task_engine
+from backend.app.core.redis_client import get_redis
+from backend.app.core.velocity.config import ACCOUNT_VELOCITY_LIMITS
+
+OTP = "123456"
+
+_SEED_USERS_SQL = """
+INSERT INTO "user" (
+    id, email, first_name, last_name, id_no, is_active, is_superuser, security_question,
+    security_answer, account_status, role, hashed_password, failed_login_attempts, otp,
+    created_at, updated_at
+)
+SELECT gen_random_uuid(), $1 || g || '@example.com', 'Bench', $1, $2 + g, true, false,
+       'FAVORITE_COLOR', 'blue', 'ACTIVE'::account_status_enum, 'CUSTOMER'::role_enum,
+       'x', 0, '', now(), now()
+FROM generate_series(1, $3) AS g
+RETURNING id
+"""
+
+_SEED_ACCOUNT_SQL = """
+INSERT INTO bankaccount (
+    id, user_id, account_status, account_type, account_currency, account_number, account_name,
+    balance, is_primary, kyc_submitted, kyc_verified, interest_rate, created_at, updated_at
+)
+VALUES (gen_random_uuid(), $1, 'Active', 'Business', 'USD', $2, 'Bench', 1000000, true, true, true, 0, now(), now())
+RETURNING id
+"""
+
+_SEED_TRANSFERS_SQL = """
+INSERT INTO transaction (
+    id, amount, description, reference, transaction_type, transaction_category, status,
+    balance_before, balance_after, transaction_metadata, sender_account_id, receiver_account_id,
+    sender_id, receiver_id, created_at, updated_at
+)
+SELECT gen_random_uuid(), 0.01, $1, $2 || '-' || g, 'TRANSFER'::transaction_type_enum,
+       'DEBIT'::transaction_category_enum, 'PENDING'::transaction_status_enum, 0, 0,
+       jsonb_build_object('converted_amount', '0.01', 'from_currency', 'USD', 'to_currency', 'USD'),
+       $3, $4, $5, $6, now(), now()
+FROM generate_series(1, $7) AS g
+RETURNING reference
+"""
+
+_SEEDED_ACCOUNTS_SQL = 'SELECT b.id FROM bankaccount b JOIN "user" u ON u.id = b.user_id WHERE u.last_name = $1'
+
+_CLEANUP_LEDGER_SQL = "DELETE FROM ledger_entry WHERE account_code = ANY($1::text[])"
+
+# Users last: their accounts, and the accounts' rollups, cascade with them.
+_CLEANUP_SQL = [
+    "DELETE FROM transaction_reference WHERE reference LIKE $1 || '%'",
+    "DELETE FROM transaction WHERE description = $1",
+    'DELETE FROM "user" WHERE last_name = $1',
+]
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def seed(pairs: int, transfers: int, tag: str, hot_receiver: bool) -> list[dict]:
+    seeded = []
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        id_base = await driver.fetchval('SELECT COALESCE(MAX(id_no), 0) FROM "user"')
+        async with driver.transaction():
+            user_ids = [row["id"] for row in await driver.fetch(_SEED_USERS_SQL, tag, id_base, pairs * 2)]
+            account_ids = [
+                await driver.fetchval(_SEED_ACCOUNT_SQL, user_id, f"{tag}{index:06d}")
+                for index, user_id in enumerate(user_ids)
+            ]
+            for pair in range(pairs):
+                sender = 2 * pair
+                receiver = 1 if hot_receiver else 2 * pair + 1
+                references = await driver.fetch(
+                    _SEED_TRANSFERS_SQL, tag, f"{tag}-{pair}",
+                    account_ids[sender], account_ids[receiver],
+                    user_ids[sender], user_ids[receiver],
+                    transfers,
+                )
+                seeded.append({
+                    "sender_id": user_ids[sender],
+                    "sender_account_id": account_ids[sender],
+                    "references": [row["reference"] for row in references],
+                })
+        await driver.execute("ANALYZE bankaccount")
+    return seeded
+
+
+async def cleanup(tag: str, seeded: list[dict]) -> None:
+    async with task_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        accounts = await driver.fetch(_SEEDED_ACCOUNTS_SQL, tag)
+        async with driver.transaction():
+            await driver.execute(_CLEANUP_LEDGER_SQL, [bank_account_code(row["id"]) for row in accounts])
+            for statement in _CLEANUP_SQL:
+                await driver.execute(statement, tag)
+    velocity_keys = [
+        f"velocity:account:{pair['sender_account_id']}:{window.name}"
+        for pair in seeded
+        for window in ACCOUNT_VELOCITY_LIMITS[AccountTypeEnum.Business]
+    ]
+    if velocity_keys:
+        await get_redis().delete(*velocity_keys)
+
+
+async def prepare(session, pair: dict, reference: str) -> None:
+    await otp_challenge_store.issue(reference=reference, user_id=pair["sender_id"], otp=OTP, session=session)
+    await get_redis().delete(*[
+        f"velocity:account:{pair['sender_account_id']}:{window.name}"
+        for window in ACCOUNT_VELOCITY_LIMITS[AccountTypeEnum.Business]
+    ])
+
+
+async def worker(queue: asyncio.Queue, latencies: list[float], failures: list[str]) -> None:
+    while True:
+        pair = await queue.get()
+        if pair is None:
+            return
+        for reference in pair["references"]:
+            async with async_session() as session:
+                await prepare(session, pair, reference)
+                started = time.perf_counter()
+                try:
+                    await complete_transfer(reference=reference, otp=OTP, session=session)
+                except Exception as e:
+                    failures.append(f"{reference}: {getattr(e, 'detail', e)}")
+                    continue
+                latencies.append(time.perf_counter() - started)
+
+
+async def main(args: argparse.Namespace) -> None:
+    tag = f"bench{uuid.uuid4().hex[:10]}"
+    seeded = await seed(args.pairs, args.transfers, tag, args.hot_receiver)
+    print(f"Seeded {args.pairs:,} pairs with {args.transfers:,} pending transfers each")
+
+    latencies: list[float] = []
+    failures: list[str] = []
+    try:
+        queue: asyncio.Queue = asyncio.Queue()
+        for pair in seeded:
+            queue.put_nowait(pair)
+        for _ in range(args.workers):
+            queue.put_nowait(None)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(queue, latencies, failures) for _ in range(args.workers)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await cleanup(tag, seeded)
+
+    print(
+        f"completed {len(latencies):,} transfers in {elapsed:.1f}s ({len(latencies) / elapsed:,.1f}/s), "
+        f"p50={percentile(latencies, 50) * 1e3:.2f}ms p99={percentile(latencies, 99) * 1e3:.2f}ms"
+        if latencies else f"no transfers completed in {elapsed:.1f}s"
+    )
+    if failures:
+        print(f"{len(failures):,} completions failed, e.g. {failures[0]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pairs", type=int, default=64)
+    parser.add_argument("--transfers", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--hot-receiver", action="store_true")
+    asyncio.run(main(parser.parse_args()))
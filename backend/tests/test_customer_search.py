@@ -0,0 +1,37 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+from backend.app.api.services.search import _candidates, _prefix_tsquery
+from backend.app.auth.models import User
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("jo smi", "jo:* & smi:*"),
+        ("  John   SMITH ", "john:* & smith:*"),
+        ("o'brien", "o:* & brien:*"),
+        ("jo & | ! smi:*", "jo:* & smi:*"),
+        ("müller", "müller:*"),
+        ("4012", "4012:*"),
+        ("", None),
+        (" !@#$% ", None),
+    ],
+)
+def test_prefix_tsquery(query, expected):
+    assert _prefix_tsquery(query) == expected
+
+
+def test_search_columns_are_not_loaded_with_users():
+    sql = str(select(User).compile(dialect=postgresql.dialect()))
+
+    assert "search_text" not in sql
+    assert "search_vector" not in sql
+    assert {"search_text", "search_vector"} <= set(User.__table__.c.keys())
+
+
+def test_candidates_match_on_search_columns():
+    sql = str(_candidates("jane").compile(dialect=postgresql.dialect()))
+
+    assert '"user".search_vector @@ to_tsquery' in sql
+    assert '"user".search_text' in sql
@@ -0,0 +1,29 @@
+import uuid
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+from backend.app.api.services.fraud_review import _not_already_reviewed, decode_cursor, encode_cursor
+from backend.app.core.ai.models import TransactionRiskScore
+
+
+@pytest.mark.parametrize("risk_score", [0.0, 0.7, 0.1 + 0.2, 0.98765432101, 1.0])
+def test_cursor_round_trip(risk_score):
+    risk_score_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor(risk_score, risk_score_id)) == (risk_score, risk_score_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "0.5", "abc:" + str(uuid.uuid4()), "0.5:not-a-uuid"])
+def test_decode_cursor_rejects_malformed_cursor(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+def test_queue_excludes_transactions_with_a_reviewed_score():
+    statement = select(TransactionRiskScore.id).where(_not_already_reviewed())
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "NOT (EXISTS (SELECT" in sql
+    assert "transaction_risk_scores_1.transaction_id = transaction_risk_scores.transaction_id" in sql
+    assert "transaction_risk_scores_1.reviewed_by IS NOT NULL" in sql
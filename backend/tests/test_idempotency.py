@@ -0,0 +1,109 @@
+import asyncio
+import json
+import uuid
+import pytest
+from fastapi import HTTPException
+from backend.app.api.services import idempotency
+from backend.app.api.services.idempotency import (
+    DONE,
+    IdempotencyGuard,
+    IdempotencyStore,
+    request_fingerprint,
+)
+
+
+class _FakeRedis:
+    def __init__(self, stored: dict | None = None, fail: bool = False):
+        self.values = {} if stored is None else stored
+        self.fail = fail
+
+    async def set(self, key, value, nx=False, ex=None):
+        if self.fail:
+            raise ConnectionError("redis is down")
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def get(self, key):
+        return self.values.get(key)
+
+
+def _guard(body: bytes = b'{"amount": 10}') -> IdempotencyGuard:
+    return IdempotencyGuard(
+        key=str(uuid.uuid4()),
+        user_id=uuid.uuid4(),
+        endpoint="/bank-account/withdraw",
+        fingerprint=request_fingerprint("POST", "/bank-account/withdraw", body),
+    )
+
+
+def test_request_fingerprint_ignores_key_order_and_whitespace():
+    assert request_fingerprint("POST", "/a", b'{"x": 1, "y": [1, 2]}') == request_fingerprint(
+        "POST", "/a", b'{"y":[1,2],"x":1}'
+    )
+
+
+def test_request_fingerprint_covers_method_path_and_body():
+    base = request_fingerprint("POST", "/a", b'{"x": 1}')
+    assert request_fingerprint("PUT", "/a", b'{"x": 1}') != base
+    assert request_fingerprint("POST", "/b", b'{"x": 1}') != base
+    assert request_fingerprint("POST", "/a", b'{"x": 2}') != base
+    assert request_fingerprint("POST", "/a", b"not json") == request_fingerprint("POST", "/a", b"not json")
+    assert request_fingerprint("POST", "/a", b"") == request_fingerprint("POST", "/a", b"null")
+
+
+def test_acquire_takes_the_in_flight_lock(monkeypatch):
+    redis = _FakeRedis()
+    monkeypatch.setattr(idempotency, "get_redis", lambda: redis)
+    guard = asyncio.run(IdempotencyStore().acquire(_guard()))
+
+    assert guard.locked
+    assert guard.cached_response is None
+    assert json.loads(redis.values[guard.redis_key])["t"] == guard.token
+
+
+def test_acquire_rejects_concurrent_retry(monkeypatch):
+    redis = _FakeRedis()
+    monkeypatch.setattr(idempotency, "get_redis", lambda: redis)
+    store = IdempotencyStore()
+    first = asyncio.run(store.acquire(_guard()))
+    retry = _guard()
+    retry.key, retry.user_id = first.key, first.user_id
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(store.acquire(retry))
+    assert exc.value.status_code == 409
+
+
+def test_acquire_replays_completed_response(monkeypatch):
+    guard = _guard()
+    stored = {guard.redis_key: json.dumps({"s": DONE, "f": guard.fingerprint, "c": 201, "b": {"ok": True}})}
+    monkeypatch.setattr(idempotency, "get_redis", lambda: _FakeRedis(stored))
+    asyncio.run(IdempotencyStore().acquire(guard))
+
+    assert not guard.locked
+    assert guard.cached_status_code == 201
+    assert guard.cached_response == {"ok": True}
+
+
+def test_acquire_rejects_key_reused_with_different_body(monkeypatch):
+    original = _guard(b'{"amount": 10}')
+    reused = _guard(b'{"amount": 99}')
+    reused.key, reused.user_id = original.key, original.user_id
+    stored = {original.redis_key: json.dumps({"s": DONE, "f": original.fingerprint, "c": 201, "b": {}})}
+    monkeypatch.setattr(idempotency, "get_redis", lambda: _FakeRedis(stored))
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(IdempotencyStore().acquire(reused))
+    assert exc.value.status_code == 422
+
+
+def test_acquire_fails_closed_without_redis(monkeypatch):
+    monkeypatch.setattr(idempotency, "get_redis", lambda: _FakeRedis(fail=True))
+    guard = _guard()
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(IdempotencyStore().acquire(guard))
+    assert exc.value.status_code == 503
+    assert not guard.locked
@@ -0,0 +1,104 @@
+import re
+from datetime import date, datetime, timezone
+from backend.app.core.config import settings
+from backend.app.transaction.models import Transaction, _create_initial_partitions
+from backend.app.transaction.partitioning import (
+    DEFAULT_PARTITION,
+    DEFAULT_PARTITION_SQL,
+    HEAP_TABLE,
+    conversion_statements,
+    create_partition_sql,
+    initial_partition_statements,
+    months_between,
+    move_default_rows_statements,
+    partition_bounds,
+    partition_month,
+    partition_name,
+)
+
+# The name filter used by LIST_PARTITIONS_SQL and ARCHIVABLE_PARTITIONS_SQL.
+PARTITION_NAME = re.compile(r"^transaction_y[0-9]{4}m[0-9]{2}$")
+
+
+def test_partition_name_round_trip():
+    for month in (date(2024, 1, 1), date(2024, 12, 1), date(1999, 7, 1)):
+        name = partition_name(month)
+        assert PARTITION_NAME.match(name)
+        assert partition_month(name) == month
+    assert partition_name(date(2024, 3, 1)) == "transaction_y2024m03"
+
+
+def test_partition_bounds_cover_one_month():
+    assert partition_bounds(date(2024, 12, 17)) == (
+        datetime(2024, 12, 1, tzinfo=timezone.utc),
+        datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_months_between_is_inclusive():
+    assert months_between(date(2023, 11, 20), date(2024, 2, 3)) == [
+        date(2023, 11, 1), date(2023, 12, 1), date(2024, 1, 1), date(2024, 2, 1),
+    ]
+    assert months_between(date(2024, 2, 1), date(2024, 1, 31)) == []
+
+
+def test_create_partition_sql():
+    assert create_partition_sql(date(2024, 2, 10)) == (
+        'CREATE TABLE IF NOT EXISTS transaction_y2024m02 PARTITION OF "transaction" '
+        "FOR VALUES FROM ('2024-02-01T00:00:00+00:00') TO ('2024-03-01T00:00:00+00:00')"
+    )
+
+
+def test_initial_partitions_cover_current_month_and_months_ahead():
+    statements = initial_partition_statements(date(2024, 11, 15), months_ahead=3)
+    assert statements == [
+        create_partition_sql(month)
+        for month in (date(2024, 11, 1), date(2024, 12, 1), date(2025, 1, 1), date(2025, 2, 1))
+    ]
+
+
+def test_move_default_rows_statements():
+    statements = move_default_rows_statements(date(2024, 5, 9))
+    in_month = "created_at >= '2024-05-01T00:00:00+00:00' AND created_at < '2024-06-01T00:00:00+00:00'"
+
+    assert statements == [
+        f'ALTER TABLE "transaction" DETACH PARTITION {DEFAULT_PARTITION}',
+        'CREATE TABLE transaction_y2024m05 (LIKE "transaction" INCLUDING DEFAULTS)',
+        f"INSERT INTO transaction_y2024m05 SELECT * FROM {DEFAULT_PARTITION} WHERE {in_month}",
+        f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_month}",
+        'ALTER TABLE "transaction" ATTACH PARTITION transaction_y2024m05 '
+        "FOR VALUES FROM ('2024-05-01T00:00:00+00:00') TO ('2024-06-01T00:00:00+00:00')",
+        f'ALTER TABLE "transaction" ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT',
+    ]
+
+
+def test_conversion_statements_order():
+    statements = conversion_statements(Transaction.__table__, date(2023, 12, 1), date(2024, 2, 1))
+
+    def position(fragment: str) -> int:
+        return next(i for i, statement in enumerate(statements) if fragment in statement)
+
+    assert position(f"RENAME TO {HEAP_TABLE}") < position("PARTITION BY RANGE (created_at)")
+    assert position("ADD PRIMARY KEY (id, created_at)") < position(DEFAULT_PARTITION_SQL)
+    assert position("transaction_y2024m02") < position(f'INSERT INTO "transaction" SELECT * FROM {HEAP_TABLE}')
+    assert position("CREATE INDEX ix_transaction_pending_reference") < position(DEFAULT_PARTITION_SQL)
+    assert "REFERENCES \"bankaccount\" (id)" in statements[position("ADD FOREIGN KEY (sender_account_id)")]
+    assert statements[-1] == f"DROP TABLE {HEAP_TABLE}"
+    assert sum("PARTITION OF" in statement and "FOR VALUES" in statement for statement in statements) == 3
+
+
+def test_table_creation_adds_current_and_upcoming_partitions():
+    class RecordingConnection:
+        def __init__(self):
+            self.statements = []
+
+        def execute(self, statement):
+            self.statements.append(str(statement))
+
+    connection = RecordingConnection()
+    _create_initial_partitions(Transaction.__table__, connection)
+
+    today = datetime.now(timezone.utc).date()
+    assert connection.statements == initial_partition_statements(today, settings.TRANSACTION_PARTITION_MONTHS_AHEAD)
+    assert len(connection.statements) == settings.TRANSACTION_PARTITION_MONTHS_AHEAD + 1
+    assert partition_name(today) in connection.statements[0]
@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi import HTTPException
+from backend.app.api.services.profile import decode_profile_cursor, encode_profile_cursor
+
+
+@pytest.mark.parametrize(
+    "created_at",
+    [
+        datetime(2024, 2, 29, 23, 59, 59, 999999, tzinfo=timezone.utc),
+        datetime(1970, 1, 1, tzinfo=timezone.utc),
+        datetime(2025, 6, 1, 12, 0, tzinfo=timezone(timedelta(hours=-5))),
+    ],
+)
+def test_profile_cursor_round_trip(created_at):
+    user_id = uuid.uuid4()
+    cursor = encode_profile_cursor(created_at, user_id)
+
+    assert ":" in cursor and cursor.split(":", 1)[0].isdigit()
+    assert decode_profile_cursor(cursor) == (created_at, user_id)
+
+
+def test_profile_cursor_distinguishes_microseconds():
+    user_id = uuid.uuid4()
+    earlier = datetime(2024, 1, 1, 0, 0, 0, 1, tzinfo=timezone.utc)
+    later = earlier + timedelta(microseconds=1)
+
+    assert encode_profile_cursor(earlier, user_id) != encode_profile_cursor(later, user_id)
+    assert decode_profile_cursor(encode_profile_cursor(later, user_id))[0] == later
+
+
+@pytest.mark.parametrize("cursor", ["", "123", "1.5:" + str(uuid.uuid4()), "123:nope"])
+def test_decode_profile_cursor_rejects_malformed_cursor(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_profile_cursor(cursor)
+    assert exc.value.status_code == 400
@@ -0,0 +1,85 @@
+import math
+import uuid
+from datetime import datetime, timedelta, timezone
+import pandas as pd
+import pytest
+from backend.app.core.ai.batch_scoring import compute_features
+from backend.app.core.ai.config import ai_settings
+from backend.app.core.ai.risk_engine import AccountAggregates, combine_features, score_features
+
+BASE = datetime(2024, 3, 4, 8, 0, tzinfo=timezone.utc)
+
+# (account, minutes after BASE, amount)
+TRANSFERS = [
+    ("a", 0, 120.0),
+    ("a", 3, 120.0),
+    ("a", 7, 500.0),
+    ("a", 45, 80.25),
+    ("a", 60 * 14, 2000.0),
+    ("a", 60 * 30, 95.0),
+    ("a", 60 * 24 * 5 + 1, 9000.0),
+    ("b", 2, 300.0),
+    ("b", 4, 300.0),
+    ("b", 60 * 23, 15000.0),
+]
+
+
+def _online_aggregates(history: list[tuple[datetime, float]], at: datetime, amount: float) -> AccountAggregates:
+    """What the Redis script hands score_features: a decayed Welford fold plus trailing windows."""
+    decay = int(ai_settings.ANALYSIS_WINDOW_DAYS) * 24 * 60 * 60
+    n = mean = s = 0.0
+    last = None
+    for when, value in history:
+        if last is not None:
+            w = math.exp(-(when - last).total_seconds() / decay)
+            n, s = n * w, s * w
+        n += 1
+        delta = value - mean
+        mean += delta / n
+        s += delta * (value - mean)
+        last = when
+    if last is not None:
+        w = math.exp(-(at - last).total_seconds() / decay)
+        n, s = n * w, s * w
+
+    def trailing(window: timedelta) -> list[tuple[datetime, float]]:
+        return [(when, value) for when, value in history if at - window <= when < at]
+
+    velocity_window = trailing(timedelta(hours=ai_settings.VELOCITY_WINDOW_HOURS))
+    return AccountAggregates(
+        history_weight=n,
+        mean_amount=mean,
+        amount_variance=s / n if n else 0.0,
+        recent_count=len(trailing(timedelta(minutes=ai_settings.FREQUENCY_WINDOW_MINUTES))),
+        rapid_count=len(trailing(timedelta(minutes=ai_settings.RAPID_TRANSFER_WINDOW_MINUTES))),
+        velocity_amount=sum(value for _, value in velocity_window),
+        repeated_amount=any(round(value, 2) == round(amount, 2) for _, value in velocity_window),
+    )
+
+
+def test_compute_features_matches_online_scoring():
+    frame = pd.DataFrame(
+        {
+            "id": [uuid.uuid4() for _ in TRANSFERS],
+            "account_id": [account for account, _, _ in TRANSFERS],
+            "created_at": pd.to_datetime([BASE + timedelta(minutes=minutes) for _, minutes, _ in TRANSFERS]),
+            "amount": [amount for _, _, amount in TRANSFERS],
+        }
+    )
+    scored = compute_features(frame)
+
+    history: dict[str, list[tuple[datetime, float]]] = {}
+    for position, (account, minutes, amount) in enumerate(TRANSFERS):
+        at = BASE + timedelta(minutes=minutes)
+        aggregates = _online_aggregates(history.setdefault(account, []), at, amount)
+        expected = score_features(amount, at, aggregates)
+        row = scored.iloc[position]
+
+        for name, value in expected.items():
+            assert row[name] == pytest.approx(value, abs=1e-4), (position, name)
+        assert row["risk_score"] == pytest.approx(combine_features(expected), abs=1e-4)
+        assert row["recent_transfers"] == aggregates.recent_count
+        assert row["rapid_transfers"] == aggregates.rapid_count
+        assert row["velocity_amount_window"] == pytest.approx(aggregates.velocity_amount, abs=0.01)
+        assert row["transaction_id"] == frame["id"][position]
+        history[account].append((at, amount))
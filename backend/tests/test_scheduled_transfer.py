@@ -0,0 +1,90 @@
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from backend.app.api.services.scheduled_transfer import _advance_schedule, scheduled_reference
+from backend.app.core.config import settings
+from backend.app.core.tasks import scheduled_transfer as scheduled_transfer_tasks
+from backend.app.scheduled_transfer.enums import ScheduledTransferStatusEnum, TransferFrequencyEnum
+from backend.app.scheduled_transfer.models import ScheduledTransfer
+from backend.app.scheduled_transfer.utils import next_occurrence
+
+START = datetime(2024, 1, 31, 9, 0, tzinfo=timezone.utc)
+
+
+def _schedule(frequency: TransferFrequencyEnum = TransferFrequencyEnum.DAILY) -> ScheduledTransfer:
+    return ScheduledTransfer(
+        user_id=uuid.uuid4(),
+        sender_account_id=uuid.uuid4(),
+        receiver_account_number="1234567890123456",
+        amount=Decimal("50.00"),
+        description="Rent",
+        frequency=frequency,
+        start_at=START,
+        next_run_at=START,
+        claimed_until=START,
+    )
+
+
+def test_next_occurrence_once():
+    assert next_occurrence(TransferFrequencyEnum.ONCE, START, 0) == START
+    assert next_occurrence(TransferFrequencyEnum.ONCE, START, 1) is None
+
+
+def test_next_occurrence_daily_and_weekly():
+    assert next_occurrence(TransferFrequencyEnum.DAILY, START, 3) == datetime(2024, 2, 3, 9, 0, tzinfo=timezone.utc)
+    assert next_occurrence(TransferFrequencyEnum.WEEKLY, START, 2) == datetime(2024, 2, 14, 9, 0, tzinfo=timezone.utc)
+
+
+def test_next_occurrence_monthly_keeps_day_of_month():
+    runs = [next_occurrence(TransferFrequencyEnum.MONTHLY, START, n).date().isoformat() for n in range(4)]
+    assert runs == ["2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30"]
+
+
+def test_scheduled_reference_is_stable_per_occurrence():
+    schedule_id = uuid.uuid4()
+    assert scheduled_reference(schedule_id, START) == scheduled_reference(schedule_id, START)
+    assert scheduled_reference(schedule_id, START) != scheduled_reference(schedule_id, next_occurrence(
+        TransferFrequencyEnum.DAILY, START, 1
+    ))
+
+
+def test_advance_schedule_skips_missed_occurrences():
+    schedule = _schedule()
+    _advance_schedule(schedule, datetime(2024, 2, 3, 10, 0, tzinfo=timezone.utc), transaction_id=uuid.uuid4())
+
+    assert schedule.claimed_until is None
+    assert schedule.runs_count == 1
+    assert schedule.next_run_at == datetime(2024, 2, 4, 9, 0, tzinfo=timezone.utc)
+
+
+def test_advance_schedule_pauses_after_repeated_failures():
+    schedule = _schedule()
+    now = START
+    for _ in range(settings.SCHEDULED_TRANSFER_MAX_FAILURES):
+        _advance_schedule(schedule, now, error="Insufficient balance")
+        now = schedule.next_run_at
+
+    assert schedule.status == ScheduledTransferStatusEnum.PAUSED
+    assert schedule.consecutive_failures == settings.SCHEDULED_TRANSFER_MAX_FAILURES
+    assert schedule.claimed_until is None
+
+
+def test_run_scheduled_transfer_records_error_once_retries_are_exhausted(monkeypatch):
+    recorded = []
+
+    async def failing_execute(schedule_id, due_at):
+        raise RuntimeError("connection reset")
+
+    async def record_error(schedule_id, due_at, error):
+        recorded.append((schedule_id, due_at, error))
+        return "failed"
+
+    monkeypatch.setattr(scheduled_transfer_tasks, "_execute", failing_execute)
+    monkeypatch.setattr(scheduled_transfer_tasks, "_record_error", record_error)
+    task = scheduled_transfer_tasks.run_scheduled_transfer
+    kwargs = {"schedule_id": str(uuid.uuid4()), "due_at": START.isoformat()}
+
+    result = task.apply(kwargs=kwargs, retries=task.max_retries)
+
+    assert result.get() == "failed"
+    assert recorded == [(kwargs["schedule_id"], kwargs["due_at"], "Transfer could not be processed")]
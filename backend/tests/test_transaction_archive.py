@@ -0,0 +1,173 @@
+import asyncio
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from backend.app.api.services import transaction as transaction_service
+from backend.app.core.ai.enums import AIReviewStatusEnum
+from backend.app.transaction.archive import ARCHIVE_COLUMNS, TransactionArchive, _to_archive_row, _to_transaction
+from backend.app.transaction.enums import TransactionCategoryEnum, TransactionStatusEnum, TransactionTypeEnum
+from backend.app.transaction.models import TransactionReference
+
+
+def _archived_row(account_id: uuid.UUID, created_at: datetime, **overrides) -> dict:
+    row = {
+        "id": uuid.uuid4(),
+        "reference": f"TRX-{uuid.uuid4().hex[:12].upper()}",
+        "amount": Decimal("125.50"),
+        "description": "Rent",
+        "transaction_type": "TRANSFER",
+        "transaction_category": "DEBIT",
+        "status": "COMPLETED",
+        "balance_before": Decimal("1000.00"),
+        "balance_after": Decimal("874.50"),
+        "transaction_metadata": {"counterparty_name": "Jane Doe"},
+        "failed_reason": None,
+        "ai_review_status": None,
+        "sender_account_id": account_id,
+        "receiver_account_id": uuid.uuid4(),
+        "sender_id": uuid.uuid4(),
+        "receiver_id": uuid.uuid4(),
+        "processed_by": None,
+        "created_at": created_at,
+        "completed_at": created_at,
+        "updated_at": created_at,
+    }
+    row.update(overrides)
+    return row
+
+
+def test_archive_row_conversion_round_trip():
+    row = _archived_row(
+        uuid.uuid4(),
+        datetime(2023, 5, 2, 14, 30, tzinfo=timezone.utc),
+        ai_review_status="FLAGGED",
+        processed_by=uuid.uuid4(),
+    )
+    archived = _to_archive_row(row)
+
+    assert archived["id"] == str(row["id"])
+    assert archived["transaction_metadata"] == '{"counterparty_name": "Jane Doe"}'
+    assert row["transaction_metadata"] == {"counterparty_name": "Jane Doe"}
+
+    transaction = _to_transaction(dict(archived))
+    assert transaction.id == row["id"]
+    assert transaction.processed_by == row["processed_by"]
+    assert transaction.transaction_type == TransactionTypeEnum.TRANSFER
+    assert transaction.transaction_category == TransactionCategoryEnum.DEBIT
+    assert transaction.status == TransactionStatusEnum.COMPLETED
+    assert transaction.ai_review_status == AIReviewStatusEnum.FLAGGED
+    assert transaction.transaction_metadata == row["transaction_metadata"]
+
+
+def test_archive_file_round_trip(tmp_path):
+    archive = TransactionArchive(str(tmp_path))
+    row = _archived_row(
+        uuid.uuid4(),
+        datetime(2023, 5, 2, 14, 30, 15, 123456, tzinfo=timezone.utc),
+        transaction_metadata='{"note": "already serialized"}',
+        receiver_account_id=None,
+        receiver_id=None,
+    )
+    with archive.open_month(date(2023, 5, 1)) as writer:
+        writer.write([row])
+
+    transaction = archive.read_reference(archive.relative_path(date(2023, 5, 1)), row["reference"])
+    for column in ARCHIVE_COLUMNS:
+        value = getattr(transaction, column)
+        if column == "transaction_metadata":
+            assert value == {"note": "already serialized"}
+        elif column in ("transaction_type", "transaction_category", "status"):
+            assert value.name == row[column], column
+        else:
+            assert value == row[column], column
+    assert archive.read_reference(archive.relative_path(date(2023, 5, 1)), "TRX-MISSING") is None
+
+
+def test_open_month_discards_partial_file(tmp_path):
+    archive = TransactionArchive(str(tmp_path))
+    month = date(2023, 6, 1)
+    with pytest.raises(RuntimeError):
+        with archive.open_month(month) as writer:
+            writer.write([_archived_row(uuid.uuid4(), datetime(2023, 6, 1, tzinfo=timezone.utc))])
+            raise RuntimeError("export interrupted")
+
+    assert not archive.month_path(month).exists()
+    assert not archive.month_path(month).with_suffix(".tmp").exists()
+
+
+def test_read_accounts_accepts_naive_range(tmp_path):
+    archive = TransactionArchive(str(tmp_path))
+    account_id = uuid.uuid4()
+    inside = _archived_row(account_id, datetime(2023, 3, 31, 23, 30, tzinfo=timezone.utc))
+    outside = _archived_row(account_id, datetime(2023, 3, 1, 8, 0, tzinfo=timezone.utc))
+    with archive.open_month(date(2023, 3, 1)) as writer:
+        writer.write([outside, inside])
+
+    transactions = archive.read_accounts(
+        [account_id],
+        datetime(2023, 3, 15),
+        datetime(2023, 3, 31, 23, 59, 59),
+        TransactionStatusEnum.COMPLETED,
+    )
+
+    assert [txn.id for txn in transactions] == [inside["id"]]
+
+
+def test_read_accounts_picks_months_in_utc(tmp_path):
+    archive = TransactionArchive(str(tmp_path))
+    account_id = uuid.uuid4()
+    row = _archived_row(account_id, datetime(2023, 3, 31, 22, 0, tzinfo=timezone.utc))
+    with archive.open_month(date(2023, 3, 1)) as writer:
+        writer.write([row])
+
+    # 1 April 01:00 at +02:00 is still 31 March in UTC.
+    plus_two = timezone(timedelta(hours=2))
+    transactions = archive.read_accounts(
+        [account_id],
+        datetime(2023, 4, 1, 0, 0, tzinfo=plus_two),
+        datetime(2023, 4, 1, 1, 0, tzinfo=plus_two),
+    )
+
+    assert [txn.id for txn in transactions] == [row["id"]]
+
+
+
+class _ReferenceIndexSession:
+    def __init__(self, entry: TransactionReference):
+        self._entry = entry
+
+    async def get(self, model, key):
+        assert model is TransactionReference
+        return self._entry if key == self._entry.reference else None
+
+    async def exec(self, statement):
+        raise AssertionError("archived references must not query the transaction table")
+
+
+def test_find_transaction_by_reference_reads_archived_row(tmp_path, monkeypatch):
+    archive = TransactionArchive(str(tmp_path))
+    row = _archived_row(uuid.uuid4(), datetime(2022, 7, 9, 12, 0, tzinfo=timezone.utc))
+    with archive.open_month(date(2022, 7, 1)) as writer:
+        writer.write([_archived_row(uuid.uuid4(), row["created_at"]), row])
+    monkeypatch.setattr(transaction_service, "transaction_archive", archive)
+
+    session = _ReferenceIndexSession(
+        TransactionReference(
+            reference=row["reference"],
+            transaction_id=row["id"],
+            created_at=row["created_at"],
+            archived_in=archive.relative_path(date(2022, 7, 1)),
+        )
+    )
+    found = asyncio.run(
+        transaction_service.find_transaction_by_reference(reference=row["reference"], session=session)
+    )
+    missing = asyncio.run(
+        transaction_service.find_transaction_by_reference(reference="TRX-UNKNOWN", session=session)
+    )
+
+    assert found.id == row["id"]
+    assert found.status == TransactionStatusEnum.COMPLETED
+    assert found.transaction_metadata == row["transaction_metadata"]
+    assert missing is None
@@ -0,0 +1,110 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+import pytest
+from fastapi import HTTPException
+from backend.app.bank_account.enums import AccountTypeEnum
+from backend.app.core.velocity import engine as velocity_module
+from backend.app.core.velocity.config import ACCOUNT_VELOCITY_LIMITS
+from backend.app.core.velocity.engine import VelocityLimitEngine, VelocityLimitExceededError
+
+NOW = datetime(2024, 5, 6, 10, 17, 30, tzinfo=timezone.utc)
+
+
+class _RecordingScript:
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    async def __call__(self, *, keys, args):
+        self.calls.append((keys, args))
+        return self.result
+
+
+class _RecordingPipeline:
+    def __init__(self):
+        self.commands = []
+
+    def hincrbyfloat(self, key, field, amount):
+        self.commands.append(("hincrbyfloat", key, field, amount))
+
+    def hincrby(self, key, field, amount):
+        self.commands.append(("hincrby", key, field, amount))
+
+    async def execute(self):
+        return [None] * len(self.commands)
+
+
+def _engine(result) -> tuple[VelocityLimitEngine, _RecordingScript]:
+    engine = VelocityLimitEngine()
+    engine._script = _RecordingScript(result)
+    return engine, engine._script
+
+
+def test_reserve_books_every_account_window():
+    account_id = uuid.uuid4()
+    engine, script = _engine([0, "250.00", "1250.00"])
+
+    reservation = asyncio.run(
+        engine.reserve(amount=250, account_id=account_id, account_type=AccountTypeEnum.Current, now=NOW)
+    )
+
+    keys, args = script.calls[0]
+    hourly, daily = ACCOUNT_VELOCITY_LIMITS[AccountTypeEnum.Current]
+    assert keys == [f"velocity:account:{account_id}:hourly", f"velocity:account:{account_id}:daily"]
+    assert args == [
+        "250.00",
+        int(NOW.timestamp()) // 60, 60, hourly.max_amount, hourly.max_count, 3660,
+        int(NOW.timestamp()) // 900, 96, daily.max_amount, daily.max_count, 87300,
+    ]
+    assert reservation.totals == {"account:hourly": 250.0, "account:daily": 1250.0}
+
+
+def test_reserve_names_the_rejecting_window():
+    engine, _ = _engine([2, "49900.00", 3])
+
+    with pytest.raises(VelocityLimitExceededError) as exc:
+        asyncio.run(
+            engine.reserve(amount=500, account_id=uuid.uuid4(), account_type=AccountTypeEnum.Current, now=NOW)
+        )
+    assert exc.value.status_code == 400
+    assert exc.value.detail["message"] == "Account daily transaction limit exceeded"
+
+
+def test_reserve_fails_closed_when_redis_is_unavailable():
+    engine = VelocityLimitEngine()
+
+    async def unavailable(*, keys, args):
+        raise ConnectionError("redis is down")
+
+    engine._script = unavailable
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(
+            engine.reserve(amount=10, account_id=uuid.uuid4(), account_type=AccountTypeEnum.Savings, now=NOW)
+        )
+    assert exc.value.status_code == 503
+
+
+def test_release_undoes_the_booked_buckets(monkeypatch):
+    engine, _ = _engine([0, "75.50", "75.50"])
+    reservation = asyncio.run(
+        engine.reserve(amount=75.5, account_id=uuid.uuid4(), account_type=AccountTypeEnum.Savings, now=NOW)
+    )
+    pipeline = _RecordingPipeline()
+
+    class _Redis:
+        def pipeline(self, transaction):
+            assert transaction
+            return pipeline
+
+    monkeypatch.setattr(velocity_module, "get_redis", lambda: _Redis())
+    asyncio.run(engine.release(reservation))
+
+    expected = []
+    for window in reservation.windows:
+        expected += [
+            ("hincrbyfloat", window.key, f"a:{window.bucket}", -75.5),
+            ("hincrby", window.key, f"c:{window.bucket}", -1),
+        ]
+    assert pipeline.commands == expected
+    asyncio.run(engine.release(None))